@@ -3,52 +3,81 @@ import asyncio
 import logging
 import signal
 import sys
-from typing import Optional
+import time
+from typing import TYPE_CHECKING, Dict, Optional
+
+try:
+    import uvloop
+except ImportError:  # Windows 등 uvloop 미지원 환경에서는 기본 이벤트 루프 사용
+    uvloop = None
 
 from src.config import Config
 from src.logger import setup_logger
-from src.exchange.binance_client import BinanceClient
-from src.telegram_bot.bot import TelegramBot
-from src.trading.engine import TradingEngine
-from src.strategies.strategy_manager import StrategyManager
-from src.recommendation.strategy_recommender import StrategyRecommender
-from src.monitoring.health_checker import HealthChecker
-from src.monitoring.metrics_collector import MetricsCollector
 from src.utils.error_handler import ErrorHandler
 from src.exceptions import ComponentInitializationException, SystemException
 
+if TYPE_CHECKING:
+    # 무거운 모듈(ccxt, pandas 등)은 initialize()에서 지연 import
+    from src.exchange.binance_client import BinanceClient
+    from src.telegram_bot.bot import TelegramBot
+    from src.trading.engine import TradingEngine
+    from src.strategies.strategy_manager import StrategyManager
+    from src.recommendation.strategy_recommender import StrategyRecommender
+    from src.monitoring.health_checker import HealthChecker
+    from src.monitoring.metrics_collector import MetricsCollector
+
+
+class _ShutdownRequested(Exception):
+    """종료 신호에 의해 컴포넌트 태스크를 정리할 때 사용"""
+
 
 class AutoCoinApp:
     def __init__(self):
         self.config = Config()
         self.logger = setup_logger('AutoCoin')
-        self.exchange: Optional[BinanceClient] = None
-        self.bot: Optional[TelegramBot] = None
-        self.strategy_manager: Optional[StrategyManager] = None
-        self.recommender: Optional[StrategyRecommender] = None
-        self.engine: Optional[TradingEngine] = None
-        self.health_checker: Optional[HealthChecker] = None
-        self.metrics_collector: Optional[MetricsCollector] = None
+        self.exchange: Optional['BinanceClient'] = None
+        self.bot: Optional['TelegramBot'] = None
+        self.strategy_manager: Optional['StrategyManager'] = None
+        self.recommender: Optional['StrategyRecommender'] = None
+        self.engine: Optional['TradingEngine'] = None
+        self.health_checker: Optional['HealthChecker'] = None
+        self.metrics_collector: Optional['MetricsCollector'] = None
         self.error_handler: Optional[ErrorHandler] = None
+        self._http_session = None
         self.shutdown_event = asyncio.Event()
         
+        # 알림 디바운스 버퍼 (컴포넌트 -> 최초 감지 시각)
+        self.alert_debounce = 5
+        self._alert_buffer: Dict[str, float] = {}
+        self._alert_summary = ""
+        self._last_alert_key: Optional[frozenset] = None
+        self._alert_flush_task: Optional[asyncio.Task] = None
+        
     async def initialize(self):
         """모든 컴포넌트 초기화"""
         try:
             self.logger.info("AutoCoin 시스템 초기화 중...")
             
+            from src.exchange.binance_client import BinanceClient, create_http_session
+            from src.telegram_bot.bot import TelegramBot
+            from src.trading.engine import TradingEngine
+            from src.strategies.strategy_manager import StrategyManager
+            from src.recommendation.strategy_recommender import StrategyRecommender
+            from src.monitoring.health_checker import HealthChecker
+            from src.monitoring.metrics_collector import MetricsCollector
+            
             # 에러 핸들러 초기화
             self.error_handler = ErrorHandler(self.logger)
             
-            # Exchange 클라이언트 초기화
+            # Exchange 클라이언트 생성 (keep-alive 커넥션 풀 공유)
             try:
+                self._http_session = create_http_session()
                 self.exchange = BinanceClient(
                     api_key=self.config.binance_api_key,
                     api_secret=self.config.binance_api_secret,
-                    testnet=self.config.binance_testnet
+                    testnet=self.config.binance_testnet,
+                    session=self._http_session
                 )
-                await self.exchange.initialize()
-                self.logger.info("Exchange 클라이언트 초기화 완료")
             except Exception as e:
                 raise ComponentInitializationException("Exchange", str(e))
             
@@ -77,7 +106,7 @@ class AutoCoinApp:
             except Exception as e:
                 raise ComponentInitializationException("TradingEngine", str(e))
             
-            # Telegram Bot 초기화
+            # Telegram Bot 생성
             try:
                 self.bot = TelegramBot(
                     token=self.config.telegram_bot_token,
@@ -87,11 +116,21 @@ class AutoCoinApp:
                     strategy_manager=self.strategy_manager,
                     recommender=self.recommender
                 )
-                await self.bot.initialize()
-                self.logger.info("Telegram Bot 초기화 완료")
             except Exception as e:
                 raise ComponentInitializationException("TelegramBot", str(e))
             
+            # Exchange / Telegram 핸드셰이크는 서로 독립적이므로 동시에 수행
+            results = await asyncio.gather(
+                self._init_component("Exchange", self.exchange.initialize()),
+                self._init_component("TelegramBot", self.bot.initialize()),
+                return_exceptions=True
+            )
+            for result in results:
+                if isinstance(result, Exception):
+                    raise result
+            self.logger.info("Exchange 클라이언트 초기화 완료")
+            self.logger.info("Telegram Bot 초기화 완료")
+            
             # Trading Engine에 Bot 연결
             self.engine.set_notifier(self.bot)
             
@@ -107,13 +146,22 @@ class AutoCoinApp:
             self.logger.info("✅ AutoCoin 시스템 초기화 완료")
             
         except ComponentInitializationException as e:
-            self.logger.error(f"컴포넌트 초기화 실패: {e}")
+            self.logger.error("컴포넌트 초기화 실패: %s", e, extra={"component": e.details.get("component")})
             await self.error_handler.handle_error(e)
             raise
         except Exception as e:
-            self.logger.error(f"초기화 중 예상치 못한 오류: {e}")
+            self.logger.error("초기화 중 예상치 못한 오류: %s", e)
             raise SystemException(f"System initialization failed: {str(e)}")
             
+    async def _init_component(self, name: str, coro):
+        """컴포넌트 초기화 코루틴 실행 (실패 시 ComponentInitializationException으로 변환)"""
+        try:
+            return await coro
+        except ComponentInitializationException:
+            raise
+        except Exception as e:
+            raise ComponentInitializationException(name, str(e))
+            
     async def start(self):
         """애플리케이션 시작"""
         try:
@@ -122,18 +170,14 @@ class AutoCoinApp:
             # 시그널 핸들러 설정
             self.setup_signal_handlers()
             
-            # 컴포넌트들을 비동기로 실행
-            tasks = [
-                asyncio.create_task(self.bot.start()),
-                asyncio.create_task(self.engine.monitor_loop()),
-                asyncio.create_task(self.health_check_loop()),
-                asyncio.create_task(self.shutdown_event.wait())
-            ]
-            
             self.logger.info("🚀 AutoCoin 시스템 시작됨")
             
-            # 모든 태스크가 완료될 때까지 대기
-            await asyncio.gather(*tasks, return_exceptions=True)
+            # 컴포넌트들을 비동기로 실행 (종료 신호 또는 첫 실패 시 나머지 취소)
+            await self._run_components(
+                self.bot.start(),
+                self.engine.monitor_loop(),
+                self.health_check_loop()
+            )
             
         except KeyboardInterrupt:
             self.logger.info("키보드 인터럽트 감지")
@@ -142,10 +186,49 @@ class AutoCoinApp:
         finally:
             await self.shutdown()
             
+    async def _run_components(self, *coros):
+        """컴포넌트 태스크 실행 - 종료 신호가 오거나 하나라도 실패하면 나머지를 취소"""
+        if hasattr(asyncio, 'TaskGroup'):
+            try:
+                async with asyncio.TaskGroup() as tg:
+                    for coro in coros:
+                        tg.create_task(coro)
+                    tg.create_task(self._stop_on_shutdown())
+            except BaseExceptionGroup as eg:
+                errors = [e for e in eg.exceptions if not isinstance(e, _ShutdownRequested)]
+                for error in errors[1:]:
+                    self.logger.error(f"컴포넌트 오류: {error!r}")
+                if errors:
+                    raise errors[0]
+            return
+            
+        # Python 3.10 이하: FIRST_COMPLETED 대기 후 나머지 취소
+        tasks = [asyncio.ensure_future(coro) for coro in coros]
+        tasks.append(asyncio.ensure_future(self.shutdown_event.wait()))
+        try:
+            done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            
+        for task in done:
+            if not task.cancelled() and task.exception() is not None:
+                raise task.exception()
+                
+    async def _stop_on_shutdown(self):
+        """종료 신호를 받으면 TaskGroup 전체를 취소시킴"""
+        await self.shutdown_event.wait()
+        raise _ShutdownRequested()
+        
     async def shutdown(self):
         """애플리케이션 종료"""
         self.logger.info("AutoCoin 시스템 종료 중...")
         
+        # 대기 중인 알림 전송 취소
+        if self._alert_flush_task and not self._alert_flush_task.done():
+            self._alert_flush_task.cancel()
+            
         # Trading Engine 종료
         if self.engine and self.engine.is_running:
             await self.engine.stop()
@@ -154,48 +237,115 @@ class AutoCoinApp:
         if self.bot:
             await self.bot.stop()
             
+        # 버퍼에 남은 메트릭 저장
+        if self.metrics_collector:
+            await self.metrics_collector.close()
+            
         # Exchange 연결 종료
         if self.exchange:
             await self.exchange.close()
             
+        # 공유 HTTP 세션은 모든 클라이언트 종료 후 닫음
+        if self._http_session:
+            self._http_session.close()
+            
         self.logger.info("✅ AutoCoin 시스템 종료 완료")
         
     async def health_check_loop(self):
         """주기적인 상태 체크"""
+        # 루프 내 반복 속성 조회를 피하기 위해 로거 메서드를 미리 바인딩
+        log = self.logger
+        log_error = log.error
+        log_warning = log.warning
+        
         while not self.shutdown_event.is_set():
             try:
-                # 헬스 체크 실행
-                if self.health_checker:
-                    health_results = await self.health_checker.check_all()
+                # 헬스 체크와 메트릭 수집은 독립적이므로 동시에 실행
+                health_results, metrics_result = await asyncio.gather(
+                    self.health_checker.check_all() if self.health_checker else asyncio.sleep(0, {}),
+                    self.metrics_collector.collect_metrics() if self.metrics_collector else asyncio.sleep(0),
+                    return_exceptions=True
+                )
+                
+                if isinstance(metrics_result, Exception):
+                    log_error("메트릭 수집 오류: %s", metrics_result)
+                    await self.error_handler.handle_error(metrics_result, {"context": "collect_metrics"})
                     
-                    # 불건전한 컴포넌트 확인
-                    unhealthy = [name for name, status in health_results.items() if not status.is_healthy]
-                    if unhealthy:
-                        self.logger.warning(f"불건전한 컴포넌트: {', '.join(unhealthy)}")
-                        
-                        # Telegram으로 알림
-                        if self.bot and 'telegram' not in unhealthy:
-                            summary = self.health_checker.get_summary(health_results)
-                            await self.bot.send_notification(f"⚠️ 시스템 경고\n\n{summary}")
-                            
-                # 메트릭 수집
-                if self.metrics_collector:
-                    await self.metrics_collector.collect_metrics()
+                if isinstance(health_results, Exception):
+                    raise health_results
                     
+                # 불건전한 컴포넌트 확인
+                unhealthy = [name for name, status in health_results.items() if not status.is_healthy]
+                if unhealthy:
+                    if log.isEnabledFor(logging.WARNING):
+                        log_warning("불건전한 컴포넌트: %s", ', '.join(unhealthy))
+                    
+                    # Telegram으로 알림 (디바운스 후 한 번에 전송)
+                    if self.bot and 'telegram' not in unhealthy:
+                        self._queue_alert(unhealthy, self.health_checker.get_summary(health_results))
+                else:
+                    # 복구되면 다음 장애 시 다시 알림
+                    self._last_alert_key = None
+                        
             except Exception as e:
-                self.logger.error(f"Health check 오류: {e}")
+                log_error("Health check 오류: %s", e)
                 await self.error_handler.handle_error(e, {"context": "health_check_loop"})
                 
-            await asyncio.sleep(300)  # 5분마다 체크
+            await self._wait_next_health_check(300)  # 5분마다 체크
+            
+    async def _wait_next_health_check(self, interval: float):
+        """다음 헬스 체크까지 대기 (종료 신호가 오면 즉시 깨어남)"""
+        try:
+            await asyncio.wait_for(self.shutdown_event.wait(), timeout=interval)
+        except asyncio.TimeoutError:
+            pass
+            
+    def _queue_alert(self, unhealthy, summary: str):
+        """알림을 버퍼에 쌓고 디바운스 윈도우가 끝나면 한 번에 전송"""
+        if not self._alert_buffer and frozenset(unhealthy) == self._last_alert_key:
+            return
+            
+        now = time.monotonic()
+        for name in unhealthy:
+            self._alert_buffer.setdefault(name, now)
+        self._alert_summary = summary
+        
+        if self._alert_flush_task is None or self._alert_flush_task.done():
+            self._alert_flush_task = asyncio.create_task(self._flush_alerts())
+            
+    async def _flush_alerts(self):
+        """버퍼에 쌓인 알림을 하나의 메시지로 전송"""
+        await asyncio.sleep(self.alert_debounce)
+        
+        key = frozenset(self._alert_buffer)
+        summary = self._alert_summary
+        self._alert_buffer.clear()
+        
+        # 직전에 보낸 것과 같은 불건전 컴포넌트 집합이면 중복 전송 생략
+        if not key or key == self._last_alert_key:
+            return
+        self._last_alert_key = key
+        
+        try:
+            await self.bot.send_notification(f"⚠️ 시스템 경고\n\n{summary}")
+        except Exception as e:
+            self.logger.error("알림 전송 실패: %s", e)
             
     def setup_signal_handlers(self):
-        """시그널 핸들러 설정"""
-        def signal_handler(signum, frame):
+        """시그널 핸들러 설정 (실행 중인 이벤트 루프 안에서 호출)"""
+        def signal_handler(signum, frame=None):
             self.logger.info(f"시그널 {signum} 수신")
-            asyncio.create_task(self.shutdown_event.set())
+            self.shutdown_event.set()
             
-        signal.signal(signal.SIGINT, signal_handler)
-        signal.signal(signal.SIGTERM, signal_handler)
+        if sys.platform == 'win32':
+            # Windows 이벤트 루프는 add_signal_handler를 지원하지 않음
+            signal.signal(signal.SIGINT, signal_handler)
+            signal.signal(signal.SIGTERM, signal_handler)
+            return
+            
+        loop = asyncio.get_running_loop()
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(signum, signal_handler, signum)
 
 
 async def main():
@@ -210,7 +360,10 @@ if __name__ == "__main__":
         print("Python 3.8 이상이 필요합니다.")
         sys.exit(1)
         
-    # 이벤트 루프 실행
+    # 이벤트 루프 실행 (가능하면 uvloop 사용)
+    if uvloop is not None:
+        uvloop.install()
+        
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
@@ -2,75 +2,74 @@
 """
 AutoCoin Main Application with Futures Trading Support
 """
+import argparse
 import asyncio
 import logging
 import signal
 import sys
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
+
+try:
+    import uvloop
+except ImportError:  # uvloop is unavailable on Windows; fall back to the stock loop
+    uvloop = None
 
 from src.futures_config import FuturesConfig
 from src.logger import setup_logger
-from src.exchange.binance_futures_client import BinanceFuturesClient
-from src.telegram_bot.futures_bot import AutoCoinFuturesBot
-from src.trading.futures_engine import FuturesTradingEngine
-from src.trading.futures_position_manager import FuturesPositionManager
-from src.monitoring.futures_monitor import FuturesMonitor
-from src.monitoring.health_checker import HealthChecker
-from src.monitoring.prometheus_metrics import PrometheusMetrics
 from src.utils.error_handler import ErrorHandler
-from src.utils.risk_manager import RiskManager
 from src.exceptions import ComponentInitializationException, SystemException
 
+if TYPE_CHECKING:
+    # Heavy modules (ccxt, pandas, prometheus_client) are imported lazily
+    # by the initializers that need them
+    from src.exchange.binance_futures_client import BinanceFuturesClient
+    from src.telegram_bot.futures_bot import AutoCoinFuturesBot
+    from src.trading.futures_engine import FuturesTradingEngine
+    from src.trading.futures_position_manager import FuturesPositionManager
+    from src.monitoring.futures_monitor import FuturesMonitor
+    from src.monitoring.health_checker import HealthChecker
+    from src.monitoring.prometheus_metrics import PrometheusMetrics
+    from src.utils.risk_manager import RiskManager
+
 
 class AutoCoinFuturesApp:
     """Main application class with futures trading support"""
     
-    def __init__(self):
-        self.config = FuturesConfig()
+    def __init__(self, config: Optional[FuturesConfig] = None):
+        self.config = config or FuturesConfig()
         self.logger = setup_logger('AutoCoinFutures')
         
         # Core components
-        self.futures_client: Optional[BinanceFuturesClient] = None
-        self.bot: Optional[AutoCoinFuturesBot] = None
-        self.engine: Optional[FuturesTradingEngine] = None
-        self.position_manager: Optional[FuturesPositionManager] = None
-        self.risk_manager: Optional[RiskManager] = None
+        self.futures_client: Optional['BinanceFuturesClient'] = None
+        self.bot: Optional['AutoCoinFuturesBot'] = None
+        self.engine: Optional['FuturesTradingEngine'] = None
+        self.position_manager: Optional['FuturesPositionManager'] = None
+        self.risk_manager: Optional['RiskManager'] = None
         
         # Monitoring components
-        self.futures_monitor: Optional[FuturesMonitor] = None
-        self.health_checker: Optional[HealthChecker] = None
-        self.prometheus_metrics: Optional[PrometheusMetrics] = None
+        self.futures_monitor: Optional['FuturesMonitor'] = None
+        self.health_checker: Optional['HealthChecker'] = None
+        self.prometheus_metrics: Optional['PrometheusMetrics'] = None
         self.error_handler: Optional[ErrorHandler] = None
+        self._http_session = None
         
         # Control
         self.shutdown_event = asyncio.Event()
+        self.health_trigger = asyncio.Event()
         
     async def initialize(self):
         """Initialize all components"""
         try:
             self.logger.info("Initializing AutoCoin Futures System...")
             
+            from src.trading.futures_position_manager import FuturesPositionManager
+            from src.monitoring.futures_monitor import FuturesMonitor
+            from src.monitoring.health_checker import HealthChecker
+            from src.utils.risk_manager import RiskManager
+            
             # Error handler
             self.error_handler = ErrorHandler(self.logger)
             
-            # Initialize Futures Client
-            try:
-                self.futures_client = BinanceFuturesClient(
-                    api_key=self.config.api_key,
-                    api_secret=self.config.api_secret,
-                    testnet=self.config.use_testnet
-                )
-                await self.futures_client.initialize()
-                
-                # Test connection
-                if await self.futures_client.test_connection():
-                    self.logger.info("Futures client initialized and connected")
-                else:
-                    raise Exception("Failed to connect to Binance Futures API")
-                    
-            except Exception as e:
-                raise ComponentInitializationException("FuturesClient", str(e))
-                
             # Initialize Risk Manager
             try:
                 self.risk_manager = RiskManager(self.config.risk_percentage)
@@ -78,7 +77,20 @@ class AutoCoinFuturesApp:
             except Exception as e:
                 raise ComponentInitializationException("RiskManager", str(e))
                 
-            # Initialize Position Manager
+            # Independent components each wait on their own network handshake,
+            # so bring them up concurrently
+            results = await asyncio.gather(
+                self._init_component("FuturesClient", self._init_futures_client()),
+                self._init_component("TradingEngine", self._init_trading_engine()),
+                self._init_telegram_bot(),
+                self._init_prometheus(),
+                return_exceptions=True
+            )
+            for result in results:
+                if isinstance(result, Exception):
+                    raise result
+                    
+            # Initialize Position Manager (requires the futures client)
             try:
                 self.position_manager = FuturesPositionManager(
                     self.futures_client,
@@ -89,15 +101,6 @@ class AutoCoinFuturesApp:
             except Exception as e:
                 raise ComponentInitializationException("PositionManager", str(e))
                 
-            # Initialize Prometheus Metrics
-            try:
-                self.prometheus_metrics = PrometheusMetrics()
-                self.prometheus_metrics.start_server(port=8000)
-                self.logger.info("Prometheus metrics server started on port 8000")
-            except Exception as e:
-                self.logger.warning(f"Prometheus metrics initialization failed: {e}")
-                self.prometheus_metrics = None
-                
             # Initialize Futures Monitor
             try:
                 self.futures_monitor = FuturesMonitor(
@@ -105,38 +108,15 @@ class AutoCoinFuturesApp:
                     self.position_manager,
                     self.prometheus_metrics
                 )
+                # Wake the health loop as soon as positions change or an alert fires
+                self.futures_monitor.add_state_listener(self.request_health_check)
                 self.logger.info("Futures monitor initialized")
             except Exception as e:
                 raise ComponentInitializationException("FuturesMonitor", str(e))
                 
-            # Initialize Trading Engine
-            try:
-                self.engine = FuturesTradingEngine(self.config)
-                await self.engine.initialize()
-                
-                # Set default strategy
-                if self.config.default_futures_strategy:
-                    self.engine.set_strategy(self.config.default_futures_strategy)
-                    
-                self.logger.info("Futures trading engine initialized")
-            except Exception as e:
-                raise ComponentInitializationException("TradingEngine", str(e))
-                
-            # Initialize Telegram Bot
-            if self.config.telegram_token and self.config.chat_id:
-                try:
-                    self.bot = AutoCoinFuturesBot(self.config)
-                    await self.bot.initialize()
-                    
-                    # Connect bot to engine
-                    self.engine.set_telegram_bot(self.bot)
-                    
-                    self.logger.info("Telegram bot initialized")
-                except Exception as e:
-                    self.logger.warning(f"Telegram bot initialization failed: {e}")
-                    self.bot = None
-            else:
-                self.logger.warning("Telegram credentials not provided, bot disabled")
+            # Connect bot to engine
+            if self.bot:
+                self.engine.set_telegram_bot(self.bot)
                 
             # Initialize Health Checker
             self.health_checker = HealthChecker()
@@ -153,14 +133,91 @@ class AutoCoinFuturesApp:
             self.logger.info("✅ AutoCoin Futures System initialized successfully")
             
         except ComponentInitializationException as e:
-            self.logger.error(f"Failed to initialize {e.component}: {e.message}")
+            self.logger.error("Initialization failed: %s", e, extra={"component": e.details.get("component")})
             await self.cleanup()
             raise
         except Exception as e:
-            self.logger.error(f"Unexpected initialization error: {e}")
+            self.logger.error("Unexpected initialization error: %s", e)
             await self.cleanup()
             raise SystemException(f"System initialization failed: {str(e)}")
             
+    async def _init_component(self, name: str, coro):
+        """Await a component initializer, reporting failures as ComponentInitializationException"""
+        try:
+            return await coro
+        except ComponentInitializationException:
+            raise
+        except Exception as e:
+            raise ComponentInitializationException(name, str(e))
+            
+    async def _init_futures_client(self):
+        """Initialize the futures client and verify connectivity"""
+        from src.exchange.binance_client import create_http_session
+        from src.exchange.binance_futures_client import BinanceFuturesClient
+        
+        # Spot and futures exchanges share one keep-alive connection pool,
+        # which also bounds how many requests are in flight at once
+        self._http_session = create_http_session(max_inflight=self.config.max_inflight_requests)
+        self.futures_client = BinanceFuturesClient(
+            api_key=self.config.api_key,
+            api_secret=self.config.api_secret,
+            testnet=self.config.use_testnet,
+            session=self._http_session
+        )
+        await self.futures_client.initialize(
+            symbols=[self.config.futures_symbol],
+            leverage=self.config.default_leverage,
+            margin_mode=self.config.margin_mode
+        )
+        
+        # Test connection
+        if await self.futures_client.test_connection():
+            self.logger.info("Futures client initialized and connected")
+        else:
+            raise Exception("Failed to connect to Binance Futures API")
+            
+    async def _init_trading_engine(self):
+        """Initialize the futures trading engine"""
+        from src.trading.futures_engine import FuturesTradingEngine
+        
+        self.engine = FuturesTradingEngine(self.config)
+        await self.engine.initialize()
+        
+        # Set default strategy
+        if self.config.default_futures_strategy:
+            self.engine.set_strategy(self.config.default_futures_strategy)
+            
+        self.logger.info("Futures trading engine initialized")
+        
+    async def _init_telegram_bot(self):
+        """Initialize the Telegram bot (optional component)"""
+        if not (self.config.telegram_token and self.config.chat_id):
+            self.logger.warning("Telegram credentials not provided, bot disabled")
+            return
+            
+        try:
+            from src.telegram_bot.futures_bot import AutoCoinFuturesBot
+            
+            self.bot = AutoCoinFuturesBot(self.config)
+            await self.bot.initialize()
+            self.logger.info("Telegram bot initialized")
+        except Exception as e:
+            self.logger.warning("Telegram bot initialization failed: %s", e, extra={"component": "TelegramBot"})
+            self.bot = None
+            
+    async def _init_prometheus(self):
+        """Start the Prometheus metrics server (optional component)"""
+        try:
+            from src.monitoring.prometheus_metrics import PrometheusMetrics
+            
+            self.prometheus_metrics = PrometheusMetrics(port=8000)
+            # Binding the HTTP server socket is blocking; keep it off the event loop
+            await asyncio.to_thread(self.prometheus_metrics.start_server)
+            self.logger.info("Prometheus metrics server started on port 8000")
+        except Exception as e:
+            self.logger.warning("Prometheus metrics initialization failed: %s", e, extra={"component": "Prometheus"})
+            self.prometheus_metrics = None
+            
     async def run(self):
         """Run the main application"""
         try:
@@ -202,13 +259,17 @@ class AutoCoinFuturesApp:
             
     async def health_check_loop(self):
         """Periodic health check"""
+        # Bind logger methods once instead of resolving them on every pass
+        log_error = self.logger.error
+        log_warning = self.logger.warning
+        
         while not self.shutdown_event.is_set():
             try:
                 health_status = await self.health_checker.check_all()
                 
                 if not health_status['healthy']:
                     unhealthy = [k for k, v in health_status['components'].items() if not v]
-                    self.logger.warning(f"Unhealthy components: {unhealthy}")
+                    log_warning("Unhealthy components: %s", unhealthy)
                     
                     # Send alert if bot is available
                     if self.bot and 'telegram_bot' not in unhealthy:
@@ -222,18 +283,34 @@ class AutoCoinFuturesApp:
                     )
                     
             except Exception as e:
-                self.logger.error(f"Health check error: {e}")
+                log_error("Health check error: %s", e)
                 
-            await asyncio.sleep(60)  # Check every minute
+            await self._wait_next_health_check(60)  # Check every minute
+            
+    async def _wait_next_health_check(self, interval: float):
+        """Wait for the next health check, waking early on shutdown or a health trigger"""
+        waiters = {
+            asyncio.create_task(self.shutdown_event.wait()),
+            asyncio.create_task(self.health_trigger.wait())
+        }
+        try:
+            await asyncio.wait(waiters, timeout=interval, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for waiter in waiters:
+                waiter.cancel()
+        self.health_trigger.clear()
+        
+    def request_health_check(self):
+        """Ask the health loop to run immediately (e.g. on a component state change)"""
+        self.health_trigger.set()
             
     async def run_telegram_bot(self):
         """Run telegram bot"""
         if self.bot:
             try:
                 # This would need to be implemented in the bot class
-                # For now, just keep the task alive
-                while not self.shutdown_event.is_set():
-                    await asyncio.sleep(1)
+                # For now, just keep the task alive until shutdown
+                await self.shutdown_event.wait()
             except Exception as e:
                 self.logger.error(f"Telegram bot error: {e}")
                 
@@ -253,6 +330,9 @@ class AutoCoinFuturesApp:
         if self.futures_client:
             await self.futures_client.close()
             
+        if self._http_session:
+            self._http_session.close()
+            
         # Stop Prometheus server
         if self.prometheus_metrics:
             self.prometheus_metrics.stop_server()
@@ -260,18 +340,25 @@ class AutoCoinFuturesApp:
         self.logger.info("Cleanup completed")
         
     def setup_signal_handlers(self):
-        """Setup signal handlers for graceful shutdown"""
-        def signal_handler(sig, frame):
+        """Setup signal handlers for graceful shutdown (call from inside the running loop)"""
+        def signal_handler(sig, frame=None):
             self.logger.info(f"Received signal {sig}, shutting down...")
             self.shutdown_event.set()
             
-        signal.signal(signal.SIGINT, signal_handler)
-        signal.signal(signal.SIGTERM, signal_handler)
+        if sys.platform == 'win32':
+            # The Windows event loop does not support add_signal_handler
+            signal.signal(signal.SIGINT, signal_handler)
+            signal.signal(signal.SIGTERM, signal_handler)
+            return
+            
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, signal_handler, sig)
         
 
-async def main():
+async def main(config: Optional[FuturesConfig] = None):
     """Main entry point"""
-    app = AutoCoinFuturesApp()
+    app = AutoCoinFuturesApp(config)
     
     try:
         # Initialize application
@@ -292,12 +379,20 @@ async def main():
         
 
 if __name__ == "__main__":
-    # Create example config files if they don't exist
+    parser = argparse.ArgumentParser(description="AutoCoin Futures Trading")
+    parser.add_argument(
+        '--init', action='store_true',
+        help="create example config files if they don't exist"
+    )
+    args = parser.parse_args()
+    
+    # Load configuration once and hand it to the application
     config = FuturesConfig()
-    if not os.path.exists('.env.futures.example'):
-        config.create_example_env_file()
-    if not os.path.exists('futures_config.json'):
-        config.create_example_config_file()
+    if args.init:
+        config.ensure_example_files()
+        
+    # Run the application (on uvloop when available)
+    if uvloop is not None:
+        uvloop.install()
         
-    # Run the application
-    asyncio.run(main())
\ No newline at end of file
+    asyncio.run(main(config))
\ No newline at end of file
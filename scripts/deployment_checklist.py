@@ -7,52 +7,156 @@ Production 배포 전 모든 요구사항이 충족되었는지 확인
 import os
 import sys
 import json
+import shutil
+import asyncio
+import threading
 import subprocess
-from datetime import datetime, timedelta
+from datetime import datetime
 from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+try:
+    from orjson import loads as json_loads
+except ImportError:  # orjson 미설치 환경에서는 표준 json 사용
+    json_loads = json.loads
 
 # 프로젝트 루트 추가
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+# 검사 대상 경로 (프로젝트 루트 기준)
+_PATHS = {
+    'testnet_log': 'logs/testnet.log',
+    'backtest_results': 'data/backtest_results.json',
+    'error_handler': 'src/utils/error_handler.py',
+    'exceptions': 'src/exceptions',
+    'retry_decorator': 'src/utils/retry_decorator.py',
+    'env': '.env',
+    'env_example': '.env.example',
+    'gitignore': '.gitignore',
+    'production_env': 'config/production.env',
+    'prometheus': 'monitoring/prometheus.yml',
+    'alerts': 'monitoring/alerts.yml',
+    'health_check': 'scripts/health_check.sh',
+    'backup_script': 'scripts/automated_backup.sh',
+    'backups': 'backups',
+    'crontab_example': 'scripts/crontab.example',
+    'emergency_stop': 'scripts/emergency_stop.sh',
+    'safe_restart': 'scripts/safe_restart.sh',
+    'ops_manual': 'docs/OPERATIONS_MANUAL.md',
+    'dockerfile': 'Dockerfile',
+    'docker_compose': 'docker-compose.yml',
+    'docker_compose_prod': 'docker-compose.prod.yml',
+    'integration_test': 'scripts/test_integration.py',
+}
+_PATH_PARTS = {key: tuple(path.split('/')) for key, path in _PATHS.items()}
+
 
 class DeploymentChecker:
     def __init__(self):
         self.project_root = Path(__file__).parent.parent
+        self.paths = {key: self.project_root / path for key, path in _PATHS.items()}
+        self._root = str(self.project_root)
         self.checks_passed = 0
         self.checks_failed = 0
         self.warnings = []
-        
+        self.started_at = datetime.now()
+        # 체크는 스레드 풀에서 동시에 실행되므로 카운터는 락으로 보호하고
+        # 출력/경고는 스레드별로 모아 원래 순서대로 출력
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        # 디렉토리별 scandir 결과 캐시 (경로 -> {이름: DirEntry})
+        self._dir_cache: Dict[str, Dict[str, os.DirEntry]] = {}
+        
+    def _scan(self, directory: str) -> Dict[str, os.DirEntry]:
+        """디렉토리를 한 번만 scandir 하여 항목을 캐시"""
+        entries = self._dir_cache.get(directory)
+        if entries is None:
+            entries = {}
+            try:
+                with os.scandir(directory) as it:
+                    for entry in it:
+                        entries[entry.name] = entry
+            except OSError:
+                pass
+            self._dir_cache[directory] = entries
+        return entries
+        
+    def _entry(self, key: str) -> Optional[os.DirEntry]:
+        """_PATHS 항목의 캐시된 DirEntry (없으면 None)"""
+        *dirs, name = _PATH_PARTS[key]
+        entries = self._scan(self._root)
+        for part in dirs:
+            # 상위 디렉토리가 없으면 하위 경로는 스캔하지 않음
+            entry = entries.get(part)
+            if entry is None or not entry.is_dir():
+                return None
+            entries = self._scan(entry.path)
+        return entries.get(name)
+        
+    def _exists(self, key: str) -> bool:
+        """경로 존재 여부"""
+        return self._entry(key) is not None
+        
+    def _is_executable(self, key: str) -> bool:
+        """경로가 존재하고 실행 권한이 있는지 (캐시된 st_mode로 판단)"""
+        entry = self._entry(key)
+        try:
+            return entry is not None and bool(entry.stat().st_mode & 0o111)
+        except OSError:
+            return False
+            
     def print_header(self):
         """헤더 출력"""
         print("=" * 60)
         print("     AutoCoin Production 배포 체크리스트")
         print("=" * 60)
-        print(f"검증 시작: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+        print(f"검증 시작: {self.started_at.strftime('%Y-%m-%d %H:%M:%S')}\n")
         
     def check(self, condition: bool, description: str, critical: bool = True) -> bool:
         """체크 항목 검증"""
         status = "✅" if condition else ("❌" if critical else "⚠️")
-        print(f"{status} {description}")
+        self._emit(f"{status} {description}")
         
-        if condition:
-            self.checks_passed += 1
-        else:
-            self.checks_failed += 1
-            if not critical:
-                self.warnings.append(description)
+        with self._lock:
+            if condition:
+                self.checks_passed += 1
+            else:
+                self.checks_failed += 1
                 
+        if not condition and not critical:
+            getattr(self._local, 'warnings', self.warnings).append(description)
+            
         return condition
         
+    def _emit(self, line: str):
+        """출력 (체크 실행 중이면 해당 스레드 버퍼에 저장)"""
+        lines = getattr(self._local, 'lines', None)
+        if lines is None:
+            print(line)
+        else:
+            lines.append(line)
+            
+    def _run_buffered(self, check_func: Callable[[], bool]) -> Tuple[List[str], List[str]]:
+        """체크 하나를 실행하고 (출력 라인, 경고) 반환"""
+        self._local.lines = []
+        self._local.warnings = []
+        try:
+            check_func()
+            return self._local.lines, self._local.warnings
+        finally:
+            del self._local.lines
+            del self._local.warnings
+        
     def check_testnet_testing(self) -> bool:
         """Testnet 테스트 기간 확인"""
-        print("\n📋 Testnet 테스트 확인")
+        self._emit("\n📋 Testnet 테스트 확인")
         
         # 최근 testnet 로그 확인
-        testnet_log = self.project_root / "logs" / "testnet.log"
-        if testnet_log.exists():
+        testnet_log = self._entry('testnet_log')
+        if testnet_log is not None:
             # 파일 수정 시간으로 테스트 기간 계산
             mtime = datetime.fromtimestamp(testnet_log.stat().st_mtime)
-            test_days = (datetime.now() - mtime).days
+            test_days = (self.started_at - mtime).days
             
             return self.check(
                 test_days >= 7,
@@ -64,154 +168,137 @@ class DeploymentChecker:
             
     def check_backtest_completed(self) -> bool:
         """백테스트 완료 확인"""
-        print("\n📊 백테스트 확인")
+        self._emit("\n📊 백테스트 확인")
         
-        backtest_results = self.project_root / "data" / "backtest_results.json"
-        if backtest_results.exists():
-            with open(backtest_results) as f:
-                results = json.load(f)
-                
-            strategies_tested = len(results.get("strategies", {}))
-            all_profitable = all(
-                s.get("total_return", 0) > 0 
-                for s in results.get("strategies", {}).values()
-            )
-            
-            self.check(strategies_tested >= 3, f"모든 전략 백테스트 완료 ({strategies_tested}/3)")
-            return self.check(all_profitable, "모든 전략 수익성 확인", critical=False)
-        else:
+        try:
+            results = json_loads(self.paths['backtest_results'].read_bytes())
+        except FileNotFoundError:
             return self.check(False, "백테스트 결과 파일 없음")
             
+        strategies = results.get("strategies", {})
+        strategies_tested = len(strategies)
+        
+        # 첫 번째 손실 전략에서 중단하고 어떤 전략인지 표시
+        losing_strategy = None
+        for name, stats in strategies.items():
+            if stats.get("total_return", 0) <= 0:
+                losing_strategy = name
+                break
+                
+        self.check(strategies_tested >= 3, f"모든 전략 백테스트 완료 ({strategies_tested}/3)")
+        if losing_strategy is None:
+            return self.check(True, "모든 전략 수익성 확인", critical=False)
+        return self.check(False, f"모든 전략 수익성 확인 (손실: {losing_strategy})", critical=False)
+            
     def check_error_handling(self) -> bool:
         """에러 처리 로직 확인"""
-        print("\n🛡️ 에러 처리 확인")
+        self._emit("\n🛡️ 에러 처리 확인")
         
         # 에러 핸들러 파일 존재 확인
-        error_handler = self.project_root / "src" / "utils" / "error_handler.py"
-        self.check(error_handler.exists(), "에러 핸들러 구현됨")
+        self.check(self._exists('error_handler'), "에러 핸들러 구현됨")
         
         # 예외 클래스 확인
-        exceptions_dir = self.project_root / "src" / "exceptions"
-        self.check(exceptions_dir.exists(), "예외 클래스 정의됨")
+        self.check(self._exists('exceptions'), "예외 클래스 정의됨")
         
         # 재시도 로직 확인
-        retry_decorator = self.project_root / "src" / "utils" / "retry_decorator.py"
-        return self.check(retry_decorator.exists(), "재시도 데코레이터 구현됨")
+        return self.check(self._exists('retry_decorator'), "재시도 데코레이터 구현됨")
         
     def check_api_security(self) -> bool:
         """API 보안 설정 확인"""
-        print("\n🔐 API 보안 확인")
+        self._emit("\n🔐 API 보안 확인")
         
         # .env 파일 확인
-        env_file = self.project_root / ".env"
-        env_example = self.project_root / ".env.example"
-        
-        self.check(env_file.exists(), ".env 파일 존재")
-        self.check(env_example.exists(), ".env.example 파일 존재")
+        self.check(self._exists('env'), ".env 파일 존재")
+        self.check(self._exists('env_example'), ".env.example 파일 존재")
         
         # .gitignore에 .env 포함 확인
-        gitignore = self.project_root / ".gitignore"
-        if gitignore.exists():
-            with open(gitignore) as f:
-                content = f.read()
-                self.check(".env" in content, ".env가 .gitignore에 포함됨")
-                
+        try:
+            content = self.paths['gitignore'].read_text()
+            self.check(".env" in content, ".env가 .gitignore에 포함됨")
+        except FileNotFoundError:
+            self.check(False, ".gitignore 없음")
+            
         # Production 환경 설정 확인
-        prod_env = self.project_root / "config" / "production.env"
+        prod_env = self._entry('production_env')
         return self.check(
-            not prod_env.exists() or prod_env.stat().st_size == 0,
+            prod_env is None or prod_env.stat().st_size == 0,
             "Production 환경 파일에 실제 키 없음"
         )
         
     def check_monitoring_setup(self) -> bool:
         """모니터링 설정 확인"""
-        print("\n📡 모니터링 설정 확인")
+        self._emit("\n📡 모니터링 설정 확인")
         
         # Prometheus 설정
-        prometheus_config = self.project_root / "monitoring" / "prometheus.yml"
-        self.check(prometheus_config.exists(), "Prometheus 설정 파일 존재")
+        self.check(self._exists('prometheus'), "Prometheus 설정 파일 존재")
         
         # Alert 규칙
-        alerts_config = self.project_root / "monitoring" / "alerts.yml"
-        self.check(alerts_config.exists(), "Alert 규칙 정의됨")
+        self.check(self._exists('alerts'), "Alert 규칙 정의됨")
         
         # 헬스체크 스크립트
-        health_check = self.project_root / "scripts" / "health_check.sh"
-        return self.check(health_check.exists() and os.access(health_check, os.X_OK), 
+        return self.check(self._is_executable('health_check'), 
                          "헬스체크 스크립트 실행 가능")
         
     def check_backup_system(self) -> bool:
         """백업 시스템 확인"""
-        print("\n💾 백업 시스템 확인")
+        self._emit("\n💾 백업 시스템 확인")
         
         # 백업 스크립트
-        backup_script = self.project_root / "scripts" / "automated_backup.sh"
-        self.check(backup_script.exists() and os.access(backup_script, os.X_OK), 
+        self.check(self._is_executable('backup_script'), 
                   "자동 백업 스크립트 실행 가능")
         
         # 백업 디렉토리
-        backup_dir = self.project_root / "backups"
-        self.check(backup_dir.exists(), "백업 디렉토리 존재")
+        self.check(self._exists('backups'), "백업 디렉토리 존재")
         
         # Crontab 예시
-        crontab_example = self.project_root / "scripts" / "crontab.example"
-        return self.check(crontab_example.exists(), "Crontab 설정 예시 존재")
+        return self.check(self._exists('crontab_example'), "Crontab 설정 예시 존재")
         
     def check_emergency_procedures(self) -> bool:
         """긴급 절차 확인"""
-        print("\n🚨 긴급 절차 확인")
+        self._emit("\n🚨 긴급 절차 확인")
         
         # 긴급 정지 스크립트
-        emergency_stop = self.project_root / "scripts" / "emergency_stop.sh"
-        self.check(emergency_stop.exists() and os.access(emergency_stop, os.X_OK), 
+        self.check(self._is_executable('emergency_stop'), 
                   "긴급 정지 스크립트 실행 가능")
         
         # 안전 재시작 스크립트
-        safe_restart = self.project_root / "scripts" / "safe_restart.sh"
-        self.check(safe_restart.exists() and os.access(safe_restart, os.X_OK), 
+        self.check(self._is_executable('safe_restart'), 
                   "안전 재시작 스크립트 실행 가능")
         
         # 운영 매뉴얼
-        ops_manual = self.project_root / "docs" / "OPERATIONS_MANUAL.md"
-        return self.check(ops_manual.exists(), "운영 매뉴얼 문서화됨")
+        return self.check(self._exists('ops_manual'), "운영 매뉴얼 문서화됨")
         
     def check_docker_setup(self) -> bool:
         """Docker 설정 확인"""
-        print("\n🐳 Docker 설정 확인")
+        self._emit("\n🐳 Docker 설정 확인")
         
         # Docker 파일들
-        dockerfile = self.project_root / "Dockerfile"
-        docker_compose = self.project_root / "docker-compose.yml"
-        docker_compose_prod = self.project_root / "docker-compose.prod.yml"
+        self.check(self._exists('dockerfile'), "Dockerfile 존재")
+        self.check(self._exists('docker_compose'), "docker-compose.yml 존재")
+        self.check(self._exists('docker_compose_prod'), "docker-compose.prod.yml 존재")
         
-        self.check(dockerfile.exists(), "Dockerfile 존재")
-        self.check(docker_compose.exists(), "docker-compose.yml 존재")
-        self.check(docker_compose_prod.exists(), "docker-compose.prod.yml 존재")
+        # Docker 설치 확인 (프로세스를 띄우지 않고 PATH에서만 탐색)
+        docker_installed = shutil.which("docker") is not None
         
-        # Docker 설치 확인
-        try:
-            subprocess.run(["docker", "--version"], capture_output=True, check=True)
-            docker_installed = True
-        except:
-            docker_installed = False
-            
         return self.check(docker_installed, "Docker 설치됨")
         
     def check_integration_tests(self) -> bool:
         """통합 테스트 확인"""
-        print("\n🧪 통합 테스트 확인")
+        self._emit("\n🧪 통합 테스트 확인")
         
         # 통합 테스트 스크립트
-        integration_test = self.project_root / "scripts" / "test_integration.py"
-        self.check(integration_test.exists(), "통합 테스트 스크립트 존재")
+        integration_test = self.paths['integration_test']
+        integration_test_exists = self._exists('integration_test')
+        self.check(integration_test_exists, "통합 테스트 스크립트 존재")
         
         # 테스트 실행 (dry run)
-        if integration_test.exists():
+        if integration_test_exists:
             try:
                 # 실제로는 테스트를 실행하지 않고 import만 확인
                 result = subprocess.run(
                     [sys.executable, str(integration_test), "--dry-run"],
-                    capture_output=True,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL,  # stdout만 확인하므로 stderr는 버림
                     text=True
                 )
                 test_ready = result.returncode == 0 or "dry-run" in result.stdout
@@ -229,10 +316,11 @@ class DeploymentChecker:
         
         total_checks = self.checks_passed + self.checks_failed
         pass_rate = (self.checks_passed / total_checks * 100) if total_checks > 0 else 0
+        pass_rate_str = f"{pass_rate:.1f}%"
         
         print(f"\n✅ 통과: {self.checks_passed}")
         print(f"❌ 실패: {self.checks_failed}")
-        print(f"📊 통과율: {pass_rate:.1f}%")
+        print(f"📊 통과율: {pass_rate_str}")
         
         if self.warnings:
             print(f"\n⚠️  경고 사항 ({len(self.warnings)}개):")
@@ -251,30 +339,44 @@ class DeploymentChecker:
             print("   실패한 항목들을 먼저 해결해주세요.")
             
         # 체크리스트 파일 생성
-        checklist_file = self.project_root / f"deployment_checklist_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
-        with open(checklist_file, 'w') as f:
-            f.write(f"AutoCoin 배포 체크리스트 검증 결과\n")
-            f.write(f"생성 시간: {datetime.now()}\n")
-            f.write(f"통과: {self.checks_passed}, 실패: {self.checks_failed}, 통과율: {pass_rate:.1f}%\n")
-            f.write(f"배포 가능: {'YES' if self.checks_failed == 0 else 'NO'}\n")
-            
+        generated_at = datetime.now()
+        checklist_file = self.project_root / f"deployment_checklist_{generated_at.strftime('%Y%m%d_%H%M%S')}.txt"
+        checklist_file.write_text(
+            f"AutoCoin 배포 체크리스트 검증 결과\n"
+            f"생성 시간: {generated_at}\n"
+            f"통과: {self.checks_passed}, 실패: {self.checks_failed}, 통과율: {pass_rate_str}\n"
+            f"배포 가능: {'YES' if self.checks_failed == 0 else 'NO'}\n"
+        )
+        
         print(f"\n📄 체크리스트 파일 생성됨: {checklist_file}")
         
-    def run(self):
+    async def run(self):
         """모든 체크 실행"""
         self.print_header()
         
-        # 각 카테고리별 체크 실행
-        self.check_testnet_testing()
-        self.check_backtest_completed()
-        self.check_error_handling()
-        self.check_api_security()
-        self.check_monitoring_setup()
-        self.check_backup_system()
-        self.check_emergency_procedures()
-        self.check_docker_setup()
-        self.check_integration_tests()
-        
+        # 각 카테고리별 체크는 서로 독립적이므로 스레드 풀에서 동시에 실행
+        checks = [
+            self.check_testnet_testing,
+            self.check_backtest_completed,
+            self.check_error_handling,
+            self.check_api_security,
+            self.check_monitoring_setup,
+            self.check_backup_system,
+            self.check_emergency_procedures,
+            self.check_docker_setup,
+            self.check_integration_tests,
+        ]
+        loop = asyncio.get_running_loop()
+        results = await asyncio.gather(*(
+            loop.run_in_executor(None, self._run_buffered, check) for check in checks
+        ))
+        
+        # 카테고리 순서대로 출력
+        for lines, warnings in results:
+            for line in lines:
+                print(line)
+            self.warnings.extend(warnings)
+            
         # 최종 리포트
         self.generate_report()
         
@@ -284,5 +386,5 @@ class DeploymentChecker:
 
 if __name__ == "__main__":
     checker = DeploymentChecker()
-    exit_code = checker.run()
+    exit_code = asyncio.run(checker.run())
     sys.exit(exit_code)
\ No newline at end of file
@@ -10,23 +10,31 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.config import Config
-from src.exchange.binance_client import BinanceClient
-from src.strategies.strategy_manager import StrategyManager
-from src.recommendation.strategy_recommender import StrategyRecommender
-from src.monitoring.health_checker import HealthChecker
-from src.monitoring.metrics_collector import MetricsCollector
-from src.utils.error_handler import ErrorHandler
+
+# 나머지 컴포넌트(ccxt, pandas 등 의존)는 각 테스트에서 지연 import
 
 
 class IntegrationTester:
     def __init__(self):
         self.config = Config()
         self.results = {}
+        self.passed = 0
+        self.failed = 0
         
+    def _record(self, name: str, ok: bool):
+        """테스트 결과 기록 및 카운터 갱신"""
+        self.results[name] = ok
+        if ok:
+            self.passed += 1
+        else:
+            self.failed += 1
+            
     async def test_exchange_connection(self):
         """거래소 연결 테스트"""
         print("\n1. 거래소 연결 테스트...")
         try:
+            from src.exchange.binance_client import BinanceClient
+            
             exchange = BinanceClient(
                 api_key=self.config.binance_api_key,
                 api_secret=self.config.binance_api_secret,
@@ -44,18 +52,20 @@ class IntegrationTester:
             print(f"   - Testnet 모드: {self.config.binance_testnet}")
             print(f"   - USDT 잔고: {balance.get('USDT', {}).get('free', 0)}")
             
-            self.results['exchange'] = True
+            self._record('exchange', True)
             return exchange
             
         except Exception as e:
             print(f"❌ 거래소 연결 실패: {e}")
-            self.results['exchange'] = False
+            self._record('exchange', False)
             return None
             
     async def test_strategy_manager(self):
         """전략 매니저 테스트"""
         print("\n2. 전략 매니저 테스트...")
         try:
+            from src.strategies.strategy_manager import StrategyManager
+            
             manager = StrategyManager()
             
             # 사용 가능한 전략 확인
@@ -68,12 +78,12 @@ class IntegrationTester:
                 strategy = manager.get_strategy(strategy_name)
                 print(f"   - {strategy_name} 전략 로드 성공")
                 
-            self.results['strategy_manager'] = True
+            self._record('strategy_manager', True)
             return manager
             
         except Exception as e:
             print(f"❌ 전략 매니저 테스트 실패: {e}")
-            self.results['strategy_manager'] = False
+            self._record('strategy_manager', False)
             return None
             
     async def test_strategy_recommender(self, exchange):
@@ -81,10 +91,12 @@ class IntegrationTester:
         print("\n3. 전략 추천 시스템 테스트...")
         if not exchange:
             print("⚠️  거래소 연결이 필요합니다. 건너뜁니다.")
-            self.results['recommender'] = False
+            self._record('recommender', False)
             return None
             
         try:
+            from src.recommendation.strategy_recommender import StrategyRecommender
+            
             recommender = StrategyRecommender(exchange)
             
             # 시장 분석 테스트
@@ -97,18 +109,20 @@ class IntegrationTester:
             recommended = await recommender.recommend_strategy()
             print(f"   - 추천 전략: {recommended}")
             
-            self.results['recommender'] = True
+            self._record('recommender', True)
             return recommender
             
         except Exception as e:
             print(f"❌ 전략 추천 시스템 테스트 실패: {e}")
-            self.results['recommender'] = False
+            self._record('recommender', False)
             return None
             
     async def test_health_checker(self, components):
         """헬스 체커 테스트"""
         print("\n4. 헬스 체커 테스트...")
         try:
+            from src.monitoring.health_checker import HealthChecker
+            
             health_checker = HealthChecker()
             
             # 컴포넌트 등록
@@ -124,18 +138,20 @@ class IntegrationTester:
                 emoji = "✅" if status.is_healthy else "❌"
                 print(f"   {emoji} {name}: {status.message}")
                 
-            self.results['health_checker'] = True
+            self._record('health_checker', True)
             return health_checker
             
         except Exception as e:
             print(f"❌ 헬스 체커 테스트 실패: {e}")
-            self.results['health_checker'] = False
+            self._record('health_checker', False)
             return None
             
     async def test_error_handler(self):
         """에러 핸들러 테스트"""
         print("\n5. 에러 핸들러 테스트...")
         try:
+            from src.utils.error_handler import ErrorHandler
+            
             error_handler = ErrorHandler()
             
             # 테스트 에러 생성 및 처리
@@ -149,12 +165,12 @@ class IntegrationTester:
             print(f"   - 에러 처리 완료: {handled}")
             print(f"   - 총 에러 수: {summary['total_errors']}")
             
-            self.results['error_handler'] = True
+            self._record('error_handler', True)
             return error_handler
             
         except Exception as e:
             print(f"❌ 에러 핸들러 테스트 실패: {e}")
-            self.results['error_handler'] = False
+            self._record('error_handler', False)
             return None
             
     def print_summary(self):
@@ -163,8 +179,8 @@ class IntegrationTester:
         print("통합 테스트 결과 요약")
         print("="*50)
         
-        total_tests = len(self.results)
-        passed_tests = sum(1 for result in self.results.values() if result)
+        total_tests = self.passed + self.failed
+        passed_tests = self.passed
         
         for component, result in self.results.items():
             emoji = "✅" if result else "❌"
@@ -1,11 +1,40 @@
 import os
 import json
+from types import MappingProxyType
 from typing import Dict, Any
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
+# Default strategy settings used when no config file exists (copied per Config)
+_DEFAULT_STRATEGIES = MappingProxyType({
+    "breakout": {
+        "enabled": True,
+        "lookback_buy": 20,
+        "lookback_sell": 10,
+        "stop_loss": 2.0,
+        "take_profit": 5.0
+    },
+    "scalping": {
+        "enabled": True,
+        "rsi_period": 14,
+        "rsi_oversold": 30,
+        "rsi_overbought": 70,
+        "bb_period": 20,
+        "bb_std": 2,
+        "stop_loss": 0.5,
+        "take_profit": 1.0
+    },
+    "trend": {
+        "enabled": True,
+        "ema_fast": 12,
+        "ema_slow": 26,
+        "stop_loss": 3.0,
+        "trailing_stop": 3.0
+    }
+})
+
 class Config:
     """Configuration manager for AutoCoin trading bot"""
     
@@ -16,19 +45,21 @@ class Config:
         
     def _load_env_vars(self):
         """Load environment variables"""
+        env = os.environ
+        
         # Binance API
-        self.api_key = os.getenv('BINANCE_API_KEY')
-        self.api_secret = os.getenv('BINANCE_API_SECRET')
-        self.use_testnet = os.getenv('USE_TESTNET', 'true').lower() == 'true'
+        self.api_key = env.get('BINANCE_API_KEY')
+        self.api_secret = env.get('BINANCE_API_SECRET')
+        self.use_testnet = env.get('USE_TESTNET', 'true').lower() == 'true'
         
         # Telegram
-        self.telegram_token = os.getenv('TELEGRAM_BOT_TOKEN', '')
-        self.chat_id = os.getenv('TELEGRAM_CHAT_ID', '')
+        self.telegram_token = env.get('TELEGRAM_BOT_TOKEN', '')
+        self.chat_id = env.get('TELEGRAM_CHAT_ID', '')
         
         # Trading
-        self.symbol = os.getenv('TRADING_SYMBOL', 'BTCUSDT')
-        self.base_amount = float(os.getenv('BASE_AMOUNT', '1000'))
-        self.max_positions = int(os.getenv('MAX_POSITIONS', '1'))
+        self.symbol = env.get('TRADING_SYMBOL', 'BTCUSDT')
+        self.base_amount = float(env.get('BASE_AMOUNT', '1000'))
+        self.max_positions = int(env.get('MAX_POSITIONS', '1'))
         
         # Validate required fields
         if not self.api_key or not self.api_secret:
@@ -43,32 +74,7 @@ class Config:
                 self.default_strategy = config_data.get('default_strategy', 'breakout')
         else:
             # Default configuration
-            self.strategies = {
-                "breakout": {
-                    "enabled": True,
-                    "lookback_buy": 20,
-                    "lookback_sell": 10,
-                    "stop_loss": 2.0,
-                    "take_profit": 5.0
-                },
-                "scalping": {
-                    "enabled": True,
-                    "rsi_period": 14,
-                    "rsi_oversold": 30,
-                    "rsi_overbought": 70,
-                    "bb_period": 20,
-                    "bb_std": 2,
-                    "stop_loss": 0.5,
-                    "take_profit": 1.0
-                },
-                "trend": {
-                    "enabled": True,
-                    "ema_fast": 12,
-                    "ema_slow": 26,
-                    "stop_loss": 3.0,
-                    "trailing_stop": 3.0
-                }
-            }
+            self.strategies = {name: dict(params) for name, params in _DEFAULT_STRATEGIES.items()}
             self.default_strategy = "breakout"
             
     def get_strategy_config(self, strategy_name: str) -> Dict[str, Any]:
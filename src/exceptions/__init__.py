@@ -9,7 +9,8 @@ from .trading_exceptions import (
     InsufficientBalanceException,
     InvalidOrderException,
     PositionNotFoundException,
-    StrategyException
+    StrategyException,
+    UnprotectedPositionException
 )
 from .system_exceptions import (
     SystemException,
@@ -30,6 +31,7 @@ __all__ = [
     'InvalidOrderException',
     'PositionNotFoundException',
     'StrategyException',
+    'UnprotectedPositionException',
     
     # System Exceptions
     'SystemException',
@@ -0,0 +1,4 @@
+from types import MappingProxyType
+
+# 상세 정보가 없는 예외가 공유하는 빈 매핑 (raise 마다 dict 생성 방지)
+EMPTY_DETAILS = MappingProxyType({})
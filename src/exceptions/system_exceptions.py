@@ -1,22 +1,29 @@
+from ._base import EMPTY_DETAILS
+
+# 에러 코드 (문자열 리터럴 대신 상수로 비교)
+CONFIG_ERROR = "CONFIG_ERROR"
+INIT_ERROR = "INIT_ERROR"
+
+
 class SystemException(Exception):
     """시스템 관련 기본 예외"""
     def __init__(self, message: str, code: str = None, details: dict = None):
         super().__init__(message)
         self.code = code
-        self.details = details or {}
+        self.details = details if details else EMPTY_DETAILS
 
 
 class ConfigurationException(SystemException):
     """설정 오류"""
     def __init__(self, message: str, config_key: str = None):
-        super().__init__(message, code="CONFIG_ERROR")
+        super().__init__(message, code=CONFIG_ERROR)
         if config_key:
-            self.details['config_key'] = config_key
+            self.details = {'config_key': config_key}
 
 
 class ComponentInitializationException(SystemException):
     """컴포넌트 초기화 오류"""
     def __init__(self, component_name: str, message: str):
         full_message = f"Failed to initialize {component_name}: {message}"
-        super().__init__(full_message, code="INIT_ERROR")
-        self.details['component'] = component_name
\ No newline at end of file
+        super().__init__(full_message, code=INIT_ERROR)
+        self.details = {'component': component_name}
\ No newline at end of file
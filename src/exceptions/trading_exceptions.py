@@ -1,16 +1,26 @@
+from ._base import EMPTY_DETAILS
+
+# 에러 코드 (문자열 리터럴 대신 상수로 비교)
+INSUFFICIENT_BALANCE = "INSUFFICIENT_BALANCE"
+INVALID_ORDER = "INVALID_ORDER"
+POSITION_NOT_FOUND = "POSITION_NOT_FOUND"
+STRATEGY_ERROR = "STRATEGY_ERROR"
+UNPROTECTED_POSITION = "UNPROTECTED_POSITION"
+
+
 class TradingException(Exception):
     """거래 관련 기본 예외"""
     def __init__(self, message: str, code: str = None, details: dict = None):
         super().__init__(message)
         self.code = code
-        self.details = details or {}
+        self.details = details if details else EMPTY_DETAILS
 
 
 class InsufficientBalanceException(TradingException):
     """잔고 부족"""
     def __init__(self, required_amount: float, available_amount: float):
         message = f"Insufficient balance. Required: {required_amount}, Available: {available_amount}"
-        super().__init__(message, code="INSUFFICIENT_BALANCE")
+        super().__init__(message, code=INSUFFICIENT_BALANCE)
         self.details = {
             'required_amount': required_amount,
             'available_amount': available_amount
@@ -20,23 +30,39 @@ class InsufficientBalanceException(TradingException):
 class InvalidOrderException(TradingException):
     """잘못된 주문"""
     def __init__(self, message: str, order_details: dict = None):
-        super().__init__(message, code="INVALID_ORDER")
+        super().__init__(message, code=INVALID_ORDER)
         if order_details:
-            self.details['order'] = order_details
+            self.details = {'order': order_details}
 
 
 class PositionNotFoundException(TradingException):
     """포지션을 찾을 수 없음"""
     def __init__(self, position_id: str = None):
         message = f"Position not found: {position_id}" if position_id else "No active position found"
-        super().__init__(message, code="POSITION_NOT_FOUND")
+        super().__init__(message, code=POSITION_NOT_FOUND)
         if position_id:
-            self.details['position_id'] = position_id
+            self.details = {'position_id': position_id}
 
 
 class StrategyException(TradingException):
     """전략 실행 오류"""
     def __init__(self, strategy_name: str, message: str):
         full_message = f"Strategy '{strategy_name}' error: {message}"
-        super().__init__(full_message, code="STRATEGY_ERROR")
-        self.details['strategy_name'] = strategy_name
\ No newline at end of file
+        super().__init__(full_message, code=STRATEGY_ERROR)
+        self.details = {'strategy_name': strategy_name}
+
+
+class UnprotectedPositionException(TradingException):
+    """스탑로스 없이 남은 포지션 (스탑로스 실패 후 진입 주문 정리 실패)"""
+    def __init__(self, symbol: str, side: str, amount: float, order_id: str = None,
+                 reason: str = None):
+        message = f"{symbol} {side} entry of up to {amount} left open without stop loss"
+        if reason:
+            message += f": {reason}"
+        super().__init__(message, code=UNPROTECTED_POSITION)
+        self.details = {
+            'symbol': symbol,
+            'side': side,
+            'amount': amount,
+            'order_id': order_id
+        }
@@ -1,15 +1,98 @@
 import ccxt
 from typing import Dict, List, Optional, Tuple
 import logging
+import time
 from datetime import datetime
+import numpy as np
 import pandas as pd
+import requests
+from requests.adapters import HTTPAdapter
+from types import MappingProxyType
+
+from ..utils.cache import TTLCache
+from ..utils.retry_decorator import retry_on_error
+
+# Market data cache TTLs (seconds); short enough for trading decisions, long
+# enough to absorb the same symbol being polled by several strategies per tick
+TICKER_CACHE_TTL = 2
+OHLCV_CACHE_TTL = 10
+FUNDING_CACHE_TTL = 30
+OHLCV_CACHE_MAX_LIMIT = 500
+
+# Market metadata (precision, limits) rarely changes; refresh it hourly
+MARKETS_CACHE_TTL = 3600
+
+# Testnet REST endpoints; ccxt may edit exchange.urls, so clients install copies
+TESTNET_SPOT_URLS = MappingProxyType({
+    'public': 'https://testnet.binance.vision/api/v3',
+    'private': 'https://testnet.binance.vision/api/v3',
+})
+TESTNET_FUTURES_URLS = MappingProxyType({
+    'fapiPublic': 'https://testnet.binancefuture.com/fapi/v1',
+    'fapiPrivate': 'https://testnet.binancefuture.com/fapi/v1',
+})
+
+# Retry transient exchange failures (timeouts, 5xx, maintenance, 429) with capped
+# exponential backoff. Order placement is deliberately not retried: a timed-out
+# request may still have been accepted, and a retry would duplicate the order.
+retry_on_exchange_error = retry_on_error(
+    max_retries=3,
+    delay=0.5,
+    backoff=2.0,
+    max_delay=8.0,
+    jitter=0.1,
+    exceptions=(ccxt.NetworkError,)
+)
+
+
+OHLCV_COLUMNS = ['open', 'high', 'low', 'close', 'volume']
+
+
+def ohlcv_to_dataframe(ohlcv: List[list]) -> pd.DataFrame:
+    """Build a timestamp-indexed OHLCV DataFrame from ccxt rows
+    
+    Goes through one float64 array instead of a list-of-lists DataFrame
+    followed by to_datetime/set_index.
+    """
+    arr = np.asarray(ohlcv, dtype=np.float64).reshape(-1, 6)
+    index = pd.to_datetime(arr[:, 0].astype(np.int64), unit='ms').rename('timestamp')
+    return pd.DataFrame(arr[:, 1:], index=index, columns=OHLCV_COLUMNS)
+
+
+def create_http_session(pool_connections: int = 10, pool_maxsize: int = 40,
+                        max_inflight: Optional[int] = None) -> requests.Session:
+    """Create a keep-alive HTTP session that can be shared between exchange clients
+    
+    ccxt's default session only keeps 10 connections per host, so concurrent
+    calls dispatched through asyncio.to_thread end up re-doing TLS handshakes.
+    
+    When max_inflight is set, the per-host pool is capped at that size and
+    blocks instead of opening extra connections, so fan-out queries never have
+    more than max_inflight requests in flight against Binance at once.
+    """
+    session = requests.Session()
+    if max_inflight:
+        adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=max_inflight,
+                              pool_block=True)
+    else:
+        adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
 
 class BinanceClient:
     """Binance API client wrapper for AutoCoin trading bot"""
     
-    def __init__(self, api_key: str, api_secret: str, testnet: bool = True):
+    def __init__(self, api_key: str, api_secret: str, testnet: bool = True,
+                 session: Optional[requests.Session] = None):
         self.logger = logging.getLogger(__name__)
         self.testnet = testnet
+        # Without a shared session, still use a pooled keep-alive one so spot
+        # and futures calls reuse connections instead of ccxt's small default pool
+        self.session = session if session is not None else create_http_session()
+        self.cache = TTLCache(maxsize=512)
+        self._markets_loaded_at: Optional[float] = None
         
         # Initialize exchange
         if testnet:
@@ -17,53 +100,62 @@ class BinanceClient:
                 'apiKey': api_key,
                 'secret': api_secret,
                 'enableRateLimit': True,
+                'session': self.session,
                 'options': {
                     'defaultType': 'spot',  # Changed from 'future' to 'spot' for testnet
                     'test': True,
                 }
             })
             # Set testnet URLs
-            self.exchange.urls['api'] = {
-                'public': 'https://testnet.binance.vision/api/v3',
-                'private': 'https://testnet.binance.vision/api/v3',
-            }
+            self.exchange.urls['api'] = dict(TESTNET_SPOT_URLS)
             self.logger.info("Initialized Binance client in TESTNET mode")
         else:
             self.exchange = ccxt.binance({
                 'apiKey': api_key,
                 'secret': api_secret,
                 'enableRateLimit': True,
+                'session': self.session,
             })
             self.logger.info("Initialized Binance client in LIVE mode")
             
+    @retry_on_exchange_error
     def get_balance(self) -> Dict:
         """Get account balance"""
         try:
             balance = self.exchange.fetch_balance()
-            self.logger.debug(f"Fetched balance: {balance['total']}")
+            self.logger.debug("Fetched balance: %s", balance['total'])
             return balance
         except Exception as e:
             self.logger.error(f"Failed to fetch balance: {e}")
             raise
             
+    @retry_on_exchange_error
     def get_ticker(self, symbol: str) -> Dict:
         """Get current ticker information"""
-        try:
+        def fetch():
             ticker = self.exchange.fetch_ticker(symbol)
-            self.logger.debug(f"Fetched ticker for {symbol}: {ticker['last']}")
+            self.logger.debug("Fetched ticker for %s: %s", symbol, ticker['last'])
             return ticker
+            
+        try:
+            # Concurrent callers for the same symbol share one request
+            return self.cache.get_or_load(('ticker', symbol), fetch, TICKER_CACHE_TTL)
         except Exception as e:
             self.logger.error(f"Failed to fetch ticker for {symbol}: {e}")
             raise
             
+    @retry_on_exchange_error
     def get_ohlcv(self, symbol: str, timeframe: str = '1m', limit: int = 100) -> pd.DataFrame:
         """Get OHLCV data"""
         try:
-            ohlcv = self.exchange.fetch_ohlcv(symbol, timeframe, limit=limit)
-            df = pd.DataFrame(ohlcv, columns=['timestamp', 'open', 'high', 'low', 'close', 'volume'])
-            df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
-            df.set_index('timestamp', inplace=True)
-            self.logger.debug(f"Fetched {len(df)} candles for {symbol}")
+            # Cache the raw rows, not the DataFrame: callers add indicator columns in place
+            ohlcv = self.cache.get_or_load(
+                ('ohlcv', symbol, timeframe, limit),
+                lambda: self.exchange.fetch_ohlcv(symbol, timeframe, limit=limit),
+                OHLCV_CACHE_TTL if limit <= OHLCV_CACHE_MAX_LIMIT else 0
+            )
+            df = ohlcv_to_dataframe(ohlcv)
+            self.logger.debug("Fetched %d candles for %s", len(df), symbol)
             return df
         except Exception as e:
             self.logger.error(f"Failed to fetch OHLCV for {symbol}: {e}")
@@ -100,6 +192,7 @@ class BinanceClient:
             self.logger.error(f"Failed to cancel order {order_id}: {e}")
             raise
             
+    @retry_on_exchange_error
     def get_order(self, order_id: str, symbol: str) -> Dict:
         """Get order information"""
         try:
@@ -109,16 +202,18 @@ class BinanceClient:
             self.logger.error(f"Failed to fetch order {order_id}: {e}")
             raise
             
+    @retry_on_exchange_error
     def get_open_orders(self, symbol: Optional[str] = None) -> List[Dict]:
         """Get all open orders"""
         try:
             orders = self.exchange.fetch_open_orders(symbol)
-            self.logger.debug(f"Found {len(orders)} open orders")
+            self.logger.debug("Found %d open orders", len(orders))
             return orders
         except Exception as e:
             self.logger.error(f"Failed to fetch open orders: {e}")
             raise
             
+    @retry_on_exchange_error
     def get_order_book(self, symbol: str, limit: int = 10) -> Dict:
         """Get order book"""
         try:
@@ -128,6 +223,7 @@ class BinanceClient:
             self.logger.error(f"Failed to fetch order book for {symbol}: {e}")
             raise
             
+    @retry_on_exchange_error
     def get_trades(self, symbol: str, limit: int = 50) -> List[Dict]:
         """Get recent trades"""
         try:
@@ -137,11 +233,12 @@ class BinanceClient:
             self.logger.error(f"Failed to fetch trades for {symbol}: {e}")
             raise
             
+    @retry_on_exchange_error
     def get_my_trades(self, symbol: str, limit: int = 50) -> List[Dict]:
         """Get my trades"""
         try:
             trades = self.exchange.fetch_my_trades(symbol, limit=limit)
-            self.logger.debug(f"Found {len(trades)} trades for {symbol}")
+            self.logger.debug("Found %d trades for %s", len(trades), symbol)
             return trades
         except Exception as e:
             self.logger.error(f"Failed to fetch my trades for {symbol}: {e}")
@@ -150,24 +247,37 @@ class BinanceClient:
     def get_exchange_info(self) -> Dict:
         """Get exchange information"""
         try:
-            return self.exchange.load_markets()
+            return self._cached_markets()
         except Exception as e:
             self.logger.error(f"Failed to load markets: {e}")
             raise
             
+    def _cached_markets(self) -> Dict:
+        """Return loaded markets, refetching them once MARKETS_CACHE_TTL has passed"""
+        now = time.monotonic()
+        if self._markets_loaded_at is None or now - self._markets_loaded_at >= MARKETS_CACHE_TTL:
+            markets = self.exchange.load_markets(reload=self._markets_loaded_at is not None)
+            self._markets_loaded_at = now
+            return markets
+        return self.exchange.markets
+        
     def get_symbol_info(self, symbol: str) -> Dict:
         """Get information for a specific symbol"""
         try:
-            markets = self.exchange.load_markets()
-            return markets.get(symbol, {})
+            return self._cached_markets().get(symbol, {})
         except Exception as e:
             self.logger.error(f"Failed to get symbol info for {symbol}: {e}")
             raise
             
-    def calculate_position_size(self, symbol: str, capital: float, price: float) -> float:
-        """Calculate position size based on available capital"""
+    def calculate_position_size(self, symbol: str, capital: float, price: float,
+                                market: Optional[Dict] = None) -> float:
+        """Calculate position size based on available capital
+        
+        Pass a pre-fetched market dict to skip the markets lookup.
+        """
         try:
-            market = self.get_symbol_info(symbol)
+            if market is None:
+                market = self.get_symbol_info(symbol)
             
             # Get minimum order size
             min_amount = market.get('limits', {}).get('amount', {}).get('min', 0.001)
@@ -184,7 +294,7 @@ class BinanceClient:
             # Ensure it meets minimum
             position_size = max(position_size, min_amount)
             
-            self.logger.debug(f"Calculated position size: {position_size} for {capital} capital at {price}")
+            self.logger.debug("Calculated position size: %s for %s capital at %s", position_size, capital, price)
             return position_size
             
         except Exception as e:
@@ -3,20 +3,63 @@ Binance Futures API Client
 Extended client for futures trading functionality
 """
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Tuple, Union
 import logging
 from datetime import datetime, timedelta
+import numpy as np
 import pandas as pd
-from decimal import Decimal
-from .binance_client import BinanceClient
+import requests
+from .binance_client import (
+    BinanceClient, FUNDING_CACHE_TTL, OHLCV_CACHE_MAX_LIMIT, OHLCV_CACHE_TTL, TESTNET_FUTURES_URLS,
+    TICKER_CACHE_TTL,
+    ohlcv_to_dataframe, retry_on_exchange_error
+)
+from ..exceptions import UnprotectedPositionException
+from ..utils.rate_limiter import TokenBucket
+
+
+# Binance Futures request weight budget (per minute)
+FUTURES_WEIGHT_PER_MINUTE = 1200
+
+# Maximum number of orders accepted by one batchOrders request
+BATCH_ORDER_LIMIT = 5
+
+# Request weight of the all-symbols 24hr ticker and premium index endpoints
+TICKERS_WEIGHT = 40
+MARK_PRICES_WEIGHT = 10
+
+# Delay before re-subscribing after a WebSocket stream error (seconds)
+STREAM_RECONNECT_DELAY = 5
 
 
 class BinanceFuturesClient(BinanceClient):
     """Extended Binance client with futures trading support"""
     
-    def __init__(self, api_key: str, api_secret: str, testnet: bool = True):
-        super().__init__(api_key, api_secret, testnet)
+    def __init__(self, api_key: str, api_secret: str, testnet: bool = True,
+                 session: Optional[requests.Session] = None):
+        super().__init__(api_key, api_secret, testnet, session=session)
         self.futures_exchange = None
+        # SL/TP orders are independent, so they are submitted side by side
+        self._order_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix='futures-orders')
+        # Weight-aware throttle; replaces ccxt's fixed per-request delay so bursts
+        # run back to back until the minute budget is spent
+        self._bucket = TokenBucket(
+            capacity=FUTURES_WEIGHT_PER_MINUTE,
+            refill_per_sec=FUTURES_WEIGHT_PER_MINUTE / 60
+        )
+        # Pushed mark prices and positions, keyed by unified symbol; the REST
+        # getters read these first and only poll when a stream is not live
+        self._ws = None
+        self._stream_tasks: List[asyncio.Task] = []
+        self._mark_prices: Dict[str, float] = {}
+        self._positions: Dict[str, Dict] = {}
+        self._positions_synced = False
+        self.futures_markets: Dict[str, Dict] = {}
+        # Symbol as passed by callers (e.g. 'BTCUSDT') -> resolved futures market
+        self._futures_markets: Dict[str, Dict] = {}
+        # symbol -> (contract_size, amount_multiplier, min_contracts) for position sizing
+        self._sizing_cache: Dict[str, Tuple[float, float, float]] = {}
         self._initialize_futures()
         
     def _initialize_futures(self):
@@ -29,23 +72,22 @@ class BinanceFuturesClient(BinanceClient):
                 self.futures_exchange = ccxt.binance({
                     'apiKey': self.exchange.apiKey,
                     'secret': self.exchange.secret,
-                    'enableRateLimit': True,
+                    'enableRateLimit': False,  # throttled by self._bucket
+                    'session': self.session,
                     'options': {
                         'defaultType': 'future',
                         'test': True,
                     }
                 })
                 # Set testnet URLs for futures
-                self.futures_exchange.urls['api'] = {
-                    'fapiPublic': 'https://testnet.binancefuture.com/fapi/v1',
-                    'fapiPrivate': 'https://testnet.binancefuture.com/fapi/v1',
-                }
+                self.futures_exchange.urls['api'] = dict(TESTNET_FUTURES_URLS)
                 self.logger.info("Initialized Binance Futures client in TESTNET mode")
             else:
                 self.futures_exchange = ccxt.binance({
                     'apiKey': self.exchange.apiKey,
                     'secret': self.exchange.secret,
-                    'enableRateLimit': True,
+                    'enableRateLimit': False,  # throttled by self._bucket
+                    'session': self.session,
                     'options': {
                         'defaultType': 'future',
                     }
@@ -56,22 +98,153 @@ class BinanceFuturesClient(BinanceClient):
             self.logger.error(f"Failed to initialize futures client: {e}")
             raise
             
-    async def initialize(self):
-        """Async initialization"""
+    async def initialize(self, symbols: Optional[List[str]] = None,
+                         leverage: Optional[int] = None,
+                         margin_mode: Optional[str] = None):
+        """Async initialization
+        
+        Markets and the server clock offset are loaded in parallel. When symbols
+        are given, their leverage and margin mode are pre-set concurrently so
+        the first trade on each symbol skips those round trips.
+        """
         try:
-            # Load markets for both spot and futures
+            # load_time_difference stores the offset ccxt applies to signed request timestamps
             await asyncio.gather(
-                asyncio.to_thread(self.exchange.load_markets),
-                asyncio.to_thread(self.futures_exchange.load_markets)
+                self.precompute_markets(),
+                asyncio.to_thread(self.futures_exchange.load_time_difference)
             )
             self.logger.info("Markets loaded for spot and futures")
         except Exception as e:
             self.logger.error(f"Failed to initialize markets: {e}")
             raise
             
+        if symbols:
+            await self._prewarm_symbols(symbols, leverage, margin_mode)
+            
+        self._start_streams()
+        
+    async def _prewarm_symbols(self, symbols: List[str], leverage: Optional[int],
+                               margin_mode: Optional[str]):
+        """Apply leverage and margin mode to all symbols at once"""
+        calls = []
+        if leverage:
+            calls += [asyncio.to_thread(self.set_leverage, symbol, leverage) for symbol in symbols]
+        if margin_mode:
+            calls += [asyncio.to_thread(self.set_margin_mode, symbol, margin_mode) for symbol in symbols]
+            
+        results = await asyncio.gather(*calls, return_exceptions=True)
+        failed = sum(isinstance(result, Exception) for result in results)
+        if failed:
+            # Not fatal: the position manager sets both again before opening a position
+            self.logger.warning(f"{failed} of {len(calls)} symbol pre-warm calls failed")
+        
+    async def precompute_markets(self) -> Dict[str, Dict]:
+        """Load spot and futures markets and expose the futures ones as self.futures_markets
+        
+        Callers sizing several orders per tick can pass entries of this dict as
+        the market argument of the position size helpers.
+        """
+        _, self.futures_markets = await asyncio.gather(
+            asyncio.to_thread(self._cached_markets),
+            asyncio.to_thread(self.futures_exchange.load_markets)
+        )
+        self._futures_markets.clear()
+        self._sizing_cache.clear()
+        return self.futures_markets
+        
+    def _start_streams(self):
+        """Start the mark price and position WebSocket streams once"""
+        if self._stream_tasks:
+            return
+            
+        try:
+            import ccxt.pro as ccxtpro
+            
+            self._ws = ccxtpro.binanceusdm({
+                'apiKey': self.exchange.apiKey,
+                'secret': self.exchange.secret,
+            })
+            if self.testnet:
+                self._ws.set_sandbox_mode(True)
+        except Exception as e:
+            self.logger.warning(f"WebSocket streams unavailable, polling REST instead: {e}")
+            self._ws = None
+            return
+            
+        self._stream_tasks = [
+            asyncio.create_task(self._watch_mark_prices()),
+            asyncio.create_task(self._watch_positions()),
+        ]
+        
+    async def _watch_mark_prices(self):
+        """Keep self._mark_prices updated from the !markPrice@arr stream"""
+        while True:
+            try:
+                ticks = await self._ws.watch_mark_prices()
+                for symbol, tick in ticks.items():
+                    if tick.get('markPrice') is not None:
+                        self._mark_prices[symbol] = tick['markPrice']
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # Stale prices are worse than a REST round trip
+                self._mark_prices.clear()
+                self.logger.warning(f"Mark price stream error, reconnecting: {e}")
+                await asyncio.sleep(STREAM_RECONNECT_DELAY)
+                
+    async def _watch_positions(self):
+        """Keep self._positions updated from the user-data stream"""
+        import ccxt
+        
+        while True:
+            try:
+                # The first call returns a full REST snapshot, later ones only changes
+                positions = await self._ws.watch_positions()
+                for position in positions:
+                    self._positions[position['symbol']] = position
+                self._positions_synced = True
+            except asyncio.CancelledError:
+                raise
+            except ccxt.AuthenticationError as e:
+                self._positions_synced = False
+                self.logger.warning(f"Position stream disabled: {e}")
+                return
+            except Exception as e:
+                self._positions_synced = False
+                self.logger.warning(f"Position stream error, reconnecting: {e}")
+                await asyncio.sleep(STREAM_RECONNECT_DELAY)
+                
+    def _stream_symbol(self, symbol: str) -> Optional[str]:
+        """Resolve a symbol to the unified key used by the stream caches"""
+        try:
+            return self._ws.market(symbol)['symbol']
+        except Exception:
+            return None
+            
+    @staticmethod
+    def _klines_weight(limit: int) -> int:
+        """Request weight of a klines call, which scales with the limit"""
+        if limit < 100:
+            return 1
+        if limit < 500:
+            return 2
+        if limit <= 1000:
+            return 5
+        return 10
+        
     async def close(self):
         """Close connections"""
-        pass  # ccxt doesn't require explicit closing
+        for task in self._stream_tasks:
+            task.cancel()
+        if self._stream_tasks:
+            await asyncio.gather(*self._stream_tasks, return_exceptions=True)
+            self._stream_tasks = []
+        if self._ws is not None:
+            await self._ws.close()
+            self._ws = None
+        self._positions_synced = False
+        # ccxt's sync client needs no explicit closing; just release the order workers
+        self._order_pool.shutdown(wait=False)
         
     async def test_connection(self):
         """Test API connection"""
@@ -87,29 +260,61 @@ class BinanceFuturesClient(BinanceClient):
             
     # Futures-specific methods
     
+    @retry_on_exchange_error
     def get_futures_balance(self) -> Dict:
         """Get futures account balance"""
         try:
+            self._bucket.acquire(5)
             balance = self.futures_exchange.fetch_balance()
-            self.logger.debug(f"Fetched futures balance: {balance}")
+            self.logger.debug("Fetched futures balance: %s", balance)
             return balance
         except Exception as e:
             self.logger.error(f"Failed to fetch futures balance: {e}")
             raise
             
+    @retry_on_exchange_error
     def get_futures_positions(self, symbol: Optional[str] = None) -> List[Dict]:
         """Get current futures positions"""
+        if self._positions_synced:
+            if symbol is None:
+                return list(self._positions.values())
+            position = self._positions.get(self._stream_symbol(symbol))
+            if position is not None:
+                return [position]
+                
         try:
+            self._bucket.acquire(5)
             positions = self.futures_exchange.fetch_positions(symbol)
-            self.logger.debug(f"Found {len(positions)} futures positions")
+            self.logger.debug("Found %d futures positions", len(positions))
             return positions
         except Exception as e:
             self.logger.error(f"Failed to fetch futures positions: {e}")
             raise
             
+    @retry_on_exchange_error
+    def _get_open_position(self, symbol: str) -> Optional[Dict]:
+        """Return the open position for one symbol, or None when it is flat
+        
+        Reads the position stream when it is live, otherwise asks the
+        position risk endpoint for just this symbol.
+        """
+        if self._positions_synced:
+            position = self._positions.get(self._stream_symbol(symbol))
+        else:
+            self._bucket.acquire(5)
+            # In hedge mode both sides are returned; take the one that is open
+            positions = self.futures_exchange.fetch_positions_risk([symbol])
+            position = next((p for p in positions if p.get('contracts')), None)
+            
+        if position is None or not position.get('contracts'):
+            return None
+        return position
+        
+    @retry_on_exchange_error
     def set_leverage(self, symbol: str, leverage: int) -> Dict:
         """Set leverage for a futures symbol"""
         try:
+            self._bucket.acquire(1)
             result = self.futures_exchange.set_leverage(leverage, symbol)
             self.logger.info(f"Set leverage to {leverage}x for {symbol}")
             return result
@@ -117,12 +322,20 @@ class BinanceFuturesClient(BinanceClient):
             self.logger.error(f"Failed to set leverage: {e}")
             raise
             
+    @retry_on_exchange_error
     def set_margin_mode(self, symbol: str, margin_mode: str = 'isolated') -> Dict:
         """Set margin mode (cross/isolated)"""
+        import ccxt
+        
         try:
+            self._bucket.acquire(1)
             result = self.futures_exchange.set_margin_mode(margin_mode, symbol)
             self.logger.info(f"Set margin mode to {margin_mode} for {symbol}")
             return result
+        except ccxt.MarginModeAlreadySet:
+            # Binance rejects a no-op change (-4046); the requested mode is already active
+            self.logger.debug("Margin mode already %s for %s", margin_mode, symbol)
+            return {}
         except Exception as e:
             self.logger.error(f"Failed to set margin mode: {e}")
             raise
@@ -138,6 +351,7 @@ class BinanceFuturesClient(BinanceClient):
                 params = {}
                 
             # Main order
+            self._bucket.acquire(1)
             order = self.futures_exchange.create_order(
                 symbol=symbol,
                 type=order_type,
@@ -149,33 +363,36 @@ class BinanceFuturesClient(BinanceClient):
             
             self.logger.info(f"Created futures {side} order for {amount} {symbol}")
             
-            # Create stop loss if specified
+            # Stop loss / take profit close the position on the opposite side
+            protective = {}
             if stop_loss:
-                sl_side = 'sell' if side == 'buy' else 'buy'
-                sl_order = self.futures_exchange.create_order(
-                    symbol=symbol,
-                    type='stop_market',
-                    side=sl_side,
-                    amount=amount,
-                    stopPrice=stop_loss,
-                    params={'stopPrice': stop_loss, 'workingType': 'MARK_PRICE'}
-                )
-                self.logger.info(f"Created stop loss at {stop_loss}")
-                order['stop_loss'] = sl_order
-                
-            # Create take profit if specified
+                protective['stop_loss'] = ('stop_market', stop_loss)
             if take_profit:
-                tp_side = 'sell' if side == 'buy' else 'buy'
-                tp_order = self.futures_exchange.create_order(
-                    symbol=symbol,
-                    type='take_profit_market',
-                    side=tp_side,
-                    amount=amount,
-                    stopPrice=take_profit,
-                    params={'stopPrice': take_profit, 'workingType': 'MARK_PRICE'}
+                protective['take_profit'] = ('take_profit_market', take_profit)
+                
+            # Submit SL and TP concurrently so they cost one round trip, not two
+            close_side = 'sell' if side == 'buy' else 'buy'
+            pending = {
+                key: self._order_pool.submit(
+                    self._create_protective_order, symbol, protective_type, close_side, amount, stop_price
                 )
-                self.logger.info(f"Created take profit at {take_profit}")
-                order['take_profit'] = tp_order
+                for key, (protective_type, stop_price) in protective.items()
+            }
+            errors = {}
+            for key, future in pending.items():
+                try:
+                    order[key] = future.result()
+                except Exception as e:
+                    errors[key] = e
+                    
+            if 'stop_loss' in errors:
+                # Never leave an entry without its stop loss; raises
+                # UnprotectedPositionException if the entry stays open
+                self._unwind_entry(symbol, order, order_type, close_side, amount,
+                                   errors['stop_loss'], order.get('take_profit'))
+                raise errors['stop_loss']
+            if 'take_profit' in errors:
+                self.logger.error(f"Take profit not placed for {symbol}, stop loss is active: {errors['take_profit']}")
                 
             return order
             
@@ -183,18 +400,106 @@ class BinanceFuturesClient(BinanceClient):
             self.logger.error(f"Failed to create futures order: {e}")
             raise
             
+    def create_futures_orders(self, orders: List[Dict]) -> List[Optional[Dict]]:
+        """Create several plain (non-conditional) futures orders via the batch endpoint
+        
+        Each order is a dict with symbol, type, side, amount, price and optional
+        params. Orders are sent BATCH_ORDER_LIMIT at a time, one round trip per
+        chunk. Results line up with ``orders``; rejected orders are None.
+        """
+        results: List[Optional[Dict]] = []
+        for start in range(0, len(orders), BATCH_ORDER_LIMIT):
+            chunk = orders[start:start + BATCH_ORDER_LIMIT]
+            try:
+                self._bucket.acquire(5)
+                created = self.futures_exchange.create_orders(chunk)
+            except Exception as e:
+                self.logger.error(f"Failed to create batch of {len(chunk)} futures orders: {e}")
+                results.extend([None] * len(chunk))
+                continue
+                
+            for order in created:
+                results.append(order if order.get('id') is not None else None)
+                
+        self.logger.info(f"Created {sum(1 for r in results if r is not None)}/{len(orders)} futures orders in batch")
+        return results
+        
+    def _create_protective_order(self, symbol: str, order_type: str, side: str,
+                                 amount: float, stop_price: float) -> Dict:
+        """Create a reduce-only, mark-price triggered stop order (stop loss / take profit)
+        
+        reduceOnly keeps a trigger from opening a reverse position once the
+        other leg has already closed the entry.
+        """
+        self._bucket.acquire(1)
+        order = self.futures_exchange.create_order(
+            symbol=symbol,
+            type=order_type,
+            side=side,
+            amount=amount,
+            params={'stopPrice': stop_price, 'workingType': 'MARK_PRICE', 'reduceOnly': True}
+        )
+        self.logger.info(f"Created {order_type} at {stop_price}")
+        return order
+        
+    def _unwind_entry(self, symbol: str, entry: Dict, order_type: str, close_side: str,
+                      amount: float, stop_loss_error: Exception,
+                      take_profit: Optional[Dict] = None):
+        """Cancel the take profit and undo the entry after the stop loss was rejected
+        
+        Market entries are closed reduce-only. Other entries are cancelled and
+        whatever part already filled is closed reduce-only. If any step fails
+        the entry may still be open without a stop loss, so
+        UnprotectedPositionException is raised instead of only logging.
+        """
+        import ccxt
+        
+        # Upper bound until the filled amount of a resting entry is known
+        open_amount = amount
+        try:
+            if take_profit is not None:
+                self._bucket.acquire(1)
+                self.futures_exchange.cancel_order(take_profit['id'], symbol)
+                
+            if order_type != 'market':
+                try:
+                    self._bucket.acquire(1)
+                    self.futures_exchange.cancel_order(entry['id'], symbol)
+                except ccxt.OrderNotFound:
+                    # Already filled (or gone); the fetch below tells how much
+                    pass
+                self._bucket.acquire(1)
+                open_amount = self.futures_exchange.fetch_order(entry['id'], symbol).get('filled') or 0
+                
+            if open_amount:
+                self._bucket.acquire(1)
+                self.futures_exchange.create_market_order(
+                    symbol, close_side, open_amount, params={'reduceOnly': True}
+                )
+            open_amount = 0
+            self.logger.warning(f"Unwound {symbol} entry after stop loss placement failed")
+        except Exception as e:
+            self.logger.critical(f"Failed to unwind {symbol} entry without stop loss: {e}")
+            raise UnprotectedPositionException(
+                symbol,
+                side='buy' if close_side == 'sell' else 'sell',
+                amount=open_amount,
+                order_id=entry.get('id'),
+                reason=str(stop_loss_error)
+            ) from e
+        
     def close_futures_position(self, symbol: str) -> Dict:
         """Close a futures position"""
         try:
-            positions = self.get_futures_positions(symbol)
-            if not positions:
+            position = self._get_open_position(symbol)
+            if position is None:
                 self.logger.warning(f"No position found for {symbol}")
                 return {'status': 'no_position'}
                 
-            position = positions[0]
             contracts = abs(position['contracts'])
             side = 'sell' if position['side'] == 'long' else 'buy'
             
+            self._bucket.acquire(1)
             order = self.futures_exchange.create_market_order(symbol, side, contracts)
             self.logger.info(f"Closed position for {symbol}")
             return order
@@ -203,21 +508,28 @@ class BinanceFuturesClient(BinanceClient):
             self.logger.error(f"Failed to close futures position: {e}")
             raise
             
+    @retry_on_exchange_error
     def get_funding_rate(self, symbol: str) -> Dict:
         """Get current funding rate"""
-        try:
+        def fetch():
+            self._bucket.acquire(1)
             funding = self.futures_exchange.fetch_funding_rate(symbol)
-            self.logger.debug(f"Funding rate for {symbol}: {funding}")
+            self.logger.debug("Funding rate for %s: %s", symbol, funding)
             return funding
+            
+        try:
+            return self.cache.get_or_load(('futures_funding', symbol), fetch, FUNDING_CACHE_TTL)
         except Exception as e:
             self.logger.error(f"Failed to fetch funding rate: {e}")
             raise
             
+    @retry_on_exchange_error
     def get_funding_history(self, symbol: str, limit: int = 100) -> List[Dict]:
         """Get funding rate history"""
         try:
+            self._bucket.acquire(1)
             history = self.futures_exchange.fetch_funding_rate_history(symbol, limit=limit)
-            self.logger.debug(f"Fetched {len(history)} funding rate records")
+            self.logger.debug("Fetched %d funding rate records", len(history))
             return history
         except Exception as e:
             self.logger.error(f"Failed to fetch funding history: {e}")
@@ -225,8 +537,13 @@ class BinanceFuturesClient(BinanceClient):
             
     def get_mark_price(self, symbol: str) -> float:
         """Get mark price for a symbol"""
+        if self._mark_prices:
+            mark_price = self._mark_prices.get(self._stream_symbol(symbol))
+            if mark_price is not None:
+                return mark_price
+                
         try:
-            ticker = self.futures_exchange.fetch_ticker(symbol)
+            ticker = self.get_futures_ticker(symbol)
             mark_price = ticker.get('info', {}).get('markPrice')
             if mark_price:
                 return float(mark_price)
@@ -235,14 +552,43 @@ class BinanceFuturesClient(BinanceClient):
             self.logger.error(f"Failed to fetch mark price: {e}")
             raise
             
+    @retry_on_exchange_error
+    def get_mark_prices(self, symbols: List[str]) -> Dict[str, float]:
+        """Get mark prices for several symbols, keyed by the symbols as passed in
+        
+        Prices come from the mark price stream when it is live; any missing
+        symbols are filled from a single premium index request.
+        """
+        prices = {}
+        missing = []
+        for symbol in symbols:
+            mark_price = self._mark_prices.get(self._stream_symbol(symbol)) if self._mark_prices else None
+            if mark_price is None:
+                missing.append(symbol)
+            else:
+                prices[symbol] = mark_price
+                
+        if missing:
+            try:
+                self._bucket.acquire(MARK_PRICES_WEIGHT)
+                ticks = self.futures_exchange.fetch_mark_prices(missing)
+                for symbol in missing:
+                    tick = ticks.get(self._futures_market(symbol)['symbol'])
+                    if tick is not None and tick.get('markPrice') is not None:
+                        prices[symbol] = tick['markPrice']
+            except Exception as e:
+                self.logger.error(f"Failed to fetch mark prices: {e}")
+                raise
+                
+        return prices
+        
     def get_liquidation_price(self, symbol: str) -> Optional[float]:
         """Get liquidation price for current position"""
         try:
-            positions = self.get_futures_positions(symbol)
-            if not positions:
+            position = self._get_open_position(symbol)
+            if position is None:
                 return None
                 
-            position = positions[0]
             return position.get('liquidationPrice')
             
         except Exception as e:
@@ -250,60 +596,145 @@ class BinanceFuturesClient(BinanceClient):
             return None
             
     def calculate_futures_position_size(self, symbol: str, capital: float, 
-                                      leverage: int, price: float) -> float:
-        """Calculate futures position size based on capital and leverage"""
+                                      leverage: int, price: float,
+                                      market: Optional[Dict] = None) -> float:
+        """Calculate futures position size based on capital and leverage
+        
+        Pass a pre-fetched market dict to skip the markets lookup.
+        """
         try:
-            market = self.futures_exchange.market(symbol)
+            contract_size, multiplier, min_contracts = self._sizing_params(symbol, market)
             
-            # Calculate notional value
-            notional = capital * leverage
-            
-            # Calculate contracts
-            contract_size = market.get('contractSize', 1)
-            contracts = notional / (price * contract_size)
-            
-            # Apply precision
-            precision = market.get('precision', {}).get('amount', 3)
-            contracts = round(contracts, precision)
+            # Contracts for the leveraged notional, rounded to the amount step
+            contracts = round(capital * leverage / (price * contract_size) * multiplier) / multiplier
             
             # Check minimum
-            min_contracts = market.get('limits', {}).get('amount', {}).get('min', 0.001)
-            contracts = max(contracts, min_contracts)
+            if contracts < min_contracts:
+                contracts = min_contracts
             
-            self.logger.debug(f"Calculated {contracts} contracts for {capital} capital at {leverage}x leverage")
+            self.logger.debug("Calculated %s contracts for %s capital at %sx leverage", contracts, capital, leverage)
             return contracts
             
         except Exception as e:
             self.logger.error(f"Failed to calculate futures position size: {e}")
             raise
             
+    def calculate_futures_position_sizes(self, symbol: str, capital: float, leverage: int,
+                                         prices: List[float],
+                                         market: Optional[Dict] = None) -> np.ndarray:
+        """Vectorised calculate_futures_position_size for many prices of one symbol
+        
+        Used for grids, where every level shares the capital, leverage and market limits.
+        """
+        contract_size, multiplier, min_contracts = self._sizing_params(symbol, market)
+        prices = np.asarray(prices, dtype=np.float64)
+        contracts = np.round(capital * leverage / (prices * contract_size) * multiplier) / multiplier
+        return np.maximum(contracts, min_contracts)
+        
+    def _futures_market(self, symbol: str) -> Dict:
+        """Resolve a futures market once per symbol instead of through ccxt's market() each call"""
+        market = self._futures_markets.get(symbol)
+        if market is None:
+            market = self.futures_exchange.market(symbol)
+            self._futures_markets[symbol] = market
+        return market
+        
+    def _sizing_params(self, symbol: str, market: Optional[Dict] = None) -> Tuple[float, float, float]:
+        """Return the cached (contract_size, amount_multiplier, min_contracts) for a symbol"""
+        params = self._sizing_cache.get(symbol)
+        if params is None:
+            if market is None:
+                market = self._futures_market(symbol)
+                
+            # ccxt reports amount precision either as decimal places or as a
+            # step size (Binance uses the latter); both become a multiplier
+            precision = market.get('precision', {}).get('amount')
+            if precision is None:
+                precision = 3
+            if isinstance(precision, int):
+                multiplier = float(10 ** precision)
+            else:
+                multiplier = 1 / precision
+                
+            params = (
+                market.get('contractSize', 1),
+                multiplier,
+                market.get('limits', {}).get('amount', {}).get('min', 0.001),
+            )
+            self._sizing_cache[symbol] = params
+        return params
+        
     def get_max_leverage(self, symbol: str) -> int:
         """Get maximum allowed leverage for a symbol"""
         try:
-            market = self.futures_exchange.market(symbol)
+            market = self._futures_market(symbol)
             max_leverage = market.get('info', {}).get('maxLeverage', 20)
             return int(max_leverage)
         except Exception as e:
             self.logger.error(f"Failed to get max leverage: {e}")
             return 20  # Default max leverage
             
+    @retry_on_exchange_error
+    def get_futures_tickers(self, symbols: List[str]) -> Dict[str, Dict]:
+        """Get futures tickers for several symbols, keyed by the symbols as passed in
+        
+        Uncached symbols are fetched with one all-symbols request instead of a
+        fetch_ticker each. That request costs TICKERS_WEIGHT, so prefer it for
+        fan-out refreshes over a per-symbol loop; results also refresh the
+        get_futures_ticker cache.
+        """
+        tickers = {}
+        missing = []
+        for symbol in symbols:
+            ticker = self.cache.get(('futures_ticker', symbol))
+            if ticker is None:
+                missing.append(symbol)
+            else:
+                tickers[symbol] = ticker
+                
+        if missing:
+            try:
+                self._bucket.acquire(TICKERS_WEIGHT)
+                fetched = self.futures_exchange.fetch_tickers(missing)
+                for symbol in missing:
+                    ticker = fetched.get(self._futures_market(symbol)['symbol'])
+                    if ticker is not None:
+                        tickers[symbol] = ticker
+                        self.cache.set(('futures_ticker', symbol), ticker, TICKER_CACHE_TTL)
+            except Exception as e:
+                self.logger.error(f"Failed to fetch futures tickers: {e}")
+                raise
+                
+        return tickers
+        
+    @retry_on_exchange_error
     def get_futures_ticker(self, symbol: str) -> Dict:
         """Get futures ticker information"""
+        def fetch():
+            self._bucket.acquire(1)
+            return self.futures_exchange.fetch_ticker(symbol)
+            
         try:
-            ticker = self.futures_exchange.fetch_ticker(symbol)
-            return ticker
+            return self.cache.get_or_load(('futures_ticker', symbol), fetch, TICKER_CACHE_TTL)
         except Exception as e:
             self.logger.error(f"Failed to fetch futures ticker: {e}")
             raise
             
+    @retry_on_exchange_error
     def get_futures_ohlcv(self, symbol: str, timeframe: str = '1m', limit: int = 100) -> pd.DataFrame:
         """Get futures OHLCV data"""
         try:
-            ohlcv = self.futures_exchange.fetch_ohlcv(symbol, timeframe, limit=limit)
-            df = pd.DataFrame(ohlcv, columns=['timestamp', 'open', 'high', 'low', 'close', 'volume'])
-            df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
-            df.set_index('timestamp', inplace=True)
-            self.logger.debug(f"Fetched {len(df)} futures candles for {symbol}")
+            def fetch():
+                self._bucket.acquire(self._klines_weight(limit))
+                return self.futures_exchange.fetch_ohlcv(symbol, timeframe, limit=limit)
+                
+            ohlcv = self.cache.get_or_load(
+                ('futures_ohlcv', symbol, timeframe, limit),
+                fetch,
+                OHLCV_CACHE_TTL if limit <= OHLCV_CACHE_MAX_LIMIT else 0
+            )
+            df = ohlcv_to_dataframe(ohlcv)
+            self.logger.debug("Fetched %d futures candles for %s", len(df), symbol)
             return df
         except Exception as e:
             self.logger.error(f"Failed to fetch futures OHLCV: {e}")
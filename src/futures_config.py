@@ -1,15 +1,113 @@
 """
 Extended Configuration for Futures Trading
 """
+import copy
 import os
-import json
-from typing import Dict, Any, Optional
+from types import MappingProxyType
+from typing import Dict, Any, Optional, Tuple
 from dotenv import load_dotenv
 from .config import Config
 
+try:
+    import orjson
+    
+    def _loads(data: bytes) -> Dict[str, Any]:
+        return orjson.loads(data)
+    
+    def _dumps(obj: Dict[str, Any]) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:  # fall back to the stdlib parser when orjson is unavailable
+    import json
+    
+    def _loads(data: bytes) -> Dict[str, Any]:
+        return json.loads(data)
+    
+    def _dumps(obj: Dict[str, Any]) -> bytes:
+        return json.dumps(obj, indent=2).encode()
+
 # Load environment variables
 load_dotenv()
 
+# Default futures strategy settings used when no config file exists (copied per FuturesConfig)
+_DEFAULT_FUTURES_STRATEGIES = MappingProxyType({
+    "funding_arbitrage": {
+        "enabled": True,
+        "min_funding_rate": 0.01,  # 1% minimum to enter
+        "funding_threshold": 0.005,  # 0.5% threshold
+        "max_position_size": 0.3,  # 30% of capital
+        "hedge_ratio": 1.0,  # 1:1 hedge with spot
+        "exit_threshold": 0.001,  # 0.1% to exit
+        "leverage": 2,  # Conservative leverage
+        "rebalance_threshold": 0.05  # 5% price deviation
+    },
+    "grid_trading": {
+        "enabled": True,
+        "grid_levels": 10,  # Number of grid levels
+        "grid_spacing": 0.002,  # 0.2% between levels
+        "grid_size_pct": 0.1,  # 10% of capital per grid
+        "leverage": 3,
+        "use_dynamic_range": True,
+        "range_period": 24,  # Hours for range calculation
+        "range_multiplier": 1.5,  # ATR multiplier
+        "stop_loss_pct": 0.05,  # 5% stop loss
+        "auto_adjust": True  # Auto adjust grid on breakout
+    },
+    "long_short_switching": {
+        "enabled": True,
+        "fast_ma_period": 20,
+        "slow_ma_period": 50,
+        "trend_strength_period": 14,  # ADX period
+        "timeframes": ["15m", "1h", "4h"],
+        "timeframe_weights": [0.3, 0.4, 0.3],
+        "leverage": 5,
+        "position_size_pct": 0.3,  # 30% of capital
+        "stop_loss_pct": 0.02,  # 2%
+        "take_profit_pct": 0.06,  # 6%
+        "trailing_stop_pct": 0.015,  # 1.5%
+        "min_trend_strength": 0.6,
+        "volume_confirmation": True,
+        "use_momentum_filter": True
+    },
+    "volatility_breakout": {
+        "enabled": True,
+        "bb_period": 20,  # Bollinger Bands period
+        "bb_std": 2.0,  # Standard deviations
+        "atr_period": 14,
+        "volatility_lookback": 50,
+        "squeeze_threshold": 0.015,  # 1.5% BB width
+        "min_squeeze_bars": 5,  # Minimum squeeze duration
+        "volume_multiplier": 1.5,  # Volume confirmation
+        "momentum_threshold": 60,  # RSI threshold
+        "breakout_candle_size": 1.5,  # x ATR
+        "leverage": 10,  # Higher leverage for breakouts
+        "position_size_pct": 0.2,  # 20% of capital
+        "stop_loss_atr": 1.5,  # 1.5x ATR stop
+        "take_profit_atr": 3.0,  # 3x ATR target
+        "time_stop_hours": 24  # Exit if no profit after 24h
+    }
+})
+
+# Parsed config files keyed by path, reused while (mtime, size) is unchanged
+_CONFIG_CACHE: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+
+
+def _read_config_file(path: str) -> Optional[Dict[str, Any]]:
+    """Parse a JSON config file, skipping the parse if it has not changed"""
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+        
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    cached = _CONFIG_CACHE.get(path)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+        
+    with open(path, 'rb') as f:
+        config_data = _loads(f.read())
+    _CONFIG_CACHE[path] = (stamp, config_data)
+    return config_data
+
 
 class FuturesConfig(Config):
     """Extended configuration for futures trading"""
@@ -51,70 +149,20 @@ class FuturesConfig(Config):
         # Strategy defaults
         self.default_futures_strategy = os.getenv('DEFAULT_FUTURES_STRATEGY', 'funding_arbitrage')
         
+        # Connection settings
+        self.max_inflight_requests = int(os.getenv('MAX_INFLIGHT_REQUESTS', '20'))  # concurrent REST calls
+        
     def _load_futures_config(self):
         """Load futures configuration from file"""
-        if os.path.exists(self.futures_config_file):
-            with open(self.futures_config_file, 'r') as f:
-                config_data = json.load(f)
-                self.futures_strategies = config_data.get('futures_strategies', {})
+        config_data = _read_config_file(self.futures_config_file)
+        if config_data is not None:
+            # Per-instance deep copies so updates (including nested lists)
+            # do not leak into the shared cache
+            self.futures_strategies = copy.deepcopy(config_data.get('futures_strategies', {}))
         else:
             # Default futures strategies configuration
             self.futures_strategies = {
-                "funding_arbitrage": {
-                    "enabled": True,
-                    "min_funding_rate": 0.01,  # 1% minimum to enter
-                    "funding_threshold": 0.005,  # 0.5% threshold
-                    "max_position_size": 0.3,  # 30% of capital
-                    "hedge_ratio": 1.0,  # 1:1 hedge with spot
-                    "exit_threshold": 0.001,  # 0.1% to exit
-                    "leverage": 2,  # Conservative leverage
-                    "rebalance_threshold": 0.05  # 5% price deviation
-                },
-                "grid_trading": {
-                    "enabled": True,
-                    "grid_levels": 10,  # Number of grid levels
-                    "grid_spacing": 0.002,  # 0.2% between levels
-                    "grid_size_pct": 0.1,  # 10% of capital per grid
-                    "leverage": 3,
-                    "use_dynamic_range": True,
-                    "range_period": 24,  # Hours for range calculation
-                    "range_multiplier": 1.5,  # ATR multiplier
-                    "stop_loss_pct": 0.05,  # 5% stop loss
-                    "auto_adjust": True  # Auto adjust grid on breakout
-                },
-                "long_short_switching": {
-                    "enabled": True,
-                    "fast_ma_period": 20,
-                    "slow_ma_period": 50,
-                    "trend_strength_period": 14,  # ADX period
-                    "timeframes": ["15m", "1h", "4h"],
-                    "timeframe_weights": [0.3, 0.4, 0.3],
-                    "leverage": 5,
-                    "position_size_pct": 0.3,  # 30% of capital
-                    "stop_loss_pct": 0.02,  # 2%
-                    "take_profit_pct": 0.06,  # 6%
-                    "trailing_stop_pct": 0.015,  # 1.5%
-                    "min_trend_strength": 0.6,
-                    "volume_confirmation": True,
-                    "use_momentum_filter": True
-                },
-                "volatility_breakout": {
-                    "enabled": True,
-                    "bb_period": 20,  # Bollinger Bands period
-                    "bb_std": 2.0,  # Standard deviations
-                    "atr_period": 14,
-                    "volatility_lookback": 50,
-                    "squeeze_threshold": 0.015,  # 1.5% BB width
-                    "min_squeeze_bars": 5,  # Minimum squeeze duration
-                    "volume_multiplier": 1.5,  # Volume confirmation
-                    "momentum_threshold": 60,  # RSI threshold
-                    "breakout_candle_size": 1.5,  # x ATR
-                    "leverage": 10,  # Higher leverage for breakouts
-                    "position_size_pct": 0.2,  # 20% of capital
-                    "stop_loss_atr": 1.5,  # 1.5x ATR stop
-                    "take_profit_atr": 3.0,  # 3x ATR target
-                    "time_stop_hours": 24  # Exit if no profit after 24h
-                }
+                name: copy.deepcopy(params) for name, params in _DEFAULT_FUTURES_STRATEGIES.items()
             }
             
     def get_futures_strategy_config(self, strategy_name: str) -> Dict[str, Any]:
@@ -146,8 +194,8 @@ class FuturesConfig(Config):
             }
         }
         
-        with open(self.futures_config_file, 'w') as f:
-            json.dump(config_data, f, indent=2)
+        with open(self.futures_config_file, 'wb') as f:
+            f.write(_dumps(config_data))
             
     def validate_leverage(self, leverage: int) -> int:
         """Validate and constrain leverage"""
@@ -197,6 +245,9 @@ HEDGE_MODE=false
 
 # Default strategy
 DEFAULT_FUTURES_STRATEGY=funding_arbitrage
+
+# Maximum concurrent REST requests to Binance
+MAX_INFLIGHT_REQUESTS=20
 """
         
         with open('.env.futures.example', 'w') as f:
@@ -207,4 +258,11 @@ DEFAULT_FUTURES_STRATEGY=funding_arbitrage
     def create_example_config_file(self):
         """Create example futures config file"""
         self.save_futures_config()
-        print(f"Created {self.futures_config_file} with default configuration")
\ No newline at end of file
+        print(f"Created {self.futures_config_file} with default configuration")
+        
+    def ensure_example_files(self):
+        """Create the example env/config files if they don't exist yet"""
+        if not os.path.exists('.env.futures.example'):
+            self.create_example_env_file()
+        if not os.path.exists(self.futures_config_file):
+            self.create_example_config_file()
\ No newline at end of file
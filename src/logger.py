@@ -1,11 +1,78 @@
+import atexit
 import logging
 import os
-from logging.handlers import RotatingFileHandler
-from datetime import datetime
+import queue
+import sys
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener, TimedRotatingFileHandler
+from typing import Optional
+
+try:
+    import orjson
+    
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj, default=str).decode()
+except ImportError:  # fall back to the stdlib encoder when orjson is unavailable
+    import json
+    
+    def _dumps(obj) -> str:
+        return json.dumps(obj, default=str, ensure_ascii=False)
+
+# Attributes every LogRecord has; anything else was passed via ``extra``
+_RECORD_ATTRS = frozenset(vars(logging.makeLogRecord({}))) | {'message', 'asctime'}
+
+# Process-wide queue, file handler and listener shared by every configured
+# logger; two handlers on the same file would clobber each other at rollover
+_log_queue: Optional[queue.SimpleQueue] = None
+_file_handler: Optional[TimedRotatingFileHandler] = None
+_listener: Optional[QueueListener] = None
+
+
+class JsonFormatter(logging.Formatter):
+    """Emit one JSON object per log record
+    
+    Fields passed through ``extra`` (e.g. ``extra={"component": "Exchange"}``)
+    are added as top-level keys, so callers can log structured context
+    without building the message string themselves.
+    """
+    
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            'ts': record.created,
+            'lvl': record.levelname,
+            'logger': record.name,
+            'msg': record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRS:
+                entry[key] = value
+        if record.exc_info:
+            entry['exc'] = self.formatException(record.exc_info)
+        return _dumps(entry)
+
+
+_DETAILED_FORMATTER = logging.Formatter(
+    '%(asctime)s - %(name)s - %(levelname)s - %(module)s:%(lineno)d - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+
+_SIMPLE_FORMATTER = logging.Formatter(
+    '%(asctime)s - %(levelname)s - %(message)s',
+    datefmt='%H:%M:%S'
+)
+
 
 def setup_logger(name: str = 'autoCoin', log_level: str = 'INFO') -> logging.Logger:
-    """Set up logger with file and console handlers"""
+    """Set up logger with file and console handlers
+    
+    The file handler writes JSON lines when the ``LOG_FORMAT=json``
+    environment variable is set; the format is fixed for the whole process
+    when the shared file handler is created.
     
+    The logger itself only enqueues records; a single QueueListener thread
+    per process runs the file and console handlers, so disk writes and
+    rotation never block the event loop and only one handler owns the file.
+    """
     # Create logger
     logger = logging.getLogger(name)
     logger.setLevel(getattr(logging, log_level.upper()))
@@ -13,43 +80,69 @@ def setup_logger(name: str = 'autoCoin', log_level: str = 'INFO') -> logging.Log
     # Remove existing handlers to avoid duplicates
     logger.handlers = []
     
-    # Create logs directory if it doesn't exist
-    os.makedirs('logs', exist_ok=True)
+    # Only the queue handler runs on the caller's thread
+    logger.addHandler(QueueHandler(_shared_queue()))
     
-    # Create formatters
-    detailed_formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(module)s:%(lineno)d - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
+    return logger
+
+
+def _shared_queue() -> queue.SimpleQueue:
+    """Create the process-wide file/console listener on first use"""
+    global _log_queue, _file_handler, _listener
+    if _log_queue is not None:
+        return _log_queue
     
-    simple_formatter = logging.Formatter(
-        '%(asctime)s - %(levelname)s - %(message)s',
-        datefmt='%H:%M:%S'
-    )
+    # Create logs directory if it doesn't exist
+    os.makedirs('logs', exist_ok=True)
     
-    # File handler with rotation
-    file_handler = RotatingFileHandler(
-        f'logs/autocoin_{datetime.now().strftime("%Y%m%d")}.log',
-        maxBytes=10*1024*1024,  # 10MB
-        backupCount=30
+    # File handler rotated at midnight; the file is opened on the first record
+    _file_handler = TimedRotatingFileHandler(
+        'logs/autocoin.log',
+        when='midnight',
+        backupCount=30,
+        delay=True,
+        encoding='utf-8'
     )
-    file_handler.setLevel(logging.DEBUG)
-    file_handler.setFormatter(detailed_formatter)
+    _file_handler.setLevel(logging.DEBUG)
+    json_format = os.getenv('LOG_FORMAT', '').lower() == 'json'
+    _file_handler.setFormatter(JsonFormatter() if json_format else _DETAILED_FORMATTER)
     
     # Console handler
     console_handler = logging.StreamHandler()
     console_handler.setLevel(logging.INFO)
-    console_handler.setFormatter(simple_formatter)
-    
-    # Add handlers to logger
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
+    console_handler.setFormatter(_SIMPLE_FORMATTER)
     
-    return logger
+    _log_queue = queue.SimpleQueue()
+    _listener = QueueListener(_log_queue, _file_handler, console_handler, respect_handler_level=True)
+    _listener.start()
+    return _log_queue
+
+
+@atexit.register
+def _stop_listener():
+    """Flush queued records before the interpreter exits"""
+    if _listener is not None:
+        _listener.stop()
+
+@lru_cache(maxsize=None)
+def _main_logger() -> logging.Logger:
+    """Configure the shared ``autoCoin`` logger on first use"""
+    return setup_logger()
 
+
+@lru_cache(maxsize=None)
 def get_logger(name: str) -> logging.Logger:
-    """Get a logger instance"""
-    return logging.getLogger(f'autoCoin.{name}')
+    """Get a logger instance
+    
+    The parent ``autoCoin`` logger is set up on the first call rather than at
+    import, so importing this module opens no files.
+    """
+    _main_logger()
+    return logging.getLogger(sys.intern(f'autoCoin.{name}'))
+
 
-# Create main logger instance
-main_logger = setup_logger()
\ No newline at end of file
+def __getattr__(name: str):
+    # Keep ``from src.logger import main_logger`` working without eager setup
+    if name == 'main_logger':
+        return _main_logger()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
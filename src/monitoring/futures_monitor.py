@@ -3,10 +3,15 @@ Futures Trading Monitor
 Real-time monitoring and alerting for futures positions
 """
 import asyncio
-from typing import Dict, List, Optional, Tuple
-from datetime import datetime, timedelta
+import heapq
+import time
+from collections import OrderedDict
+from types import SimpleNamespace
+from typing import Callable, Dict, List, Optional, Tuple
+from datetime import datetime
 import json
 from dataclasses import asdict
+import numpy as np
 
 from ..exchange.binance_futures_client import BinanceFuturesClient
 from ..trading.futures_position_manager import FuturesPositionManager
@@ -17,6 +22,31 @@ from .prometheus_metrics import PrometheusMetrics
 
 logger = get_logger('futures_monitor')
 
+# Performance samples kept in the ring buffer (24 hours at 5 minute intervals)
+PERFORMANCE_HISTORY_SIZE = 288
+
+# Alert message templates, formatted only when an alert actually fires
+ALERT_LARGE_POSITION = "Large position alert for {}: {:.1f}x of margin"
+ALERT_LARGE_LOSS = "Large loss alert for {}: {:.2f}%"
+ALERT_OVERLEVERAGED = "Account overleveraged! Margin level: {:.1f}%"
+ALERT_HIGH_MARGIN_USAGE = "High margin usage: {:.1f}%"
+ALERT_TOO_MANY_POSITIONS = "Too many open positions: {}"
+ALERT_LIQUIDATION_RISK = "{}: {} liquidation risk - Distance: {:.2f}%"
+ALERT_HIGH_FUNDING = "High funding rate for {}: {:.4%} (Annual: {:.2f}%)"
+ALERT_NEGATIVE_FUNDING = "Negative funding rate for {}: {:.4%} (Annual: {:.2f}%)"
+ALERT_DAILY_LOSS_LIMIT = "Daily loss limit reached: ${:,.2f}"
+ALERT_LOW_WIN_RATE = "Low win rate: {:.1%}"
+
+# One packed row per performance sample
+PERFORMANCE_DTYPE = np.dtype([
+    ('timestamp_ns', 'i8'),
+    ('total_pnl', 'f8'),
+    ('period_pnl', 'f8'),
+    ('daily_pnl', 'f8'),
+    ('current_leverage', 'f8'),
+    ('win_rate', 'f8'),
+])
+
 
 class FuturesMonitor:
     """Comprehensive monitoring for futures trading"""
@@ -27,12 +57,19 @@ class FuturesMonitor:
         self.futures_client = futures_client
         self.position_manager = position_manager
         self.prometheus_metrics = prometheus_metrics
+        if prometheus_metrics is None:
+            # Exporters become no-ops, so callers need no per-call check
+            self._export_position_metrics = lambda position: None
+            self._export_risk_metrics = lambda risk_metrics: None
+            self._export_performance_metrics = lambda performance: None
+            self._evict_position_metrics = lambda: None
         
         # Monitoring configuration
         self.position_update_interval = 5  # seconds
         self.risk_check_interval = 30  # seconds
         self.funding_check_interval = 3600  # 1 hour
         self.performance_update_interval = 300  # 5 minutes
+        self.alert_cleanup_interval = 60  # 1 minute
         
         # Alert thresholds
         self.liquidation_warning_distance = 0.1  # 10% from liquidation
@@ -41,15 +78,39 @@ class FuturesMonitor:
         self.position_size_limit = 0.5  # 50% of capital per position
         
         # State tracking
-        self.alerts_sent: Dict[str, datetime] = {}
-        self.alert_cooldown = timedelta(minutes=15)
+        # alert_id -> monotonic send time, oldest first, so expiry only looks at the head
+        self.alerts_sent: "OrderedDict[str, float]" = OrderedDict()
+        self.alert_cooldown = 15 * 60  # seconds
         self.daily_pnl_start = 0
-        self.performance_history: List[Dict] = []
+        # Ring buffer of performance samples; _hist_cursor is the next slot to write
+        self._hist = np.zeros(PERFORMANCE_HISTORY_SIZE, dtype=PERFORMANCE_DTYPE)
+        self._hist_cursor = 0
+        self._hist_len = 0
+        # Running aggregates kept up to date by _record_performance
+        self._pnl_peak = 0.0
+        self._max_drawdown = 0.0
+        self._lev_sum = 0.0
+        self._latest_performance: Optional[Dict] = None
+        
+        # Shared exchange snapshot, reused for one position update interval
+        self._snap: Optional[SimpleNamespace] = None
+        self._snap_ts = 0.0
+        self._snap_lock = asyncio.Lock()
+        
+        # Set by the position manager on fills and closes to pull position/risk checks forward
+        self._position_changed = asyncio.Event()
+        self.position_manager.add_change_listener(self.notify_position_changed)
+        
+        # (symbol, side) -> (size, pnl, margin) gauge children, so labels() runs once per position
+        self._child_cache: Dict[Tuple[str, str], Tuple] = {}
         
         # Monitoring tasks
         self._monitoring_tasks: List[asyncio.Task] = []
         self.is_monitoring = False
         
+        # Listeners woken on position changes and alerts
+        self._state_listeners: List[Callable[[], None]] = []
+        
         logger.info("Futures monitor initialized")
         
     async def start_monitoring(self):
@@ -64,13 +125,9 @@ class FuturesMonitor:
         # Initialize daily PnL tracking
         await self._initialize_daily_tracking()
         
-        # Create monitoring tasks
+        # One scheduler task drives all monitoring jobs
         self._monitoring_tasks = [
-            asyncio.create_task(self._position_monitoring_loop()),
-            asyncio.create_task(self._risk_monitoring_loop()),
-            asyncio.create_task(self._funding_monitoring_loop()),
-            asyncio.create_task(self._performance_monitoring_loop()),
-            asyncio.create_task(self._alert_monitoring_loop())
+            asyncio.create_task(self._scheduler_loop())
         ]
         
         logger.info("Futures monitoring started")
@@ -90,124 +147,205 @@ class FuturesMonitor:
         
         logger.info("Futures monitoring stopped")
         
-    async def _position_monitoring_loop(self):
-        """Monitor position changes and updates"""
-        logger.info("Position monitoring started")
+    async def _scheduler_loop(self):
+        """Run every monitoring job from one task, driven by a min-heap of due times
+        
+        Jobs read positions and risk metrics through the shared snapshot. A
+        position change wakes the loop early and makes the position and risk
+        checks due immediately.
+        """
+        logger.info("Monitoring scheduler started")
+        loop = asyncio.get_running_loop()
+        
+        # (due, order, interval, job); order breaks ties so positions refresh first
+        jobs = [
+            (self.position_update_interval, self._run_position_checks),
+            (self.risk_check_interval, self._run_risk_checks),
+            (self.funding_check_interval, self._run_funding_checks),
+            (self.performance_update_interval, self._run_performance_update),
+            (self.alert_cleanup_interval, self._run_alert_cleanup),
+        ]
+        start = loop.time()
+        schedule = [(start, order, interval, job) for order, (interval, job) in enumerate(jobs)]
+        heapq.heapify(schedule)
+        on_change = {self._run_position_checks, self._run_risk_checks}
         
         while self.is_monitoring:
-            try:
-                # Update positions
-                await self.position_manager.update_positions()
-                
-                # Export metrics if available
-                if self.prometheus_metrics:
-                    for symbol, position in self.position_manager.positions.items():
-                        self._export_position_metrics(position)
-                        
-                # Check for position-specific alerts
-                await self._check_position_alerts()
+            delay = schedule[0][0] - loop.time()
+            if delay > 0:
+                try:
+                    await asyncio.wait_for(self._position_changed.wait(), delay)
+                except asyncio.TimeoutError:
+                    pass
+                    
+            now = loop.time()
+            if self._position_changed.is_set():
+                self._position_changed.clear()
+                self._snap = None
+                schedule = [
+                    (min(due, now) if job in on_change else due, order, interval, job)
+                    for due, order, interval, job in schedule
+                ]
+                heapq.heapify(schedule)
                 
-            except Exception as e:
-                logger.error(f"Position monitoring error: {e}")
+            while schedule[0][0] <= now:
+                due, order, interval, job = heapq.heappop(schedule)
+                await job()
+                # Keep the cadence, but skip missed slots rather than bursting to catch up
+                next_due = due + interval
+                if next_due <= now:
+                    next_due = now + interval
+                heapq.heappush(schedule, (next_due, order, interval, job))
                 
-            await asyncio.sleep(self.position_update_interval)
-            
-    async def _risk_monitoring_loop(self):
-        """Monitor overall risk metrics"""
-        logger.info("Risk monitoring started")
+    async def _snapshot(self) -> SimpleNamespace:
+        """Position arrays, summary, risk metrics and liquidation risk from one exchange round-trip
         
-        while self.is_monitoring:
-            try:
-                # Get risk metrics
-                risk_metrics = await self.position_manager.get_risk_metrics()
+        The snapshot is reused for ``position_update_interval`` seconds, so jobs
+        that run close together share one set of position and balance fetches.
+        """
+        if self._snap is not None and time.monotonic() - self._snap_ts < self.position_update_interval:
+            return self._snap
+            
+        async with self._snap_lock:
+            # Another job may have refreshed the snapshot while we waited
+            now = time.monotonic()
+            if self._snap is not None and now - self._snap_ts < self.position_update_interval:
+                return self._snap
                 
-                # Export metrics
-                if self.prometheus_metrics:
-                    self._export_risk_metrics(risk_metrics)
-                    
-                # Check risk alerts
-                await self._check_risk_alerts(risk_metrics)
+            await self.position_manager.update_positions()
+            
+            # One pass over the positions builds the alert arrays and summary totals
+            # and exports the per-position gauges
+            count = len(self.position_manager.positions)
+            symbols: List[str] = []
+            notional = np.empty(count)
+            margin = np.empty(count)
+            pnl_percentage = np.empty(count)
+            total_pnl = 0.0
+            for i, (symbol, position, size, used_margin, pnl_pct) in enumerate(
+                self.position_manager.iter_snapshot()
+            ):
+                symbols.append(symbol)
+                notional[i] = size
+                margin[i] = used_margin
+                pnl_percentage[i] = pnl_pct
+                total_pnl += position.unrealized_pnl
+                self._export_position_metrics(position)
                 
-                # Check liquidation risks
-                at_risk = await self.position_manager.check_liquidation_risk()
-                await self._check_liquidation_alerts(at_risk)
+            # Positions can close between monitor ticks (close_position refreshes
+            # them before notifying), so drop stale series on every rebuild
+            self._evict_position_metrics()
                 
-            except Exception as e:
-                logger.error(f"Risk monitoring error: {e}")
+            self._snap = SimpleNamespace(
+                symbols=symbols,
+                notional=notional,
+                margin=margin,
+                pnl_percentage=pnl_percentage,
+                summary={
+                    'count': count,
+                    'total_notional': float(notional.sum()),
+                    'total_pnl': total_pnl
+                },
+                risk_metrics=await self.position_manager.get_risk_metrics(),
+                at_risk=await self.position_manager.check_liquidation_risk()
+            )
+            self._snap_ts = now
+            return self._snap
+            
+    async def _run_position_checks(self):
+        """Monitor position changes and updates"""
+        try:
+            # Update positions; the snapshot pass also exports position metrics
+            previous = {s: p.contracts for s, p in self.position_manager.positions.items()}
+            snapshot = await self._snapshot()
+            current = {s: p.contracts for s, p in self.position_manager.positions.items()}
+            if current != previous:
+                self._notify_state_change()
+                    
+            # Check for position-specific alerts
+            await self._check_position_alerts(snapshot)
+            
+        except Exception as e:
+            logger.error("Position monitoring error: %s", e)
+            
+    async def _run_risk_checks(self):
+        """Monitor overall risk metrics"""
+        try:
+            # Get risk metrics
+            snapshot = await self._snapshot()
+            risk_metrics = snapshot.risk_metrics
+            
+            # Export metrics
+            self._export_risk_metrics(risk_metrics)
                 
-            await asyncio.sleep(self.risk_check_interval)
+            # Check risk alerts
+            await self._check_risk_alerts(risk_metrics)
+            
+            # Check liquidation risks
+            await self._check_liquidation_alerts(snapshot.at_risk)
             
-    async def _funding_monitoring_loop(self):
+        except Exception as e:
+            logger.error("Risk monitoring error: %s", e)
+            
+    async def _run_funding_checks(self):
         """Monitor funding rates"""
-        logger.info("Funding monitoring started")
-        
-        while self.is_monitoring:
-            try:
-                # Check funding for all positions
-                for symbol in self.position_manager.positions:
-                    funding = await self.position_manager.get_funding_rate(symbol)
+        try:
+            # Fetch funding for all positions concurrently
+            symbols = list(self.position_manager.positions)
+            fundings = await asyncio.gather(
+                *(self.position_manager.get_funding_rate(symbol) for symbol in symbols),
+                return_exceptions=True
+            )
+            
+            for symbol, funding in zip(symbols, fundings):
+                if isinstance(funding, Exception):
+                    logger.error("Funding fetch failed for %s: %s", symbol, funding)
+                    continue
                     
-                    if funding:
-                        # Export metrics
-                        if self.prometheus_metrics:
-                            self.prometheus_metrics.funding_rate.labels(
-                                symbol=symbol
-                            ).set(funding.rate)
-                            
-                        # Check for high funding
-                        await self._check_funding_alerts(symbol, funding)
+                if funding:
+                    # Export metrics
+                    if self.prometheus_metrics:
+                        self.prometheus_metrics.funding_rate.labels(
+                            symbol=symbol
+                        ).set(funding.rate)
                         
-            except Exception as e:
-                logger.error(f"Funding monitoring error: {e}")
-                
-            await asyncio.sleep(self.funding_check_interval)
+                    # Check for high funding
+                    await self._check_funding_alerts(symbol, funding)
+                    
+        except Exception as e:
+            logger.error("Funding monitoring error: %s", e)
             
-    async def _performance_monitoring_loop(self):
+    async def _run_performance_update(self):
         """Monitor trading performance"""
-        logger.info("Performance monitoring started")
-        
-        while self.is_monitoring:
-            try:
-                # Calculate performance metrics
-                performance = await self._calculate_performance()
-                
-                # Store in history
-                self.performance_history.append(performance)
-                if len(self.performance_history) > 288:  # Keep 24 hours at 5min intervals
-                    self.performance_history.pop(0)
-                    
-                # Export metrics
-                if self.prometheus_metrics:
-                    self._export_performance_metrics(performance)
-                    
-                # Check performance alerts
-                await self._check_performance_alerts(performance)
+        try:
+            # Calculate performance metrics
+            performance = await self._calculate_performance()
+            
+            # Store in history
+            self._record_performance(performance)
                 
-            except Exception as e:
-                logger.error(f"Performance monitoring error: {e}")
+            # Export metrics
+            self._export_performance_metrics(performance)
                 
-            await asyncio.sleep(self.performance_update_interval)
+            # Check performance alerts
+            await self._check_performance_alerts(performance)
+            
+        except Exception as e:
+            logger.error("Performance monitoring error: %s", e)
             
-    async def _alert_monitoring_loop(self):
+    async def _run_alert_cleanup(self):
         """Monitor and manage alerts"""
-        logger.info("Alert monitoring started")
-        
-        while self.is_monitoring:
-            try:
-                # Clean up old alerts
-                current_time = datetime.now()
-                expired_alerts = [
-                    alert_id for alert_id, sent_time in self.alerts_sent.items()
-                    if current_time - sent_time > self.alert_cooldown
-                ]
-                
-                for alert_id in expired_alerts:
-                    del self.alerts_sent[alert_id]
-                    
-            except Exception as e:
-                logger.error(f"Alert monitoring error: {e}")
+        try:
+            # Clean up old alerts; entries are in send order, so stop at the first live one
+            now = time.monotonic()
+            while self.alerts_sent:
+                sent_time = next(iter(self.alerts_sent.values()))
+                if now - sent_time <= self.alert_cooldown:
+                    break
+                self.alerts_sent.popitem(last=False)
                 
-            await asyncio.sleep(60)  # Check every minute
+        except Exception as e:
+            logger.error("Alert monitoring error: %s", e)
             
     async def _initialize_daily_tracking(self):
         """Initialize daily PnL tracking"""
@@ -217,39 +355,34 @@ class FuturesMonitor:
             self.daily_pnl_start = position_summary['total_pnl']
             
         except Exception as e:
-            logger.error(f"Failed to initialize daily tracking: {e}")
+            logger.error("Failed to initialize daily tracking: %s", e)
             self.daily_pnl_start = 0
             
     async def _calculate_performance(self) -> Dict:
         """Calculate current performance metrics"""
         try:
-            # Get position summary
-            position_summary = self.position_manager.get_position_summary()
-            
-            # Get risk metrics
-            risk_metrics = await self.position_manager.get_risk_metrics()
+            # Get position summary and risk metrics from the shared snapshot
+            snapshot = await self._snapshot()
+            position_summary = snapshot.summary
+            risk_metrics = snapshot.risk_metrics
             
             # Calculate daily PnL
             current_total_pnl = position_summary['total_pnl']
             daily_pnl = current_total_pnl - self.daily_pnl_start
             
-            # Calculate win rate from history
-            if self.performance_history:
-                profitable_periods = sum(
-                    1 for p in self.performance_history[-12:]  # Last hour
-                    if p['period_pnl'] > 0
-                )
-                win_rate = profitable_periods / min(len(self.performance_history), 12)
+            # Calculate win rate from the last hour of history
+            recent = self._history(12)
+            if len(recent):
+                win_rate = np.count_nonzero(recent['period_pnl'] > 0) / len(recent)
             else:
                 win_rate = 0
                 
             return {
-                'timestamp': datetime.now(),
+                'timestamp_ns': time.time_ns(),
                 'total_pnl': current_total_pnl,
                 'daily_pnl': daily_pnl,
                 'period_pnl': current_total_pnl - (
-                    self.performance_history[-1]['total_pnl'] 
-                    if self.performance_history else 0
+                    float(recent['total_pnl'][-1]) if len(recent) else 0
                 ),
                 'positions_count': position_summary['count'],
                 'total_notional': position_summary['total_notional'],
@@ -259,9 +392,9 @@ class FuturesMonitor:
             }
             
         except Exception as e:
-            logger.error(f"Failed to calculate performance: {e}")
+            logger.error("Failed to calculate performance: %s", e)
             return {
-                'timestamp': datetime.now(),
+                'timestamp_ns': time.time_ns(),
                 'total_pnl': 0,
                 'daily_pnl': 0,
                 'period_pnl': 0,
@@ -272,145 +405,167 @@ class FuturesMonitor:
                 'current_leverage': 0
             }
             
-    async def _check_position_alerts(self):
+    async def _check_position_alerts(self, snapshot: SimpleNamespace):
         """Check for position-specific alerts"""
-        for symbol, position in self.position_manager.positions.items():
-            # Large position alert
-            if position.notional > self.position_size_limit * position.margin:
-                await self._send_alert(
-                    f"large_position_{symbol}",
-                    f"Large position alert for {symbol}: "
-                    f"{position.notional / position.margin:.1f}x of margin"
-                )
-                
-            # Large loss alert
-            if position.pnl_percentage < -10:  # -10% loss
-                await self._send_alert(
-                    f"large_loss_{symbol}",
-                    f"Large loss alert for {symbol}: {position.pnl_percentage:.2f}%"
-                )
-                
+        symbols, notional, margin, pnl_percentage = (
+            snapshot.symbols, snapshot.notional, snapshot.margin, snapshot.pnl_percentage
+        )
+        
+        # Large position alert
+        for i in np.flatnonzero(notional > self.position_size_limit * margin):
+            await self._send_alert(
+                f"large_position_{symbols[i]}", ALERT_LARGE_POSITION, symbols[i], notional[i] / margin[i]
+            )
+            
+        # Large loss alert
+        for i in np.flatnonzero(pnl_percentage < -10):  # -10% loss
+            await self._send_alert(
+                f"large_loss_{symbols[i]}", ALERT_LARGE_LOSS, symbols[i], pnl_percentage[i]
+            )
+            
     async def _check_risk_alerts(self, risk_metrics: RiskMetrics):
         """Check for risk-related alerts"""
         # Overleveraged alert
         if risk_metrics.is_overleveraged:
-            await self._send_alert(
-                "overleveraged",
-                f"Account overleveraged! Margin level: {risk_metrics.margin_level:.1f}%"
-            )
+            await self._send_alert("overleveraged", ALERT_OVERLEVERAGED, risk_metrics.margin_level)
             
         # High margin usage alert
         if risk_metrics.margin_usage_percentage > self.margin_usage_warning * 100:
             await self._send_alert(
-                "high_margin_usage",
-                f"High margin usage: {risk_metrics.margin_usage_percentage:.1f}%"
+                "high_margin_usage", ALERT_HIGH_MARGIN_USAGE, risk_metrics.margin_usage_percentage
             )
             
         # Too many positions alert
         if risk_metrics.positions_count > 10:
-            await self._send_alert(
-                "too_many_positions",
-                f"Too many open positions: {risk_metrics.positions_count}"
-            )
+            await self._send_alert("too_many_positions", ALERT_TOO_MANY_POSITIONS, risk_metrics.positions_count)
             
     async def _check_liquidation_alerts(self, at_risk: List[Dict]):
-        """Check for liquidation risk alerts"""
+        """Check for liquidation risk alerts
+        
+        ``at_risk`` comes sorted by distance, so the scan stops at the first
+        position outside the warning distance.
+        """
+        threshold = self.liquidation_warning_distance * 100
         for position in at_risk:
-            if position['distance_percentage'] < self.liquidation_warning_distance * 100:
-                alert_level = "CRITICAL" if position['risk_level'] == 'HIGH' else "WARNING"
-                
-                await self._send_alert(
-                    f"liquidation_risk_{position['symbol']}",
-                    f"{alert_level}: {position['symbol']} liquidation risk - "
-                    f"Distance: {position['distance_percentage']:.2f}%"
-                )
-                
+            if position['distance_percentage'] >= threshold:
+                break
+            alert_level = "CRITICAL" if position['risk_level'] == 'HIGH' else "WARNING"
+            
+            await self._send_alert(
+                f"liquidation_risk_{position['symbol']}", ALERT_LIQUIDATION_RISK,
+                alert_level, position['symbol'], position['distance_percentage']
+            )
+            
     async def _check_funding_alerts(self, symbol: str, funding):
         """Check for funding rate alerts"""
         # High positive funding (shorts profitable)
         if funding.rate > 0.01:  # 1%
             await self._send_alert(
-                f"high_funding_{symbol}",
-                f"High funding rate for {symbol}: {funding.rate:.4%} "
-                f"(Annual: {funding.annual_rate:.2f}%)"
+                f"high_funding_{symbol}", ALERT_HIGH_FUNDING, symbol, funding.rate, funding.annual_rate
             )
             
         # High negative funding (longs profitable)
         elif funding.rate < -0.01:  # -1%
             await self._send_alert(
-                f"negative_funding_{symbol}",
-                f"Negative funding rate for {symbol}: {funding.rate:.4%} "
-                f"(Annual: {funding.annual_rate:.2f}%)"
+                f"negative_funding_{symbol}", ALERT_NEGATIVE_FUNDING, symbol, funding.rate, funding.annual_rate
             )
             
     async def _check_performance_alerts(self, performance: Dict):
         """Check for performance-related alerts"""
         # Daily loss limit alert
         if performance['daily_pnl'] < self.daily_loss_limit * performance.get('starting_capital', 10000):
-            await self._send_alert(
-                "daily_loss_limit",
-                f"Daily loss limit reached: ${performance['daily_pnl']:,.2f}"
-            )
+            await self._send_alert("daily_loss_limit", ALERT_DAILY_LOSS_LIMIT, performance['daily_pnl'])
             
         # Low win rate alert
-        if performance['win_rate'] < 0.3 and len(self.performance_history) > 12:
-            await self._send_alert(
-                "low_win_rate",
-                f"Low win rate: {performance['win_rate']:.1%}"
-            )
+        if performance['win_rate'] < 0.3 and self._hist_len > 12:
+            await self._send_alert("low_win_rate", ALERT_LOW_WIN_RATE, performance['win_rate'])
+            
+    async def _send_alert(self, alert_id: str, template: str, *args):
+        """Send alert if not in cooldown
+        
+        The message is only formatted from ``template`` and ``args`` once the
+        cooldown check passes, so sticky alerts cost a dict lookup per tick.
+        """
+        now = time.monotonic()
+        sent_time = self.alerts_sent.get(alert_id)
+        if sent_time is not None and now - sent_time < self.alert_cooldown:
+            return
             
-    async def _send_alert(self, alert_id: str, message: str):
-        """Send alert if not in cooldown"""
-        if alert_id in self.alerts_sent:
-            # Check if cooldown has passed
-            if datetime.now() - self.alerts_sent[alert_id] < self.alert_cooldown:
-                return
-                
         # Send alert
-        logger.warning(f"ALERT: {message}")
-        self.alerts_sent[alert_id] = datetime.now()
+        message = template.format(*args) if args else template
+        logger.warning("ALERT: %s", message)
+        self.alerts_sent[alert_id] = now
+        self.alerts_sent.move_to_end(alert_id)
         
         # Here you would integrate with notification system
         # e.g., send to Telegram, email, etc.
+        self._notify_state_change()
+        
+    def notify_position_changed(self):
+        """Wake the scheduler after a fill or close so position and risk checks run now"""
+        self._position_changed.set()
+        
+    def add_state_listener(self, listener: Callable[[], None]):
+        """Register a callback invoked when positions change or an alert fires"""
+        self._state_listeners.append(listener)
+        
+    def _notify_state_change(self):
+        """Wake registered listeners"""
+        for listener in self._state_listeners:
+            try:
+                listener()
+            except Exception as e:
+                logger.error("State listener error: %s", e)
         
     def _export_position_metrics(self, position: FuturesPosition):
         """Export position metrics to Prometheus"""
-        if not self.prometheus_metrics:
-            return
+        key = (position.symbol, position.side.value)
+        children = self._child_cache.get(key)
+        if children is None:
+            pm = self.prometheus_metrics
+            labels = {
+                'symbol': position.symbol,
+                'side': position.side.value
+            }
+            children = (
+                pm.futures_position_size.labels(**labels),
+                pm.futures_position_pnl.labels(**labels),
+                pm.futures_position_margin.labels(**labels)
+            )
+            self._child_cache[key] = children
             
-        labels = {
-            'symbol': position.symbol,
-            'side': position.side.value
-        }
-        
-        self.prometheus_metrics.futures_position_size.labels(**labels).set(
-            abs(position.contracts)
-        )
-        self.prometheus_metrics.futures_position_pnl.labels(**labels).set(
-            position.unrealized_pnl
-        )
-        self.prometheus_metrics.futures_position_margin.labels(**labels).set(
-            position.margin
-        )
+        size_gauge, pnl_gauge, margin_gauge = children
+        size_gauge.set(abs(position.contracts))
+        pnl_gauge.set(position.unrealized_pnl)
+        margin_gauge.set(position.margin)
         
+    def _evict_position_metrics(self):
+        """Drop cached gauge children and series for positions that are no longer open"""
+        open_keys = {(p.symbol, p.side.value) for p in self.position_manager.positions.values()}
+        pm = self.prometheus_metrics
+        for key in [key for key in self._child_cache if key not in open_keys]:
+            del self._child_cache[key]
+            for metric in (pm.futures_position_size, pm.futures_position_pnl, pm.futures_position_margin):
+                try:
+                    metric.remove(*key)
+                except KeyError:
+                    pass
+                    
+
     def _export_risk_metrics(self, risk_metrics: RiskMetrics):
         """Export risk metrics to Prometheus"""
-        if not self.prometheus_metrics:
-            return
-            
-        self.prometheus_metrics.futures_margin_level.set(risk_metrics.margin_level)
-        self.prometheus_metrics.futures_margin_usage.set(risk_metrics.margin_usage_percentage)
-        self.prometheus_metrics.futures_leverage.set(risk_metrics.current_leverage)
-        self.prometheus_metrics.futures_positions_count.set(risk_metrics.positions_count)
+        pm = self.prometheus_metrics
+        pm.futures_margin_level.set(risk_metrics.margin_level)
+        pm.futures_margin_usage.set(risk_metrics.margin_usage_percentage)
+        pm.futures_leverage.set(risk_metrics.current_leverage)
+        pm.futures_positions_count.set(risk_metrics.positions_count)
         
     def _export_performance_metrics(self, performance: Dict):
         """Export performance metrics to Prometheus"""
-        if not self.prometheus_metrics:
-            return
-            
-        self.prometheus_metrics.futures_total_pnl.set(performance['total_pnl'])
-        self.prometheus_metrics.futures_daily_pnl.set(performance['daily_pnl'])
-        self.prometheus_metrics.futures_win_rate.set(performance['win_rate'])
+        pm = self.prometheus_metrics
+        pm.futures_total_pnl.set(performance['total_pnl'])
+        pm.futures_daily_pnl.set(performance['daily_pnl'])
+        pm.futures_win_rate.set(performance['win_rate'])
         
     def get_monitoring_status(self) -> Dict:
         """Get current monitoring status"""
@@ -418,14 +573,14 @@ class FuturesMonitor:
             'is_monitoring': self.is_monitoring,
             'active_alerts': len(self.alerts_sent),
             'positions_monitored': len(self.position_manager.positions),
-            'performance_history_size': len(self.performance_history),
-            'last_update': self.performance_history[-1]['timestamp'].isoformat() 
-                          if self.performance_history else None
+            'performance_history_size': self._hist_len,
+            'last_update': datetime.fromtimestamp(self._latest_performance['timestamp_ns'] / 1e9).isoformat()
+                          if self._latest_performance else None
         }
         
     def get_performance_summary(self) -> Dict:
         """Get performance summary"""
-        if not self.performance_history:
+        if not self._hist_len:
             return {
                 'total_pnl': 0,
                 'daily_pnl': 0,
@@ -435,23 +590,74 @@ class FuturesMonitor:
                 'max_drawdown': 0
             }
             
-        latest = self.performance_history[-1]
-        hourly_pnl = sum(p['period_pnl'] for p in self.performance_history[-12:])
+        latest = self._latest_performance
         
-        # Calculate max drawdown
-        peak = 0
-        max_drawdown = 0
-        for p in self.performance_history:
-            if p['total_pnl'] > peak:
-                peak = p['total_pnl']
-            drawdown = (peak - p['total_pnl']) / abs(peak) if peak != 0 else 0
-            max_drawdown = max(max_drawdown, drawdown)
-            
         return {
             'total_pnl': latest['total_pnl'],
             'daily_pnl': latest['daily_pnl'],
-            'hourly_pnl': hourly_pnl,
+            'hourly_pnl': float(self._history(12)['period_pnl'].sum()),
             'win_rate': latest['win_rate'],
-            'avg_leverage': sum(p['current_leverage'] for p in self.performance_history) / len(self.performance_history),
-            'max_drawdown': max_drawdown
-        }
\ No newline at end of file
+            'avg_leverage': self._lev_sum / self._hist_len,
+            'max_drawdown': self._max_drawdown
+        }
+        
+    def _record_performance(self, performance: Dict):
+        """Append a performance sample to the ring buffer, overwriting the oldest when full
+        
+        Average leverage and max drawdown both cover the samples in the buffer.
+        Appending updates them in O(1); evicting the oldest sample only changes
+        the drawdown when that sample was above every later running peak, and
+        then the drawdown is rescanned from the buffer.
+        """
+        rescan = False
+        if self._hist_len == PERFORMANCE_HISTORY_SIZE:
+            evicted = self._hist[self._hist_cursor]
+            self._lev_sum -= float(evicted['current_leverage'])
+            following = float(self._hist['total_pnl'][(self._hist_cursor + 1) % PERFORMANCE_HISTORY_SIZE])
+            rescan = float(evicted['total_pnl']) > max(following, 0.0)
+        self._lev_sum += performance['current_leverage']
+        
+        self._hist[self._hist_cursor] = (
+            performance['timestamp_ns'],
+            performance['total_pnl'],
+            performance['period_pnl'],
+            performance['daily_pnl'],
+            performance['current_leverage'],
+            performance['win_rate'],
+        )
+        self._hist_cursor = (self._hist_cursor + 1) % PERFORMANCE_HISTORY_SIZE
+        self._hist_len = min(self._hist_len + 1, PERFORMANCE_HISTORY_SIZE)
+        self._latest_performance = performance
+        
+        if rescan:
+            self._rescan_drawdown()
+            return
+            
+        # Max drawdown relative to the running PnL peak (the peak starts at 0)
+        total_pnl = performance['total_pnl']
+        if total_pnl > self._pnl_peak:
+            self._pnl_peak = total_pnl
+        elif self._pnl_peak > 0:
+            self._max_drawdown = max(self._max_drawdown, (self._pnl_peak - total_pnl) / self._pnl_peak)
+            
+    def _rescan_drawdown(self):
+        """Recompute the running PnL peak and max drawdown over the buffered samples"""
+        total_pnl = self._history()['total_pnl']
+        peaks = np.maximum.accumulate(np.maximum(total_pnl, 0.0))
+        drawdowns = np.divide(peaks - total_pnl, peaks, out=np.zeros_like(peaks), where=peaks > 0)
+        self._pnl_peak = float(peaks[-1])
+        self._max_drawdown = float(drawdowns.max())
+        
+    def _history(self, last: Optional[int] = None) -> np.ndarray:
+        """Performance samples in chronological order, optionally only the last N"""
+        if last is not None and last < self._hist_len:
+            # Gather just the tail instead of unrolling the whole buffer
+            return self._hist.take(np.arange(self._hist_cursor - last, self._hist_cursor),
+                                   mode='wrap')
+        if self._hist_len < PERFORMANCE_HISTORY_SIZE:
+            history = self._hist[:self._hist_len]
+        elif self._hist_cursor:
+            history = np.concatenate((self._hist[self._hist_cursor:], self._hist[:self._hist_cursor]))
+        else:
+            history = self._hist
+        return history
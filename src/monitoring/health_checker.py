@@ -1,8 +1,9 @@
 import asyncio
 import psutil
 import logging
+import time
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 from dataclasses import dataclass
 
 
@@ -29,33 +30,67 @@ class HealthChecker:
         }
         self.components = {}
         
+        # 진행 중/최근 체크 결과 공유 (동시 호출 시 중복 API 요청 방지)
+        self.cache_ttl = 5  # seconds
+        self._check_tasks: Dict[str, Tuple[float, asyncio.Task]] = {}
+        
+        # 프로세스 핸들 재사용, CPU 사용률은 이전 호출 이후 구간으로 측정 (첫 호출은 기준점 설정용)
+        self._process = psutil.Process()
+        psutil.cpu_percent(interval=None)
+        self._process.cpu_percent(interval=None)
+        
     def register_component(self, name: str, component: Any):
         """모니터링할 컴포넌트 등록"""
         self.components[name] = component
         
     async def check_all(self) -> Dict[str, HealthStatus]:
-        """모든 컴포넌트 상태 체크"""
-        results = {}
+        """모든 컴포넌트 상태 체크 (각 체크는 서로 독립적이므로 동시에 실행)"""
+        names = list(self.checks)
+        outcomes = await asyncio.gather(
+            *(asyncio.shield(self._run_check(name, self.checks[name])) for name in names),
+            return_exceptions=True
+        )
         
-        for name, check_func in self.checks.items():
-            try:
-                results[name] = await check_func()
-            except Exception as e:
-                self.logger.error(f"{name} 체크 중 오류: {e}")
+        results = {}
+        for name, outcome in zip(names, outcomes):
+            if isinstance(outcome, Exception):
+                self.logger.error(f"{name} 체크 중 오류: {outcome}")
                 results[name] = HealthStatus(
                     component=name,
                     is_healthy=False,
-                    message=f"체크 실패: {str(e)}",
+                    message=f"체크 실패: {str(outcome)}",
                     timestamp=datetime.now()
                 )
+            else:
+                results[name] = outcome
                 
         return results
         
+    def _run_check(self, name: str, check_func) -> asyncio.Task:
+        """체크 태스크 반환 (TTL 내의 동시 호출은 같은 태스크를 공유)"""
+        now = time.monotonic()
+        cached = self._check_tasks.get(name)
+        if cached and now - cached[0] < self.cache_ttl:
+            return cached[1]
+            
+        task = asyncio.ensure_future(check_func())
+        self._check_tasks[name] = (now, task)
+        task.add_done_callback(lambda t: self._evict_failed_check(name, t))
+        return task
+        
+    def _evict_failed_check(self, name: str, task: asyncio.Task):
+        """실패한 체크는 캐시에서 즉시 제거"""
+        if task.cancelled() or task.exception() is not None:
+            cached = self._check_tasks.get(name)
+            if cached and cached[1] is task:
+                del self._check_tasks[name]
+                
     async def check_system_resources(self) -> HealthStatus:
         """시스템 리소스 체크"""
         try:
-            # CPU 사용률
-            cpu_percent = psutil.cpu_percent(interval=1)
+            # CPU 사용률 (직전 체크 이후 평균이므로 대기 없이 즉시 반환)
+            cpu_percent = psutil.cpu_percent(interval=None)
+            process_cpu_percent = self._process.cpu_percent(interval=None)
             
             # 메모리 사용률
             memory = psutil.virtual_memory()
@@ -68,8 +103,7 @@ class HealthChecker:
             disk_free_gb = disk.free / 1024 / 1024 / 1024
             
             # 프로세스 정보
-            process = psutil.Process()
-            process_memory_mb = process.memory_info().rss / 1024 / 1024
+            process_memory_mb = self._process.memory_info().rss / 1024 / 1024
             
             # 상태 판단
             is_healthy = (
@@ -92,7 +126,8 @@ class HealthChecker:
                     'memory_available_mb': memory_available_mb,
                     'disk_percent': disk_percent,
                     'disk_free_gb': disk_free_gb,
-                    'process_memory_mb': process_memory_mb
+                    'process_memory_mb': process_memory_mb,
+                    'process_cpu_percent': process_cpu_percent
                 }
             )
             
@@ -1,11 +1,30 @@
-import json
 import logging
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass, asdict
 import asyncio
+import os
 from pathlib import Path
 
+import numpy as np
+
+try:
+    import orjson
+    
+    def _loads(data: bytes) -> Any:
+        return orjson.loads(data)
+    
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+except ImportError:  # orjson이 없으면 표준 json 모듈 사용
+    import json
+    
+    def _loads(data: bytes) -> Any:
+        return json.loads(data)
+    
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
 
 @dataclass
 class TradingMetrics:
@@ -32,12 +51,42 @@ class TradingMetrics:
 class MetricsCollector:
     """메트릭 수집 및 관리"""
     
-    def __init__(self, data_dir: str = "data/metrics"):
+    def __init__(self, data_dir: str = "data/metrics", flush_delay: float = 0.5):
         self.logger = logging.getLogger(__name__)
         self.data_dir = Path(data_dir)
         self.data_dir.mkdir(parents=True, exist_ok=True)
         self.metrics_history: List[TradingMetrics] = []
         self.components = {}
+        # 지난 날짜의 메트릭 파일은 더 이상 바뀌지 않으므로 날짜별 합계를 캐시
+        self._day_cache: Dict[date, Dict[str, float]] = {}
+        
+        # 쓰기 지연 버퍼: flush_delay 동안 모인 메트릭을 한 번에 파일에 추가
+        self.flush_delay = flush_delay
+        self._pending: List[TradingMetrics] = []
+        self._flush_task: Optional[asyncio.Task] = None
+        self._write_lock = asyncio.Lock()
+        
+        # 이전 버전의 JSON 배열 파일을 JSON Lines로 변환해 리포트에서 빠지지 않게 함
+        self._migrate_legacy_files()
+        
+    def _migrate_legacy_files(self):
+        """metrics_YYYYMMDD.json(JSON 배열) 레코드를 같은 날짜의 .jsonl 앞쪽에 옮기고 원본 삭제"""
+        for legacy_path in sorted(self.data_dir.glob("metrics_*.json")):
+            file_path = legacy_path.with_suffix('.jsonl')
+            try:
+                records = _loads(legacy_path.read_bytes())
+                data = b''.join(_dumps(record) + b'\n' for record in records)
+                if file_path.exists():
+                    data += file_path.read_bytes()
+                    
+                # 임시 파일에 쓴 뒤 교체해 변환 도중 중단되어도 기존 데이터 유지
+                tmp_path = file_path.with_suffix('.jsonl.tmp')
+                tmp_path.write_bytes(data)
+                os.replace(tmp_path, file_path)
+                legacy_path.unlink()
+                self.logger.info(f"메트릭 파일 변환: {legacy_path.name} -> {file_path.name} ({len(records)}건)")
+            except Exception as e:
+                self.logger.error(f"메트릭 파일 변환 실패 ({legacy_path.name}): {e}")
         
     def register_component(self, name: str, component: Any):
         """메트릭 수집할 컴포넌트 등록"""
@@ -54,23 +103,26 @@ class MetricsCollector:
             # 거래 통계 가져오기
             stats = engine.get_statistics() if hasattr(engine, 'get_statistics') else {}
             
-            # PnL 계산
+            # PnL 계산 (거래 목록은 한 번만 순회해 배열로 변환)
             trades = stats.get('trades', [])
-            winning_trades = [t for t in trades if t.get('pnl', 0) > 0]
-            losing_trades = [t for t in trades if t.get('pnl', 0) < 0]
+            pnls, pnl_percentages = self._trade_arrays(trades)
+            is_win = pnls > 0
+            is_loss = pnls < 0
+            winning_count = int(np.count_nonzero(is_win))
+            losing_count = int(np.count_nonzero(is_loss))
             
-            total_pnl = sum(t.get('pnl', 0) for t in trades)
-            total_pnl_percentage = sum(t.get('pnl_percentage', 0) for t in trades)
+            total_pnl = float(pnls.sum())
+            total_pnl_percentage = float(pnl_percentages.sum())
             
             # 평균 손익
-            average_win = sum(t.get('pnl', 0) for t in winning_trades) / len(winning_trades) if winning_trades else 0
-            average_loss = sum(t.get('pnl', 0) for t in losing_trades) / len(losing_trades) if losing_trades else 0
+            average_win = float(pnls[is_win].mean()) if winning_count else 0
+            average_loss = float(pnls[is_loss].mean()) if losing_count else 0
             
             # 최대 낙폭 계산
-            max_drawdown = self._calculate_max_drawdown(trades)
+            max_drawdown = self._calculate_max_drawdown(pnls)
             
             # 샤프 비율 계산
-            sharpe_ratio = self._calculate_sharpe_ratio(trades)
+            sharpe_ratio = self._calculate_sharpe_ratio(pnl_percentages)
             
             # 활성 포지션 수
             active_positions = stats.get('active_positions', 0)
@@ -78,9 +130,9 @@ class MetricsCollector:
             metrics = TradingMetrics(
                 timestamp=datetime.now(),
                 total_trades=len(trades),
-                winning_trades=len(winning_trades),
-                losing_trades=len(losing_trades),
-                win_rate=len(winning_trades) / len(trades) * 100 if trades else 0,
+                winning_trades=winning_count,
+                losing_trades=losing_count,
+                win_rate=winning_count / len(trades) * 100 if trades else 0,
                 total_pnl=total_pnl,
                 total_pnl_percentage=total_pnl_percentage,
                 average_win=average_win,
@@ -100,42 +152,55 @@ class MetricsCollector:
             self.logger.error(f"메트릭 수집 중 오류: {e}")
             return self._create_empty_metrics()
             
-    def _calculate_max_drawdown(self, trades: List[Dict]) -> float:
-        """최대 낙폭 계산"""
-        if not trades:
-            return 0.0
+    @staticmethod
+    def _trade_arrays(trades: List[Dict]):
+        """거래 목록을 시간순으로 정렬해 (손익, 손익률) 배열로 변환"""
+        count = len(trades)
+        timestamps = []
+        pnls = np.empty(count, dtype=np.float64)
+        pnl_percentages = np.empty(count, dtype=np.float64)
+        for i, trade in enumerate(trades):
+            timestamps.append(trade.get('timestamp', ''))
+            pnls[i] = trade.get('pnl', 0)
+            pnl_percentages[i] = trade.get('pnl_percentage', 0)
             
-        cumulative_pnl = 0
-        peak = 0
-        max_drawdown = 0
+        # 타임스탬프를 정수(ns)로 한 번 변환해 정렬 (빈 값은 NaT = int64 최솟값이라 맨 앞)
+        try:
+            order = np.argsort(np.array(timestamps, dtype='datetime64[ns]').view(np.int64), kind='stable')
+        except (ValueError, TypeError):
+            # 형식이 섞여 변환할 수 없으면 기존처럼 값 자체로 정렬
+            order = sorted(range(count), key=timestamps.__getitem__)
+        return pnls[order], pnl_percentages[order]
         
-        for trade in sorted(trades, key=lambda x: x.get('timestamp', '')):
-            cumulative_pnl += trade.get('pnl', 0)
+    def _calculate_max_drawdown(self, pnls: np.ndarray) -> float:
+        """최대 낙폭 계산 (pnls: 시간순 거래별 손익)"""
+        if not len(pnls):
+            return 0.0
             
-            if cumulative_pnl > peak:
-                peak = cumulative_pnl
-            else:
-                drawdown = (peak - cumulative_pnl) / peak * 100 if peak > 0 else 0
-                max_drawdown = max(max_drawdown, drawdown)
-                
-        return max_drawdown
+        # 누적 손익과 고점 (고점은 0에서 시작)
+        cumulative_pnl = np.cumsum(pnls)
+        peak = np.maximum.accumulate(np.maximum(cumulative_pnl, 0))
+        drawdown = np.divide(
+            (peak - cumulative_pnl) * 100, peak,
+            out=np.zeros_like(cumulative_pnl), where=peak > 0
+        )
         
-    def _calculate_sharpe_ratio(self, trades: List[Dict], risk_free_rate: float = 0.02) -> float:
-        """샤프 비율 계산"""
-        if len(trades) < 2:
+        return max(float(drawdown.max()), 0.0)
+        
+    def _calculate_sharpe_ratio(self, pnl_percentages: np.ndarray, risk_free_rate: float = 0.02) -> float:
+        """샤프 비율 계산 (pnl_percentages: 거래별 손익률, %)"""
+        if len(pnl_percentages) < 2:
             return 0.0
             
-        returns = [t.get('pnl_percentage', 0) / 100 for t in trades]
+        returns = pnl_percentages / 100
         
-        if not returns:
+        # 수익률이 모두 같으면 부동소수점 오차로 0이 아닌 표준편차가 나올 수 있음
+        if np.ptp(returns) == 0:
             return 0.0
             
         # 연간화된 수익률과 표준편차 계산
-        avg_return = sum(returns) / len(returns)
-        std_dev = (sum((r - avg_return) ** 2 for r in returns) / len(returns)) ** 0.5
-        
-        if std_dev == 0:
-            return 0.0
+        avg_return = float(returns.mean())
+        std_dev = float(returns.std())
             
         # 샤프 비율 계산 (일일 거래 기준으로 연간화)
         annualized_return = avg_return * 252  # 거래일 기준
@@ -162,48 +227,119 @@ class MetricsCollector:
             active_positions=0
         )
         
-    async def _save_metrics(self, metrics: TradingMetrics):
-        """메트릭 파일로 저장"""
-        try:
-            # 일별 파일로 저장
-            date_str = metrics.timestamp.strftime("%Y%m%d")
-            file_path = self.data_dir / f"metrics_{date_str}.json"
-            
-            # 기존 데이터 로드
-            existing_data = []
-            if file_path.exists():
-                with open(file_path, 'r') as f:
-                    existing_data = json.load(f)
-                    
-            # 새 메트릭 추가
-            existing_data.append(metrics.to_dict())
+    def _metrics_file(self, date) -> Path:
+        """일별 메트릭 파일 경로 (JSON Lines, 한 줄에 메트릭 하나)"""
+        return self.data_dir / f"metrics_{date.strftime('%Y%m%d')}.jsonl"
+        
+    @staticmethod
+    def _read_metrics(file_path: Path) -> List[Dict[str, Any]]:
+        """일별 메트릭 파일의 모든 레코드 로드 (파일이 없으면 빈 리스트)"""
+        if not file_path.exists():
+            return []
+        return [_loads(line) for line in file_path.read_bytes().splitlines() if line]
+        
+    @staticmethod
+    def _day_totals(file_path: Path) -> Optional[Dict[str, float]]:
+        """일별 메트릭 파일을 한 줄씩 읽으며 합계 계산 (레코드가 없으면 None)"""
+        if not file_path.exists():
+            return None
             
-            # 저장
-            with open(file_path, 'w') as f:
-                json.dump(existing_data, f, indent=2)
+        totals = None
+        with open(file_path, 'rb') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                record = _loads(line)
+                if totals is None:
+                    totals = {'trades': 0, 'winning': 0, 'losing': 0, 'pnl': 0}
+                totals['trades'] += record['total_trades']
+                totals['winning'] += record['winning_trades']
+                totals['losing'] += record['losing_trades']
+                totals['pnl'] += record['total_pnl']
+        return totals
+        
+    def _daily_totals(self, last_day: date, days: int) -> Dict[date, Dict[str, float]]:
+        """last_day부터 거슬러 올라가며 레코드가 있는 날짜별 합계 (지난 날짜는 캐시 사용)"""
+        daily = {}
+        for i in range(days):
+            day = last_day - timedelta(days=i)
+            totals = self._day_cache.get(day)
+            if totals is None:
+                totals = self._day_totals(self._metrics_file(day))
+                if totals is None:
+                    continue
+                # 오늘 파일은 계속 추가되므로 지난 날짜만 캐시
+                if i > 0:
+                    self._day_cache[day] = totals
+            daily[day] = totals
                 
+        # 조회 범위를 벗어난 날짜 제거
+        oldest = last_day - timedelta(days=days - 1)
+        for day in [d for d in self._day_cache if d < oldest]:
+            del self._day_cache[day]
+        return daily
+        
+    @staticmethod
+    def _append_files(chunks: Dict[Path, bytes]):
+        """파일별로 모은 줄을 한 번에 추가 (기존 데이터를 다시 읽고 쓰지 않음)"""
+        for file_path, data in chunks.items():
+            with open(file_path, 'ab') as f:
+                f.write(data)
+                
+    async def _save_metrics(self, metrics: TradingMetrics):
+        """메트릭을 버퍼에 쌓고 flush_delay 후 한 번에 파일로 저장"""
+        self._pending.append(metrics)
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_later())
+            
+    async def _flush_later(self):
+        """버퍼링 윈도우가 끝나면 저장"""
+        await asyncio.sleep(self.flush_delay)
+        await self.flush()
+        
+    async def flush(self):
+        """버퍼에 쌓인 메트릭을 일별 파일에 추가"""
+        if not self._pending:
+            return
+        batch, self._pending = self._pending, []
+        
+        # 직렬화는 락 밖에서, 파일 쓰기는 락 안에서 (락은 획득 순서대로 넘어가므로 기록 순서 유지)
+        lines: Dict[Path, List[bytes]] = {}
+        for metrics in batch:
+            lines.setdefault(self._metrics_file(metrics.timestamp), []).append(_dumps(metrics.to_dict()))
+        chunks = {file_path: b'\n'.join(rows) + b'\n' for file_path, rows in lines.items()}
+        
+        try:
+            async with self._write_lock:
+                # 파일 I/O는 스레드에서 실행해 이벤트 루프를 막지 않음
+                await asyncio.to_thread(self._append_files, chunks)
         except Exception as e:
             self.logger.error(f"메트릭 저장 실패: {e}")
             
+    async def close(self):
+        """대기 중인 저장 예약을 취소하고 남은 메트릭을 저장"""
+        if self._flush_task and not self._flush_task.done():
+            self._flush_task.cancel()
+        await self.flush()
+            
     async def get_daily_report(self) -> str:
         """일일 리포트 생성"""
         try:
             # 오늘 메트릭 로드
             today = datetime.now().date()
-            date_str = today.strftime("%Y%m%d")
-            file_path = self.data_dir / f"metrics_{date_str}.json"
             
-            if not file_path.exists():
-                return "오늘의 거래 데이터가 없습니다."
-                
-            with open(file_path, 'r') as f:
-                today_metrics = json.load(f)
-                
-            if not today_metrics:
-                return "오늘의 거래 데이터가 없습니다."
+            # 오늘 수집한 메트릭이 메모리에 있으면 파일을 읽지 않음
+            if self.metrics_history and self.metrics_history[-1].timestamp.date() == today:
+                latest = self.metrics_history[-1].to_dict()
+            else:
+                await self.flush()
+                today_metrics = await asyncio.to_thread(self._read_metrics, self._metrics_file(today))
                 
-            # 최신 메트릭
-            latest = today_metrics[-1]
+                if not today_metrics:
+                    return "오늘의 거래 데이터가 없습니다."
+                    
+                # 최신 메트릭
+                latest = today_metrics[-1]
             
             report = f"""
 📊 일일 거래 리포트 ({today})
@@ -233,28 +369,19 @@ class MetricsCollector:
     async def get_weekly_report(self) -> str:
         """주간 리포트 생성"""
         try:
-            # 지난 7일간의 메트릭 수집
-            all_metrics = []
+            # 지난 7일간의 일별 합계 수집
             today = datetime.now().date()
-            
-            for i in range(7):
-                date = today - timedelta(days=i)
-                date_str = date.strftime("%Y%m%d")
-                file_path = self.data_dir / f"metrics_{date_str}.json"
-                
-                if file_path.exists():
-                    with open(file_path, 'r') as f:
-                        daily_metrics = json.load(f)
-                        all_metrics.extend(daily_metrics)
+            await self.flush()
+            daily_summary = await asyncio.to_thread(self._daily_totals, today, 7)
                         
-            if not all_metrics:
+            if not daily_summary:
                 return "주간 거래 데이터가 없습니다."
                 
             # 주간 통계 계산
-            total_trades = sum(m['total_trades'] for m in all_metrics)
-            total_winning = sum(m['winning_trades'] for m in all_metrics)
-            total_losing = sum(m['losing_trades'] for m in all_metrics)
-            total_pnl = sum(m['total_pnl'] for m in all_metrics)
+            total_trades = sum(d['trades'] for d in daily_summary.values())
+            total_winning = sum(d['winning'] for d in daily_summary.values())
+            total_losing = sum(d['losing'] for d in daily_summary.values())
+            total_pnl = sum(d['pnl'] for d in daily_summary.values())
             
             win_rate = (total_winning / total_trades * 100) if total_trades > 0 else 0
             
@@ -272,14 +399,6 @@ class MetricsCollector:
 """
             
             # 일별 성과 추가
-            daily_summary = {}
-            for metric in all_metrics:
-                date = datetime.fromisoformat(metric['timestamp']).date()
-                if date not in daily_summary:
-                    daily_summary[date] = {'trades': 0, 'pnl': 0}
-                daily_summary[date]['trades'] += metric['total_trades']
-                daily_summary[date]['pnl'] += metric['total_pnl']
-                
             for date in sorted(daily_summary.keys(), reverse=True):
                 report += f"\n{date}: {daily_summary[date]['trades']}건, ${daily_summary[date]['pnl']:.2f}"
                 
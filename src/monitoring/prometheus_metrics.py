@@ -2,7 +2,18 @@ from prometheus_client import Counter, Gauge, Histogram, Info
 from prometheus_client import start_http_server
 import time
 import logging
-from typing import Optional
+from typing import Dict, Optional, Tuple
+
+# set_active_strategy가 관리하는 전략 목록
+STRATEGIES = ('breakout', 'scalping', 'trend')
+
+
+def _child(cache: Dict[Tuple[str, ...], object], metric, *values: str):
+    """레이블 조합별 자식 메트릭 반환 (labels()는 조합당 한 번만 호출)"""
+    child = cache.get(values)
+    if child is None:
+        child = cache[values] = metric.labels(*values)
+    return child
 
 
 class PrometheusMetrics:
@@ -11,6 +22,9 @@ class PrometheusMetrics:
     def __init__(self, port: int = 8080):
         self.logger = logging.getLogger(__name__)
         self.port = port
+        # 백그라운드 스레드에서 동작하는 /metrics HTTP 서버
+        self._server = None
+        self._server_thread = None
         
         # System Info
         self.system_info = Info('autocoin_system', 'AutoCoin system information')
@@ -50,10 +64,23 @@ class PrometheusMetrics:
         self.strategy_signals = Counter('autocoin_strategy_signals_total', 'Total strategy signals', ['strategy', 'signal'])
         self.strategy_active = Gauge('autocoin_strategy_active', 'Active strategy', ['strategy'])
         
+        # 레이블 값 튜플 -> 자식 메트릭 캐시 (기록할 때마다 labels() 조회를 피함)
+        self._trades_total_children: Dict[Tuple[str, ...], Counter] = {}
+        self._trades_successful_children: Dict[Tuple[str, ...], Counter] = {}
+        self._trades_failed_children: Dict[Tuple[str, ...], Counter] = {}
+        self._api_requests_children: Dict[Tuple[str, ...], Counter] = {}
+        self._api_latency_children: Dict[Tuple[str, ...], Histogram] = {}
+        self._errors_children: Dict[Tuple[str, ...], Counter] = {}
+        self._strategy_signals_children: Dict[Tuple[str, ...], Counter] = {}
+        self._strategy_active_children: Dict[str, Gauge] = {}
+        
     def start_server(self):
         """Prometheus HTTP 서버 시작"""
         try:
-            start_http_server(self.port)
+            # 스크레이프는 데몬 스레드에서 처리되어 트레이딩 이벤트 루프를 막지 않음
+            handles = start_http_server(self.port)
+            if handles:  # 구버전 prometheus_client는 핸들을 반환하지 않음
+                self._server, self._server_thread = handles
             self.logger.info(f"Prometheus metrics server started on port {self.port}")
             
             # 시스템 정보 설정
@@ -65,14 +92,24 @@ class PrometheusMetrics:
         except Exception as e:
             self.logger.error(f"Failed to start Prometheus server: {e}")
             
+    def stop_server(self):
+        """Prometheus HTTP 서버 종료"""
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        self._server_thread.join(timeout=5)
+        self._server = self._server_thread = None
+        self.logger.info("Prometheus metrics server stopped")
+        
     def record_trade(self, strategy: str, side: str, success: bool):
         """거래 기록"""
-        self.trades_total.labels(strategy=strategy, side=side).inc()
+        _child(self._trades_total_children, self.trades_total, strategy, side).inc()
         
         if success:
-            self.trades_successful.labels(strategy=strategy).inc()
+            _child(self._trades_successful_children, self.trades_successful, strategy).inc()
         else:
-            self.trades_failed.labels(strategy=strategy).inc()
+            _child(self._trades_failed_children, self.trades_failed, strategy).inc()
             
         self.last_trade_timestamp.set(time.time())
         
@@ -96,8 +133,8 @@ class PrometheusMetrics:
         
     def record_api_request(self, endpoint: str, status: str, latency: float):
         """API 요청 기록"""
-        self.api_requests.labels(endpoint=endpoint, status=status).inc()
-        self.api_latency.labels(endpoint=endpoint).observe(latency)
+        _child(self._api_requests_children, self.api_requests, endpoint, status).inc()
+        _child(self._api_latency_children, self.api_latency, endpoint).observe(latency)
         
     def update_api_rate_limit(self, remaining: int, total: int):
         """API Rate Limit 업데이트"""
@@ -110,17 +147,21 @@ class PrometheusMetrics:
         
     def record_error(self, error_type: str):
         """에러 기록"""
-        self.errors_total.labels(type=error_type).inc()
+        _child(self._errors_children, self.errors_total, error_type).inc()
         
     def record_strategy_signal(self, strategy: str, signal: str):
         """전략 신호 기록"""
-        self.strategy_signals.labels(strategy=strategy, signal=signal).inc()
+        _child(self._strategy_signals_children, self.strategy_signals, strategy, signal).inc()
         
     def set_active_strategy(self, strategy: str):
         """활성 전략 설정"""
-        # 모든 전략을 비활성화
-        for s in ['breakout', 'scalping', 'trend']:
-            self.strategy_active.labels(strategy=s).set(0)
+        children = self._strategy_active_children
+        if not children:
+            for s in STRATEGIES:
+                children[s] = self.strategy_active.labels(strategy=s)
+        if strategy not in children:
+            children[strategy] = self.strategy_active.labels(strategy=strategy)
             
-        # 현재 전략만 활성화
-        self.strategy_active.labels(strategy=strategy).set(1)
\ No newline at end of file
+        # 현재 전략만 활성화하고 나머지는 비활성화
+        for s, gauge in children.items():
+            gauge.set(1 if s == strategy else 0)
\ No newline at end of file
@@ -0,0 +1,237 @@
+"""
+Streaming indicator state for MarketAnalyzer
+
+``IndicatorState`` advances every indicator the analyzer reads by one bar
+at a time, keeping only the recurrence state (EMA values, Wilder sums) and
+the short windows the rolling statistics need. The recurrences match the
+``ta`` library's definitions (``fillna=False``), so replaying a frame bar by
+bar gives the same latest values as running ``ta`` over it.
+"""
+import copy
+import math
+from collections import deque
+from typing import Dict, Sequence, Tuple
+
+NAN = float('nan')
+
+ADX_WINDOW = 14
+ATR_WINDOW = 14
+RSI_WINDOW = 14
+MACD_FAST, MACD_SLOW, MACD_SIGNAL = 12, 26, 9
+BB_WINDOW, BB_DEV = 20, 2
+VOLUME_WINDOW = 20
+VOLUME_FAST_WINDOW = 5
+RANGE_WINDOW = 20
+ATR_PCT_WINDOW = 20
+
+
+def _mean(values) -> float:
+    return sum(values) / len(values)
+
+
+class IndicatorState:
+    """Indicator recurrences advanced one OHLCV bar at a time"""
+    
+    def __init__(self):
+        self.bars = 0
+        self._prev_high = self._prev_low = self._prev_close = NAN
+        
+        # EMA / MACD (pandas ewm, adjust=False)
+        self._ema_fast = self._ema_slow = NAN
+        self._macd_signal = NAN
+        
+        # RSI smoothed gains and losses
+        self._avg_gain = self._avg_loss = NAN
+        
+        # ATR seed and value
+        self._tr_seed = []
+        self._atr = 0.0
+        
+        # ADX Wilder sums and seed
+        self._trs = self._dip = self._din = 0.0
+        self._dx_seed = []
+        self._adx = 0.0
+        
+        # Rolling windows
+        self._closes = deque(maxlen=50)
+        self._volumes = deque(maxlen=VOLUME_WINDOW)
+        self._fast_volumes = deque(maxlen=VOLUME_FAST_WINDOW)
+        self._highs = deque(maxlen=RANGE_WINDOW)
+        self._lows = deque(maxlen=RANGE_WINDOW)
+        self._atr_pcts = deque(maxlen=ATR_PCT_WINDOW)
+        
+    def copy(self) -> 'IndicatorState':
+        """Independent copy, e.g. to evaluate a still-forming candle without committing it"""
+        return copy.deepcopy(self)
+        
+    def update(self, high: float, low: float, close: float, volume: float) -> Dict[str, float]:
+        """Advance by one bar and return the latest indicator values"""
+        n = self.bars
+        macd_diff, rsi, atr_pct, adx_pos, adx_neg = self._advance(high, low, close)
+        
+        # Moving averages and Bollinger Bands
+        self._closes.append(close)
+        closes = list(self._closes)
+        sma_20 = _mean(closes[-20:]) if n >= 19 else NAN
+        sma_50 = _mean(closes[-50:]) if n >= 49 else NAN
+        if n >= BB_WINDOW - 1:
+            window = closes[-BB_WINDOW:]
+            bb_middle = _mean(window)
+            bb_std = math.sqrt(sum((x - bb_middle) ** 2 for x in window) / BB_WINDOW)
+            bb_upper = bb_middle + BB_DEV * bb_std
+            bb_lower = bb_middle - BB_DEV * bb_std
+            bb_width = (bb_upper - bb_lower) / bb_middle * 100
+        else:
+            bb_width = NAN
+            
+        atr_pct_mean = _mean(self._atr_pcts) if n >= ATR_PCT_WINDOW - 1 else NAN
+        
+        # Volume
+        self._volumes.append(volume)
+        self._fast_volumes.append(volume)
+        volume_sma = _mean(self._volumes) if n >= VOLUME_WINDOW - 1 else NAN
+        volume_ma_5 = _mean(self._fast_volumes) if n >= VOLUME_FAST_WINDOW - 1 else NAN
+        
+        # Range of the previous bars, taken before this one joins the window
+        if n >= RANGE_WINDOW:
+            recent_high = max(self._highs)
+            recent_low = min(self._lows)
+        else:
+            recent_high = recent_low = NAN
+        self._highs.append(high)
+        self._lows.append(low)
+        
+        return {
+            'close': close,
+            'sma_20': sma_20,
+            'sma_50': sma_50,
+            'adx': self._adx,
+            'adx_pos': adx_pos,
+            'adx_neg': adx_neg,
+            'rsi': rsi,
+            'macd_diff': macd_diff,
+            'bb_width': bb_width,
+            'atr_pct': atr_pct,
+            'atr_pct_mean': atr_pct_mean,
+            'volume_sma': volume_sma,
+            'volume_ratio': volume / volume_sma if volume_sma else NAN,
+            'volume_ma_5': volume_ma_5,
+            'recent_high': recent_high,
+            'recent_low': recent_low,
+        }
+        
+    def extend(self, highs: Sequence[float], lows: Sequence[float],
+               closes: Sequence[float], volumes: Sequence[float]):
+        """Advance by a run of closed bars without computing their window statistics
+        
+        Only the recurrences need every bar; the rolling windows are filled
+        from the tail of the run, since earlier bars would fall out of them anyway.
+        """
+        for high, low, close in zip(highs, lows, closes):
+            self._advance(high, low, close)
+        self._closes.extend(closes[-self._closes.maxlen:])
+        self._volumes.extend(volumes[-VOLUME_WINDOW:])
+        self._fast_volumes.extend(volumes[-VOLUME_FAST_WINDOW:])
+        self._highs.extend(highs[-RANGE_WINDOW:])
+        self._lows.extend(lows[-RANGE_WINDOW:])
+        
+    def _advance(self, high: float, low: float, close: float) -> Tuple[float, float, float, float, float]:
+        """Advance the EMA/Wilder recurrences by one bar
+        
+        Returns:
+            (macd_diff, rsi, atr_pct, adx_pos, adx_neg) for the bar
+        """
+        n = self.bars
+        prev_high, prev_low, prev_close = self._prev_high, self._prev_low, self._prev_close
+        
+        # MACD
+        fast_alpha = 2 / (MACD_FAST + 1)
+        slow_alpha = 2 / (MACD_SLOW + 1)
+        if n == 0:
+            self._ema_fast = self._ema_slow = close
+        else:
+            self._ema_fast = (1 - fast_alpha) * self._ema_fast + fast_alpha * close
+            self._ema_slow = (1 - slow_alpha) * self._ema_slow + slow_alpha * close
+        macd_diff = NAN
+        if n >= MACD_SLOW - 1:
+            macd = self._ema_fast - self._ema_slow
+            signal_alpha = 2 / (MACD_SIGNAL + 1)
+            if n == MACD_SLOW - 1:
+                self._macd_signal = macd
+            else:
+                self._macd_signal = (1 - signal_alpha) * self._macd_signal + signal_alpha * macd
+            if n >= MACD_SLOW + MACD_SIGNAL - 2:
+                macd_diff = macd - self._macd_signal
+                
+        # RSI (Wilder smoothing via ewm with alpha=1/window)
+        diff = close - prev_close if n else NAN
+        gain = diff if diff > 0 else 0.0
+        loss = -diff if diff < 0 else 0.0
+        rsi_alpha = 1 / RSI_WINDOW
+        if n == 0:
+            self._avg_gain, self._avg_loss = gain, loss
+        else:
+            self._avg_gain = (1 - rsi_alpha) * self._avg_gain + rsi_alpha * gain
+            self._avg_loss = (1 - rsi_alpha) * self._avg_loss + rsi_alpha * loss
+        if n < RSI_WINDOW - 1:
+            rsi = NAN
+        elif self._avg_loss == 0:
+            rsi = 100.0
+        else:
+            rsi = 100 - 100 / (1 + self._avg_gain / self._avg_loss)
+            
+        # ATR
+        if n == 0:
+            true_range = high - low
+        else:
+            true_range = max(high - low, abs(high - prev_close), abs(low - prev_close))
+        if n < ATR_WINDOW - 1:
+            self._tr_seed.append(true_range)
+        elif n == ATR_WINDOW - 1:
+            self._tr_seed.append(true_range)
+            self._atr = _mean(self._tr_seed)
+            self._tr_seed = []
+        else:
+            self._atr = (self._atr * (ATR_WINDOW - 1) + true_range) / ATR_WINDOW
+        atr_pct = self._atr / close * 100
+        self._atr_pcts.append(atr_pct)
+        
+        # ADX, +DI, -DI
+        adx_pos = adx_neg = 0.0
+        if n >= 1:
+            dm_range = max(high, prev_close) - min(low, prev_close)
+            up = high - prev_high
+            down = prev_low - low
+            plus_dm = up if up > down and up > 0 else 0.0
+            minus_dm = down if down > up and down > 0 else 0.0
+            if n <= ADX_WINDOW:
+                self._trs += dm_range
+                self._dip += plus_dm
+                self._din += minus_dm
+            else:
+                self._trs = self._trs - self._trs / ADX_WINDOW + dm_range
+                self._dip = self._dip - self._dip / ADX_WINDOW + plus_dm
+                self._din = self._din - self._din / ADX_WINDOW + minus_dm
+                
+        if n >= ADX_WINDOW:
+            pos = neg = dx = 0.0
+            if self._trs != 0:
+                pos = 100 * (self._dip / self._trs)
+                neg = 100 * (self._din / self._trs)
+            if pos + neg != 0:
+                dx = 100 * abs((pos - neg) / (pos + neg))
+            if n > ADX_WINDOW:
+                adx_pos, adx_neg = pos, neg
+                
+            if n < 2 * ADX_WINDOW - 1:
+                self._dx_seed.append(dx)
+            elif n == 2 * ADX_WINDOW - 1:
+                self._dx_seed.append(dx)
+                self._adx = _mean(self._dx_seed)
+                self._dx_seed = []
+            else:
+                self._adx = (self._adx * (ADX_WINDOW - 1) + dx) / ADX_WINDOW
+                
+        self._prev_high, self._prev_low, self._prev_close = high, low, close
+        self.bars = n + 1
+        return macd_diff, rsi, atr_pct, adx_pos, adx_neg
@@ -3,13 +3,13 @@ Market analyzer for identifying current market conditions
 """
 
 from typing import Dict, Any, List, Optional
-from enum import Enum
+from enum import Enum, IntEnum
 from datetime import datetime, timedelta
 import pandas as pd
 import numpy as np
-import ta
 
 from ..logger import get_logger
+from ._indicators import IndicatorState
 
 logger = get_logger('market_analyzer')
 
@@ -24,12 +24,34 @@ class MarketCondition(Enum):
     CONSOLIDATING = "CONSOLIDATING"
 
 
-class TrendStrength(Enum):
-    """Trend strength levels"""
-    STRONG = "STRONG"
-    MODERATE = "MODERATE"
-    WEAK = "WEAK"
-    NONE = "NONE"
+class TrendStrength(IntEnum):
+    """Trend strength levels, ordered so they compare as plain integers"""
+    NONE = 0
+    WEAK = 1
+    MODERATE = 2
+    STRONG = 3
+
+
+def _classify(breakout: bool, trending: bool, up: bool,
+              consolidating: bool, high_volatility: bool) -> MarketCondition:
+    """Market condition rules, in priority order"""
+    if breakout:
+        return MarketCondition.BREAKOUT
+    if trending:
+        return MarketCondition.TRENDING_UP if up else MarketCondition.TRENDING_DOWN
+    if consolidating:
+        return MarketCondition.CONSOLIDATING
+    if high_volatility:
+        return MarketCondition.VOLATILE
+    return MarketCondition.RANGING
+
+
+# _classify evaluated for every combination of its inputs, indexed by
+# breakout << 4 | trending << 3 | up << 2 | consolidating << 1 | high_volatility
+_CONDITION_TABLE = tuple(
+    _classify(*(bool(key >> bit & 1) for bit in (4, 3, 2, 1, 0)))
+    for key in range(32)
+)
 
 
 class MarketAnalyzer:
@@ -45,6 +67,11 @@ class MarketAnalyzer:
         self.trend_threshold = 0.6  # ADX threshold for trending
         self.range_threshold = 30  # RSI range for ranging market
         
+        # Streaming indicator state, committed through the last closed bar seen
+        self._indicator_state: Optional[IndicatorState] = None
+        self._last_bar: Optional[tuple] = None  # (timestamp, high, low, close, volume)
+        self._analysis_key: Optional[tuple] = None  # frame the cached analysis was built from
+        
         logger.info("Initialized MarketAnalyzer")
         
     def analyze_market(self, ohlcv_data: pd.DataFrame) -> Dict[str, Any]:
@@ -61,16 +88,21 @@ class MarketAnalyzer:
             logger.warning(f"Insufficient data for analysis: {len(ohlcv_data)} candles")
             return {}
             
+        # Same candles as the previous call (e.g. several consumers within one bar)
+        key = self._frame_key(ohlcv_data)
+        if key == self._analysis_key and self.analysis_cache:
+            return self.analysis_cache
+            
         try:
-            # Calculate all indicators
-            indicators = self._calculate_indicators(ohlcv_data)
+            # Advance indicators over the new bars only
+            indicators = self._latest_indicators(ohlcv_data)
             
             # Analyze different aspects
             trend_analysis = self._analyze_trend(indicators)
             volatility_analysis = self._analyze_volatility(indicators)
             momentum_analysis = self._analyze_momentum(indicators)
-            volume_analysis = self._analyze_volume(ohlcv_data, indicators)
-            pattern_analysis = self._analyze_patterns(ohlcv_data, indicators)
+            volume_analysis = self._analyze_volume(indicators)
+            pattern_analysis = self._analyze_patterns(indicators)
             
             # Determine overall market condition
             market_condition = self._determine_market_condition(
@@ -90,14 +122,15 @@ class MarketAnalyzer:
                 'volume': volume_analysis,
                 'patterns': pattern_analysis,
                 'indicators': {
-                    'rsi': indicators['rsi'].iloc[-1],
-                    'adx': indicators['adx'].iloc[-1],
-                    'atr_pct': indicators['atr_pct'].iloc[-1],
-                    'bb_width': indicators['bb_width'].iloc[-1]
+                    'rsi': indicators['rsi'],
+                    'adx': indicators['adx'],
+                    'atr_pct': indicators['atr_pct'],
+                    'bb_width': indicators['bb_width']
                 }
             }
             
             self.analysis_cache = analysis
+            self._analysis_key = key
             self.last_analysis_time = datetime.now()
             
             logger.info(f"Market analysis complete: {market_condition.value}")
@@ -107,56 +140,69 @@ class MarketAnalyzer:
             logger.error(f"Error analyzing market: {e}")
             return {}
             
-    def _calculate_indicators(self, data: pd.DataFrame) -> Dict[str, pd.Series]:
-        """Calculate technical indicators"""
-        indicators = {}
-        
-        # Price-based
-        indicators['sma_20'] = ta.trend.SMAIndicator(data['close'], window=20).sma_indicator()
-        indicators['sma_50'] = ta.trend.SMAIndicator(data['close'], window=50).sma_indicator()
-        indicators['ema_12'] = ta.trend.EMAIndicator(data['close'], window=12).ema_indicator()
-        indicators['ema_26'] = ta.trend.EMAIndicator(data['close'], window=26).ema_indicator()
-        
-        # Trend
-        indicators['adx'] = ta.trend.ADXIndicator(
-            data['high'], data['low'], data['close'], window=14
-        ).adx()
-        indicators['adx_pos'] = ta.trend.ADXIndicator(
-            data['high'], data['low'], data['close'], window=14
-        ).adx_pos()
-        indicators['adx_neg'] = ta.trend.ADXIndicator(
-            data['high'], data['low'], data['close'], window=14
-        ).adx_neg()
+    @staticmethod
+    def _frame_key(data: pd.DataFrame) -> tuple:
+        """Identify an OHLCV frame by its length, bar span and last candle"""
+        timestamps = data['timestamp'].to_numpy() if 'timestamp' in data else data.index.to_numpy()
+        last = data[['high', 'low', 'close', 'volume']].to_numpy()[-1]
+        return (len(data), timestamps[0], timestamps[-1], *last)
         
-        # Momentum
-        indicators['rsi'] = ta.momentum.RSIIndicator(data['close'], window=14).rsi()
-        macd = ta.trend.MACD(data['close'])
-        indicators['macd'] = macd.macd()
-        indicators['macd_signal'] = macd.macd_signal()
-        indicators['macd_diff'] = macd.macd_diff()
+    def update(self, bar: Dict[str, float]) -> Dict[str, float]:
+        """
+        Advance the indicators by one closed bar
         
-        # Volatility
-        bb = ta.volatility.BollingerBands(data['close'], window=20, window_dev=2)
-        indicators['bb_upper'] = bb.bollinger_hband()
-        indicators['bb_middle'] = bb.bollinger_mavg()
-        indicators['bb_lower'] = bb.bollinger_lband()
-        indicators['bb_width'] = (indicators['bb_upper'] - indicators['bb_lower']) / indicators['bb_middle'] * 100
+        Args:
+            bar: Mapping with high, low, close, volume and optionally timestamp
+            
+        Returns:
+            Latest indicator values
+        """
+        if self._indicator_state is None:
+            self._indicator_state = IndicatorState()
+        values = (bar['high'], bar['low'], bar['close'], bar['volume'])
+        self._last_bar = (bar.get('timestamp'), *values)
+        return self._indicator_state.update(*values)
         
-        atr = ta.volatility.AverageTrueRange(data['high'], data['low'], data['close'], window=14)
-        indicators['atr'] = atr.average_true_range()
-        indicators['atr_pct'] = indicators['atr'] / data['close'] * 100
+    def _latest_indicators(self, data: pd.DataFrame) -> Dict[str, float]:
+        """Latest indicator values for ``data``, reusing state from earlier calls
         
-        # Volume
-        indicators['volume_sma'] = data['volume'].rolling(window=20).mean()
-        indicators['volume_ratio'] = data['volume'] / indicators['volume_sma']
+        If ``data`` contains the last closed bar seen before, only the bars
+        after it are fed to the indicator state; otherwise the state is rebuilt
+        from the whole frame. The final row may still be forming, so it is
+        evaluated on a copy of the state and never committed.
+        """
+        timestamps = data['timestamp'].to_numpy() if 'timestamp' in data else data.index.to_numpy()
+        high = data['high'].to_numpy(dtype=np.float64)
+        low = data['low'].to_numpy(dtype=np.float64)
+        close = data['close'].to_numpy(dtype=np.float64)
+        volume = data['volume'].to_numpy(dtype=np.float64)
+        last = len(data) - 1
         
-        return indicators
+        start = 0
+        if self._indicator_state is not None and self._last_bar is not None:
+            timestamp, *values = self._last_bar
+            matches = np.flatnonzero(timestamps[:last] == timestamp)
+            if len(matches):
+                i = matches[-1]
+                if (high[i], low[i], close[i], volume[i]) == tuple(values):
+                    start = i + 1
+                    
+        if start == 0:
+            self._indicator_state = IndicatorState()
+        state = self._indicator_state
+        state.extend(high[start:last].tolist(), low[start:last].tolist(),
+                     close[start:last].tolist(), volume[start:last].tolist())
+        if last > 0:
+            self._last_bar = (timestamps[last - 1], high[last - 1], low[last - 1],
+                              close[last - 1], volume[last - 1])
+            
+        return state.copy().update(high[last], low[last], close[last], volume[last])
         
-    def _analyze_trend(self, indicators: Dict[str, pd.Series]) -> Dict[str, Any]:
+    def _analyze_trend(self, indicators: Dict[str, float]) -> Dict[str, Any]:
         """Analyze trend characteristics"""
-        current_adx = indicators['adx'].iloc[-1]
-        current_adx_pos = indicators['adx_pos'].iloc[-1]
-        current_adx_neg = indicators['adx_neg'].iloc[-1]
+        current_adx = indicators['adx']
+        current_adx_pos = indicators['adx_pos']
+        current_adx_neg = indicators['adx_neg']
         
         # Determine trend direction
         if current_adx_pos > current_adx_neg:
@@ -175,8 +221,8 @@ class MarketAnalyzer:
             strength = TrendStrength.NONE
             
         # Moving average alignment
-        sma_20 = indicators['sma_20'].iloc[-1]
-        sma_50 = indicators['sma_50'].iloc[-1]
+        sma_20 = indicators['sma_20']
+        sma_50 = indicators['sma_50']
         ma_aligned = (sma_20 > sma_50 and direction == "UP") or \
                      (sma_20 < sma_50 and direction == "DOWN")
                      
@@ -188,14 +234,13 @@ class MarketAnalyzer:
             'is_trending': current_adx > 25
         }
         
-    def _analyze_volatility(self, indicators: Dict[str, pd.Series]) -> Dict[str, Any]:
+    def _analyze_volatility(self, indicators: Dict[str, float]) -> Dict[str, Any]:
         """Analyze volatility characteristics"""
-        current_atr_pct = indicators['atr_pct'].iloc[-1]
-        current_bb_width = indicators['bb_width'].iloc[-1]
+        current_atr_pct = indicators['atr_pct']
+        current_bb_width = indicators['bb_width']
         
         # Historical volatility
-        atr_mean = indicators['atr_pct'].rolling(window=20).mean().iloc[-1]
-        atr_std = indicators['atr_pct'].rolling(window=20).std().iloc[-1]
+        atr_mean = indicators['atr_pct_mean']
         
         # Volatility level
         if current_atr_pct > self.volatility_threshold_high:
@@ -222,10 +267,10 @@ class MarketAnalyzer:
             'relative_volatility': current_atr_pct / atr_mean if atr_mean > 0 else 1
         }
         
-    def _analyze_momentum(self, indicators: Dict[str, pd.Series]) -> Dict[str, Any]:
+    def _analyze_momentum(self, indicators: Dict[str, float]) -> Dict[str, Any]:
         """Analyze momentum characteristics"""
-        current_rsi = indicators['rsi'].iloc[-1]
-        current_macd_diff = indicators['macd_diff'].iloc[-1]
+        current_rsi = indicators['rsi']
+        current_macd_diff = indicators['macd_diff']
         
         # RSI momentum
         if current_rsi > 70:
@@ -255,13 +300,13 @@ class MarketAnalyzer:
             'macd_histogram': current_macd_diff
         }
         
-    def _analyze_volume(self, data: pd.DataFrame, indicators: Dict[str, pd.Series]) -> Dict[str, Any]:
+    def _analyze_volume(self, indicators: Dict[str, float]) -> Dict[str, Any]:
         """Analyze volume characteristics"""
-        current_volume_ratio = indicators['volume_ratio'].iloc[-1]
+        current_volume_ratio = indicators['volume_ratio']
         
         # Volume trend
-        volume_ma_5 = data['volume'].rolling(window=5).mean().iloc[-1]
-        volume_ma_20 = indicators['volume_sma'].iloc[-1]
+        volume_ma_5 = indicators['volume_ma_5']
+        volume_ma_20 = indicators['volume_sma']
         
         if volume_ma_5 > volume_ma_20 * 1.2:
             trend = "INCREASING"
@@ -285,7 +330,7 @@ class MarketAnalyzer:
             'is_significant': current_volume_ratio > 1.5
         }
         
-    def _analyze_patterns(self, data: pd.DataFrame, indicators: Dict[str, pd.Series]) -> Dict[str, Any]:
+    def _analyze_patterns(self, indicators: Dict[str, float]) -> Dict[str, Any]:
         """Analyze price patterns"""
         patterns = {
             'breakout': False,
@@ -294,9 +339,9 @@ class MarketAnalyzer:
         }
         
         # Check for breakout
-        recent_high = data['high'].rolling(window=20).max().iloc[-2]
-        recent_low = data['low'].rolling(window=20).min().iloc[-2]
-        current_close = data['close'].iloc[-1]
+        recent_high = indicators['recent_high']
+        recent_low = indicators['recent_low']
+        current_close = indicators['close']
         
         if current_close > recent_high:
             patterns['breakout'] = True
@@ -307,13 +352,13 @@ class MarketAnalyzer:
             
         # Check for consolidation
         price_range = (recent_high - recent_low) / recent_low * 100
-        if price_range < 5 and indicators['atr_pct'].iloc[-1] < 1:
+        if price_range < 5 and indicators['atr_pct'] < 1:
             patterns['consolidation'] = True
             
         # Check for potential reversal
-        rsi = indicators['rsi'].iloc[-1]
-        if (rsi > 70 and indicators['macd_diff'].iloc[-1] < 0) or \
-           (rsi < 30 and indicators['macd_diff'].iloc[-1] > 0):
+        rsi = indicators['rsi']
+        if (rsi > 70 and indicators['macd_diff'] < 0) or \
+           (rsi < 30 and indicators['macd_diff'] > 0):
             patterns['reversal'] = True
             
         return patterns
@@ -324,28 +369,15 @@ class MarketAnalyzer:
                                   momentum: Dict[str, Any],
                                   patterns: Dict[str, Any]) -> MarketCondition:
         """Determine overall market condition"""
-        
-        # Breakout condition
-        if patterns.get('breakout'):
-            return MarketCondition.BREAKOUT
-            
-        # Trending conditions
-        if trend['is_trending'] and trend['strength'] in [TrendStrength.STRONG, TrendStrength.MODERATE]:
-            if trend['direction'] == "UP":
-                return MarketCondition.TRENDING_UP
-            else:
-                return MarketCondition.TRENDING_DOWN
-                
-        # Consolidating condition
-        if patterns.get('consolidation') or volatility['level'] == "LOW":
-            return MarketCondition.CONSOLIDATING
-            
-        # Volatile condition
-        if volatility['level'] == "HIGH":
-            return MarketCondition.VOLATILE
-            
-        # Default to ranging
-        return MarketCondition.RANGING
+        level = volatility['level']
+        key = (
+            bool(patterns.get('breakout')) << 4
+            | bool(trend['is_trending'] and trend['strength'] >= TrendStrength.MODERATE) << 3
+            | (trend['direction'] == "UP") << 2
+            | bool(patterns.get('consolidation') or level == "LOW") << 1
+            | (level == "HIGH")
+        )
+        return _CONDITION_TABLE[key]
         
     def get_market_summary(self) -> str:
         """Get human-readable market summary"""
@@ -358,7 +390,7 @@ class MarketAnalyzer:
         volatility = analysis['volatility']
         
         summary = f"Market Condition: {condition.value}\n"
-        summary += f"Trend: {trend['direction']} ({trend['strength'].value})\n"
+        summary += f"Trend: {trend['direction']} ({trend['strength'].name})\n"
         summary += f"Volatility: {volatility['level']} ({volatility['atr_pct']:.2f}%)\n"
         summary += f"RSI: {analysis['indicators']['rsi']:.2f}\n"
         
@@ -6,7 +6,7 @@ from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 import numpy as np
 
-from .market_analyzer import MarketAnalyzer, MarketCondition
+from .market_analyzer import MarketAnalyzer, MarketCondition, TrendStrength
 from .performance_evaluator import PerformanceEvaluator
 from ..logger import get_logger
 
@@ -179,7 +179,7 @@ class StrategyRecommender:
         
         if strategy == 'breakout':
             # Breakout likes strong trends and increasing volatility
-            if trend['strength'].value in ['STRONG', 'MODERATE']:
+            if trend['strength'] >= TrendStrength.MODERATE:
                 alignment += 0.2
             if volatility['trend'] == 'INCREASING':
                 alignment += 0.2
@@ -199,7 +199,7 @@ class StrategyRecommender:
             # Trend following likes strong trends with aligned MAs
             if trend['is_trending'] and trend['ma_aligned']:
                 alignment += 0.3
-            if trend['strength'].value == 'STRONG':
+            if trend['strength'] == TrendStrength.STRONG:
                 alignment += 0.2
             if momentum['macd_trend'] == 'BULLISH' and trend['direction'] == 'UP':
                 alignment += 0.1
@@ -242,9 +242,9 @@ class StrategyRecommender:
                 confidence -= 0.1
                 
         # Adjust based on market clarity
-        if market_analysis['trend']['strength'].value == 'STRONG':
+        if market_analysis['trend']['strength'] == TrendStrength.STRONG:
             confidence += 0.05
-        elif market_analysis['trend']['strength'].value == 'NONE':
+        elif market_analysis['trend']['strength'] == TrendStrength.NONE:
             confidence -= 0.05
             
         return min(max(confidence, 0), 1)
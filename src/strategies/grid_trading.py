@@ -242,46 +242,42 @@ class GridTradingStrategy(BaseStrategy):
             exchange.set_leverage, self.symbol, self.leverage
         )
         
-        # Create grid orders
-        for level in signal['grid_levels']:
-            try:
-                # Determine order side
-                if level > current_price:
-                    # Sell order above current price
-                    side = 'sell'
-                    order_type = 'limit'
-                else:
-                    # Buy order below current price
-                    side = 'buy'
-                    order_type = 'limit'
-                    
-                # Calculate order size
-                order_size = await asyncio.to_thread(
-                    exchange.calculate_futures_position_size,
-                    self.symbol, order_capital, self.leverage, level
-                )
-                
-                # Create order
-                order = await asyncio.to_thread(
-                    exchange.create_futures_order,
-                    symbol=self.symbol,
-                    order_type=order_type,
-                    side=side,
-                    amount=order_size,
-                    price=level
-                )
-                
-                self.grid_orders[level] = order
-                orders_created.append({
-                    'level': level,
-                    'side': side,
-                    'size': order_size,
-                    'order_id': order['id']
-                })
-                
-            except Exception as e:
-                self.logger.error(f"Failed to create grid order at {level}: {e}")
+        # Size every level in one vectorised pass; levels share the market limits
+        levels = signal['grid_levels']
+        order_sizes = exchange.calculate_futures_position_sizes(
+            self.symbol, order_capital, self.leverage, levels,
+            exchange.futures_markets.get(self.symbol)
+        ).tolist()
+        
+        # Build grid order requests; sell above current price, buy below
+        order_requests = [
+            {
+                'symbol': self.symbol,
+                'type': 'limit',
+                'side': 'sell' if level > current_price else 'buy',
+                'amount': order_size,
+                'price': level
+            }
+            for level, order_size in zip(levels, order_sizes)
+        ]
+        
+        # Submit all grid orders through the batch endpoint
+        results = await asyncio.to_thread(exchange.create_futures_orders, order_requests)
+        
+        for request, order in zip(order_requests, results):
+            level = request['price']
+            if order is None:
+                self.logger.error(f"Failed to create grid order at {level}")
+                continue
                 
+            self.grid_orders[level] = order
+            orders_created.append({
+                'level': level,
+                'side': request['side'],
+                'size': request['amount'],
+                'order_id': order['id']
+            })
+            
         self.logger.info(
             f"Created grid with {len(orders_created)} orders "
             f"between {self.grid_lower:.2f} and {self.grid_upper:.2f}"
@@ -258,13 +258,14 @@ class FuturesTradingEngine:
                 await self.position_manager.update_positions()
                 
                 # Check for trailing stops (for certain strategies)
-                if self.active_strategy == 'long_short_switching':
+                if self.active_strategy == 'long_short_switching' and self.position_manager.positions:
                     strategy = self.strategies[self.active_strategy]
-                    for symbol, position in self.position_manager.positions.items():
-                        ticker = await asyncio.to_thread(
-                            self.futures_client.get_futures_ticker,
-                            symbol
-                        )
+                    # One batched quote request for all open positions
+                    tickers = await asyncio.to_thread(
+                        self.futures_client.get_futures_tickers,
+                        list(self.position_manager.positions)
+                    )
+                    for symbol, ticker in tickers.items():
                         await strategy.update_trailing_stop(
                             self.futures_client,
                             ticker['last']
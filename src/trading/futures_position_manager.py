@@ -3,11 +3,12 @@ Futures Position Manager
 Handles position tracking, risk management, and order execution for futures
 """
 import asyncio
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
 import logging
 from datetime import datetime, timedelta
 from decimal import Decimal
 import json
+from operator import itemgetter
 
 from ..exchange.binance_futures_client import BinanceFuturesClient
 from ..utils.risk_manager import RiskManager
@@ -27,7 +28,20 @@ class FuturesPositionManager:
         self.positions: Dict[str, FuturesPosition] = {}
         self.orders: Dict[str, FuturesOrder] = {}
         self._position_update_lock = asyncio.Lock()
+        self._change_listeners: List[Callable[[], None]] = []
         
+    def add_change_listener(self, listener: Callable[[], None]):
+        """Register a callback invoked after this manager opens, closes or resizes a position"""
+        self._change_listeners.append(listener)
+        
+    def _notify_change(self):
+        """Call registered change listeners"""
+        for listener in self._change_listeners:
+            try:
+                listener()
+            except Exception as e:
+                self.logger.error(f"Position change listener error: {e}")
+                
     async def initialize(self):
         """Initialize position manager"""
         await self.update_positions()
@@ -98,6 +112,7 @@ class FuturesPositionManager:
             
             # Update positions
             await self.update_positions()
+            self._notify_change()
             
             self.logger.info(f"Opened {side} position for {size} {symbol} at {leverage}x")
             return order
@@ -128,6 +143,7 @@ class FuturesPositionManager:
             
             # Update positions
             await self.update_positions()
+            self._notify_change()
             
             self.logger.info(f"Closed {percentage}% of {symbol} position")
             return order
@@ -148,6 +164,7 @@ class FuturesPositionManager:
             
             # Update position info
             await self.update_positions()
+            self._notify_change()
             
             self.logger.info(f"Adjusted leverage for {symbol} to {new_leverage}x")
             return result
@@ -280,7 +297,7 @@ class FuturesPositionManager:
             )
             
     async def check_liquidation_risk(self) -> List[Dict]:
-        """Check positions at risk of liquidation"""
+        """Check positions at risk of liquidation, closest to liquidation first"""
         at_risk = []
         
         for symbol, position in self.positions.items():
@@ -307,6 +324,7 @@ class FuturesPositionManager:
                     'risk_level': 'HIGH' if distance_pct < 5 else 'MEDIUM'
                 })
                 
+        at_risk.sort(key=itemgetter('distance_percentage'))
         return at_risk
         
     async def emergency_close_all(self) -> List[Dict]:
@@ -331,6 +349,11 @@ class FuturesPositionManager:
         self.logger.warning(f"Emergency closed {len(results)} positions")
         return results
         
+    def iter_snapshot(self) -> Iterator[Tuple[str, FuturesPosition, float, float, float]]:
+        """Yield (symbol, position, notional, margin, pnl_percentage) for each open position"""
+        for symbol, position in self.positions.items():
+            yield symbol, position, position.notional, position.margin, position.pnl_percentage
+            
     def get_position_summary(self) -> Dict:
         """Get summary of all positions"""
         if not self.positions:
@@ -1,4 +1,6 @@
 from .error_handler import ErrorHandler
 from .retry_decorator import retry_on_error
+from .rate_limiter import TokenBucket
+from .cache import TTLCache
 
-__all__ = ['ErrorHandler', 'retry_on_error']
\ No newline at end of file
+__all__ = ['ErrorHandler', 'retry_on_error', 'TokenBucket', 'TTLCache']
\ No newline at end of file
@@ -0,0 +1,95 @@
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Hashable, Optional
+
+
+class TTLCache:
+    """
+    만료 시간(TTL)이 있는 프로세스 로컬 LRU 캐시
+
+    거래소 클라이언트 메서드는 asyncio.to_thread로 여러 스레드에서 호출되므로
+    락으로 보호함. maxsize를 넘으면 가장 오래 사용되지 않은 항목부터 제거.
+
+    Args:
+        maxsize: 최대 항목 수
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._inflight: Dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+
+    def _get_locked(self, key: Hashable) -> Optional[Any]:
+        """락을 잡은 상태에서 캐시 조회"""
+        item = self._data.get(key)
+        if item is None:
+            return None
+        expires_at, value = item
+        if expires_at < time.monotonic():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """캐시된 값 반환 (없거나 만료되었으면 None)"""
+        with self._lock:
+            return self._get_locked(key)
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any], ttl: float) -> Any:
+        """
+        캐시된 값을 반환하고, 없으면 loader()로 불러와 ttl초 동안 캐시
+
+        같은 키를 동시에 요청하면 첫 호출만 loader를 실행하고
+        나머지 스레드는 그 결과(또는 예외)를 함께 받음.
+        ttl이 0 이하면 결과를 캐시하지 않고 동시 호출만 합침.
+        """
+        with self._lock:
+            value = self._get_locked(key)
+            if value is not None:
+                return value
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._inflight[key] = future
+
+        if not owner:
+            return future.result()
+
+        try:
+            value = loader()
+        except BaseException as e:
+            with self._lock:
+                self._inflight.pop(key, None)
+            future.set_exception(e)
+            raise
+
+        with self._lock:
+            if ttl > 0:
+                self._data[key] = (time.monotonic() + ttl, value)
+                self._data.move_to_end(key)
+                while len(self._data) > self.maxsize:
+                    self._data.popitem(last=False)
+            self._inflight.pop(key, None)
+        future.set_result(value)
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: float):
+        """값을 ttl초 동안 캐시"""
+        with self._lock:
+            self._data[key] = (time.monotonic() + ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def invalidate(self, key: Optional[Hashable] = None):
+        """특정 키 또는 전체 캐시 무효화"""
+        with self._lock:
+            if key is None:
+                self._data.clear()
+            else:
+                self._data.pop(key, None)
@@ -0,0 +1,52 @@
+import threading
+import time
+
+
+class TokenBucket:
+    """
+    가중치 기반 토큰 버킷 레이트 리미터
+
+    ccxt의 enableRateLimit은 요청 사이에 일정한 간격을 강제하므로
+    여러 심볼을 연달아 조회할 때 버스트 한도를 활용하지 못함.
+    토큰 버킷은 남은 가중치 안에서는 대기 없이 통과시키고,
+    버킷이 비었을 때만 필요한 만큼 대기함.
+
+    ccxt 동기 클라이언트는 asyncio.to_thread로 호출되므로 스레드 안전하게 구현.
+
+    Args:
+        capacity: 버킷 최대 토큰 수 (예: Binance Futures 분당 가중치 1200)
+        refill_per_sec: 초당 충전 토큰 수
+    """
+
+    def __init__(self, capacity: float, refill_per_sec: float):
+        self.capacity = capacity
+        self.refill_per_sec = refill_per_sec
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        """경과 시간만큼 토큰 충전"""
+        elapsed = now - self._updated
+        if elapsed > 0:
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.refill_per_sec)
+            self._updated = now
+
+    def acquire(self, cost: float = 1) -> float:
+        """
+        토큰을 소비하고, 부족하면 충전될 때까지 대기
+
+        Returns:
+            float: 대기한 시간 (초)
+        """
+        cost = min(cost, self.capacity)
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens -= cost
+            # 토큰을 먼저 차감해 대기 순서를 예약하고, 부족분만큼만 대기
+            wait = -self._tokens / self.refill_per_sec if self._tokens < 0 else 0.0
+
+        if wait > 0:
+            time.sleep(wait)
+        return wait
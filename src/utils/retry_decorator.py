@@ -1,6 +1,8 @@
 import asyncio
 import functools
 import logging
+import random
+import time
 from typing import Callable, Union, Tuple, Type
 
 from src.exceptions import NetworkException, RateLimitException
@@ -11,7 +13,9 @@ def retry_on_error(
     delay: float = 1.0,
     backoff: float = 2.0,
     exceptions: Tuple[Type[Exception], ...] = (Exception,),
-    logger: logging.Logger = None
+    logger: logging.Logger = None,
+    max_delay: float = None,
+    jitter: float = 0.0
 ) -> Callable:
     """
     에러 발생 시 재시도하는 데코레이터
@@ -22,7 +26,13 @@ def retry_on_error(
         backoff: 백오프 배수 (각 재시도마다 대기 시간이 이 배수만큼 증가)
         exceptions: 재시도할 예외 타입들
         logger: 로거 인스턴스
+        max_delay: 대기 시간 상한 (초)
+        jitter: 대기 시간에 더할 최대 랜덤 값 (초, 동시 재시도 분산용)
     """
+    def wait_for(current_delay: float) -> float:
+        wait_time = min(current_delay, max_delay) if max_delay is not None else current_delay
+        return wait_time + random.uniform(0, jitter) if jitter else wait_time
+        
     def decorator(func: Callable) -> Callable:
         @functools.wraps(func)
         async def async_wrapper(*args, **kwargs):
@@ -42,7 +52,7 @@ def retry_on_error(
                     if isinstance(e, RateLimitException) and hasattr(e, 'retry_after'):
                         wait_time = e.retry_after
                     else:
-                        wait_time = current_delay
+                        wait_time = wait_for(current_delay)
                         
                     _logger.warning(
                         f"{func.__name__} failed (attempt {attempt + 1}/{max_retries}). "
@@ -66,13 +76,12 @@ def retry_on_error(
                         _logger.error(f"{func.__name__} failed after {max_retries} attempts")
                         raise
                         
-                    wait_time = current_delay
+                    wait_time = wait_for(current_delay)
                     _logger.warning(
                         f"{func.__name__} failed (attempt {attempt + 1}/{max_retries}). "
                         f"Retrying in {wait_time}s... Error: {str(e)}"
                     )
                     
-                    import time
                     time.sleep(wait_time)
                     current_delay *= backoff
                     
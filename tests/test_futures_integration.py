@@ -10,6 +10,7 @@ from src.futures_config import FuturesConfig
 from src.exchange.binance_futures_client import BinanceFuturesClient
 from src.trading.futures_position_manager import FuturesPositionManager
 from src.trading.futures_engine import FuturesTradingEngine
+from src.monitoring.futures_monitor import FuturesMonitor
 from src.trading.futures_types import FuturesPosition, PositionSide, MarginMode
 from src.utils.risk_manager import RiskManager
 
@@ -171,6 +172,39 @@ class TestFuturesIntegration:
         assert at_risk[0]['symbol'] == 'BTC/USDT'
         assert at_risk[0]['risk_level'] in ['MEDIUM', 'HIGH']
         
+    @pytest.mark.asyncio
+    async def test_monitor_evicts_closed_position_metrics(self, position_manager, mock_futures_client):
+        """Closing a position through the manager removes its exported series"""
+        mock_futures_client.get_futures_positions = Mock(return_value=[{
+            'symbol': 'BTC/USDT',
+            'side': 'long',
+            'contracts': 0.1,
+            'entryPrice': 50000,
+            'markPrice': 51000,
+            'liquidationPrice': 45000,
+            'unrealizedPnl': 100,
+            'initialMargin': 500,
+            'leverage': 10,
+            'marginMode': 'isolated'
+        }])
+        mock_futures_client.create_futures_order = Mock(return_value={'id': '67890'})
+        prometheus_metrics = Mock()
+        monitor = FuturesMonitor(mock_futures_client, position_manager, prometheus_metrics)
+        
+        await monitor._run_position_checks()
+        assert ('BTC/USDT', 'long') in monitor._child_cache
+        
+        # close_position refreshes positions before notifying the monitor
+        mock_futures_client.get_futures_positions = Mock(return_value=[])
+        await position_manager.close_position('BTC/USDT')
+        monitor._snap = None
+        await monitor._run_position_checks()
+        
+        assert monitor._child_cache == {}
+        prometheus_metrics.futures_position_size.remove.assert_called_with('BTC/USDT', 'long')
+        prometheus_metrics.futures_position_pnl.remove.assert_called_with('BTC/USDT', 'long')
+        prometheus_metrics.futures_position_margin.remove.assert_called_with('BTC/USDT', 'long')
+        
     @pytest.mark.asyncio
     async def test_funding_rate_strategy(self, futures_engine):
         """Test funding rate arbitrage strategy"""
@@ -0,0 +1,34 @@
+"""
+Tests for logger setup
+"""
+import sys
+import os
+from logging.handlers import QueueHandler
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src import logger as logger_module
+from src.logger import setup_logger
+
+
+class TestSetupLogger:
+    """Test cases for setup_logger"""
+
+    def test_loggers_share_one_file_handler(self):
+        """Two setup_logger calls feed the same queue, listener and file handler"""
+        first = setup_logger('test_logger_first')
+        file_handler = logger_module._file_handler
+        listener = logger_module._listener
+        formatter = file_handler.formatter
+        second = setup_logger('test_logger_second')
+
+        assert logger_module._file_handler is file_handler
+        assert logger_module._listener is listener
+        assert file_handler.formatter is formatter
+        assert [h for h in listener.handlers if h is file_handler] == [file_handler]
+
+        first_handler, = first.handlers
+        second_handler, = second.handlers
+        assert isinstance(first_handler, QueueHandler)
+        assert first_handler.queue is second_handler.queue
@@ -0,0 +1,104 @@
+"""
+Tests for monitoring components
+"""
+import pytest
+import asyncio
+import json
+import sys
+import os
+from dataclasses import replace
+from datetime import datetime
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.monitoring.health_checker import HealthChecker, HealthStatus
+from src.monitoring.metrics_collector import MetricsCollector
+
+
+def make_check(name: str, calls: list, delay: float = 0.05, fail: bool = False):
+    """Create a fake health check coroutine function"""
+    async def check():
+        calls.append(name)
+        await asyncio.sleep(delay)
+        if fail:
+            raise RuntimeError(f"{name} failed")
+        return HealthStatus(
+            component=name,
+            is_healthy=True,
+            message="ok",
+            timestamp=datetime.now()
+        )
+    return check
+
+
+class TestHealthChecker:
+    """Test cases for HealthChecker"""
+
+    @pytest.mark.asyncio
+    async def test_check_all_runs_checks_concurrently(self):
+        """Checks run concurrently and failures become unhealthy statuses"""
+        calls = []
+        checker = HealthChecker()
+        checker.checks = {
+            'a': make_check('a', calls, delay=0.2),
+            'b': make_check('b', calls, delay=0.2),
+            'c': make_check('c', calls, delay=0.2, fail=True)
+        }
+
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        results = await checker.check_all()
+        elapsed = loop.time() - started
+
+        assert elapsed < 0.4
+        assert results['a'].is_healthy
+        assert results['b'].is_healthy
+        assert not results['c'].is_healthy
+
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_share_checks(self):
+        """Concurrent check_all calls issue each probe only once"""
+        calls = []
+        checker = HealthChecker()
+        checker.checks = {'a': make_check('a', calls)}
+
+        first, second = await asyncio.gather(checker.check_all(), checker.check_all())
+
+        assert calls == ['a']
+        assert first['a'] is second['a']
+
+    @pytest.mark.asyncio
+    async def test_failed_check_is_not_cached(self):
+        """A failed probe is retried on the next call"""
+        calls = []
+        checker = HealthChecker()
+        checker.checks = {'a': make_check('a', calls, fail=True)}
+
+        await checker.check_all()
+        await checker.check_all()
+
+        assert calls == ['a', 'a']
+
+
+class TestMetricsCollector:
+    """Test cases for MetricsCollector"""
+
+    @pytest.mark.asyncio
+    async def test_legacy_json_file_is_migrated(self, tmp_path):
+        """Records in an old metrics_YYYYMMDD.json array still reach the reports"""
+        empty = MetricsCollector(str(tmp_path / 'seed'))._create_empty_metrics()
+        morning = replace(empty, total_trades=2, winning_trades=1, losing_trades=1, total_pnl=5.0)
+        evening = replace(empty, total_trades=3, winning_trades=3, total_pnl=7.0)
+
+        date_str = empty.timestamp.strftime('%Y%m%d')
+        legacy_path = tmp_path / f'metrics_{date_str}.json'
+        legacy_path.write_text(json.dumps([morning.to_dict()]))
+        (tmp_path / f'metrics_{date_str}.jsonl').write_text(json.dumps(evening.to_dict()) + '\n')
+
+        collector = MetricsCollector(str(tmp_path))
+        records = collector._read_metrics(collector._metrics_file(empty.timestamp))
+
+        assert not legacy_path.exists()
+        assert [r['total_trades'] for r in records] == [2, 3]
+        assert '총 거래: 5건' in await collector.get_weekly_report()
@@ -100,6 +100,40 @@ def test_market_analyzer():
         return False
 
 
+def test_streaming_indicators_match_ta():
+    """Bar-by-bar indicator state reproduces the ta library's latest values"""
+    import ta
+    from src.recommendation._indicators import IndicatorState
+    
+    rng = np.random.default_rng(7)
+    prices = 50000 * (1 + rng.normal(0, 0.01, 300)).cumprod()
+    close = pd.Series(prices)
+    high = pd.Series(prices * (1 + rng.uniform(0, 0.005, 300)))
+    low = pd.Series(prices * (1 - rng.uniform(0, 0.005, 300)))
+    volume = pd.Series(rng.uniform(100, 1000, 300))
+    
+    state = IndicatorState()
+    for values in zip(high, low, close, volume):
+        latest = state.update(*values)
+        
+    adx = ta.trend.ADXIndicator(high, low, close, window=14)
+    atr = ta.volatility.AverageTrueRange(high, low, close, window=14).average_true_range()
+    expected = {
+        'sma_50': ta.trend.SMAIndicator(close, window=50).sma_indicator().iloc[-1],
+        'adx': adx.adx().iloc[-1],
+        'adx_pos': adx.adx_pos().iloc[-1],
+        'adx_neg': adx.adx_neg().iloc[-1],
+        'rsi': ta.momentum.RSIIndicator(close, window=14).rsi().iloc[-1],
+        'macd_diff': ta.trend.MACD(close).macd_diff().iloc[-1],
+        'atr_pct': (atr / close * 100).iloc[-1],
+        'atr_pct_mean': (atr / close * 100).rolling(window=20).mean().iloc[-1],
+        'recent_high': high.rolling(window=20).max().iloc[-2],
+    }
+    
+    for name, value in expected.items():
+        assert np.isclose(latest[name], value, rtol=1e-9), name
+
+
 def test_performance_evaluator():
     """Test performance evaluator"""
     logger.info("Testing performance evaluator...")